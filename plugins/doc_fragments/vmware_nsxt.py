@@ -111,4 +111,107 @@ options:
             - Can be used to wait for the realization of subresource before the
               request to create the next resource is sent to the Manager.
             - Can be specified for each subresource.
+    revision_conflict_retries:
+        type: int
+        default: 0
+        description:
+            - Number of times an update is retried when the Manager rejects it
+              because the resource was modified concurrently (stale
+              _revision).
+            - On each retry the resource is read again, the desired params are
+              merged with it and the update is only sent if they still differ.
+            - Can be specified for each subresource.
+    drift_snapshot:
+        type: path
+        description:
+            - Path of an export written by nsxt_policy_export. If specified,
+              the resources are read from it instead of the NSX manager and
+              nothing is changed, as in check mode.
+            - Every resource and subresource is reported with its drift,
+              missing, modified, unexpected or in_sync, and the attributes
+              that differ for the modified ones. The resources that drifted
+              are also returned as drift.
+            - The export must contain the objects the resources refer to by
+              display name.
+    """
+
+    # Options of the facts modules listing a Manager API collection
+    FACTS = """
+options:
+    filters:
+        description:
+            - Dict from an attribute of the results to its expected value, or
+              to a list of accepted values. Nested attributes are written as
+              dotted paths, e.g. attachment.attachment_type.
+            - The filters the API supports for the collection are applied by
+              the NSX manager, the other ones while the results are received.
+              A list of accepted values for a filter the API supports is
+              matched on the attribute it constrains, e.g. node_types on
+              node_deployment_info.resource_type. The filters that match no
+              attribute, e.g. node_ip or in_maintenance_mode, only accept a
+              single value.
+        required: false
+        type: dict
+    page_size:
+        description: Maximum number of results returned by the NSX manager
+                     per request.
+        required: false
+        type: int
+    max_results:
+        description: Maximum number of results returned. No further page is
+                     requested once they are found.
+        required: false
+        type: int
+    fields:
+        description: Attributes of the results to be returned, as dotted paths
+                     for the nested ones. All the attributes are returned if
+                     not specified.
+        required: false
+        type: list
+        elements: str
+    sort_by:
+        description: Attribute the NSX manager sorts the results on.
+        required: false
+        type: str
+    sort_ascending:
+        description: Whether the results are sorted in ascending order.
+                     Only used with sort_by.
+        required: false
+        type: bool
+    dest:
+        description:
+            - Path of a file on the target host the results are written to, one
+              JSON object per line, instead of being returned. The file is
+              gzip compressed if its name ends with .gz.
+            - The results are written as the pages are received, and only
+              dest, result_count, size and sha256 of the file are returned.
+            - The file is only replaced, and the task changed, if its content
+              differs. It is left as it is in check mode.
+        required: false
+        type: path
+    since:
+        description:
+            - Time, in milliseconds since epoch, from which the results were
+              modified. Only the results whose _last_modified_time is not
+              older are returned, from the most recently modified one.
+            - No page is requested once an older result is received.
+        required: false
+        type: int
+    state_file:
+        description:
+            - Path of a file on the target host keeping a snapshot of the
+              collection between runs, gzip compressed if its name ends with
+              .gz.
+            - The first run lists the whole collection. The later ones only
+              list the ids and _last_modified_time of the results, then the
+              results modified since the previous run, and update the
+              snapshot.
+            - The results created or modified since the previous run are
+              returned, with the deleted_ids and the high_water_mark, the
+              latest _last_modified_time of the collection. dest,
+              max_results, since and the sort options are not used.
+            - The task is changed if the snapshot is. It is left as it is in
+              check mode.
+        required: false
+        type: path
     """
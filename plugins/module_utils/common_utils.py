@@ -12,6 +12,15 @@
 # WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import time
+import socket
+import ssl
+import hashlib
+import gzip
+import io
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import request
 from ansible.module_utils._text import to_native
 import ipaddress
@@ -116,28 +125,295 @@ def wait_for_operation_to_execute(manager_url, endpoint, mgr_username,
     - desired_attribute_value: The desired attribute value
     
     Function will wait till the attribute value derived from going deep to attribute list
-    becomes equal to desired_attribute_value.
+    becomes equal to desired_attribute_value. The errors while polling, e.g.
+    while the manager restarts, are retried till time_out.
     '''
-    operation_time = 0
+    def is_executed():
+        (rc, resp) = request(manager_url + endpoint, headers=dict(Accept='application/json'),
+                             url_username=mgr_username, url_password=mgr_password, 
+                             validate_certs=validate_certs, ignore_errors=True)
+        retrieved_value = traverse_and_retrieve_value(resp, attribute_list)
+        if retrieved_value in undesired_attribute_values:
+            raise OperationFailed(resp)
+        return retrieved_value in desired_attribute_values
+    return wait_until(is_executed, time_out=time_out, tolerated_errors=None)
+
+OPERATION_TIMED_OUT = 'Operation timed out.'
+
+class OperationFailed(Exception):
+    '''
+    Raised by the condition of wait_until to abort the wait, e.g. once the
+    operation reached a failed state. It is never retried as a transient error.
+    '''
+    pass
+
+def wait_until(condition, time_out=300, interval=1, max_interval=10,
+               tolerated_errors=0, on_progress=None, stats=None):
+    '''
+    params:
+    - condition: Callable returning True once the awaited state is reached.
+      It raises OperationFailed to abort the wait.
+    - time_out: Deadline in seconds.
+    - interval: Seconds before the first retry, doubled after every retry up to
+      max_interval.
+    - tolerated_errors: Number of consecutive errors raised by condition that
+      are retried like an unmet condition, None to retry them till time_out.
+    - on_progress: Callable called with the seconds waited and the number of
+      polls after every unmet poll.
+    - stats: Dict filled with the number of polls, the number of errors
+      retried and the seconds waited.
+
+    Function will poll condition till it returns True and return the seconds
+    waited. Raises an exception once time_out is passed.
+    '''
+    if stats is None:
+        stats = dict()
+    stats.update(polls=0, errors=0, waited=0)
+    consecutive_errors = 0
+    start_time = time.time()
     while True:
+        stats['polls'] += 1
+        try:
+            if condition():
+                break
+            consecutive_errors = 0
+        except OperationFailed:
+            raise
+        except Exception:
+            if tolerated_errors is not None and consecutive_errors >= tolerated_errors:
+                raise
+            consecutive_errors += 1
+            stats['errors'] += 1
+        stats['waited'] = time.time() - start_time
+        if on_progress is not None:
+            on_progress(stats['waited'], stats['polls'])
+        if stats['waited'] + interval > time_out:
+            raise Exception(OPERATION_TIMED_OUT)
+        time.sleep(interval)
+        interval = min(interval * 2, max_interval)
+    stats['waited'] = time.time() - start_time
+    return stats['waited']
+
+REALIZATION_SUCCESS_STATES = ['SUCCESS']
+REALIZATION_FAILURE_STATES = ['FAILED', 'ERROR', 'ORPHANED']
+# Final states NSX reports e.g. when a host of the transport zone is
+# disconnected. The object is usable, the details say what isn't realized.
+REALIZATION_PARTIAL_STATES = ['PARTIAL_SUCCESS', 'UNKNOWN']
+
+def wait_for_realized_state(manager_url, endpoint, mgr_username, mgr_password,
+                            validate_certs, time_out=300):
+    '''
+    params:
+    - endpoint: State API endpoint of the object, e.g. /logical-switches/<id>/state.
+
+    Function will wait till the state of the object is final. An object whose
+    state can't be read is considered realized. Returns None once realized,
+    or a warning with the state and its details if it is
+    REALIZATION_PARTIAL_STATES.
+    '''
+    final_state = dict()
+
+    def is_realized():
         try:
             (rc, resp) = request(manager_url + endpoint, headers=dict(Accept='application/json'),
-                                 url_username=mgr_username, url_password=mgr_password, 
-                                 validate_certs=validate_certs, ignore_errors=True)
+                                 url_username=mgr_username, url_password=mgr_password,
+                                 validate_certs=validate_certs)
         except Exception as err:
-            pass
+            if err.args and err.args[0] == 404:
+                return True
+            raise
+        state = str(resp.get('state', '')).upper()
+        if state in REALIZATION_FAILURE_STATES:
+            raise OperationFailed('Realization failed with state %s. Details: %s' %
+                            (state, resp.get('details')))
+        if state in REALIZATION_PARTIAL_STATES:
+            final_state.update(state=state, details=resp.get('details'))
+            return True
+        return state in REALIZATION_SUCCESS_STATES
+    wait_until(is_realized, time_out=time_out)
+    if final_state:
+        return 'Realization ended with state %s. Details: %s' % (final_state['state'], final_state['details'])
+    return None
+
+IN_PROGRESS = 'in_progress'
+SUCCESS = 'success'
+FAILED = 'failed'
+TIMED_OUT = 'timed_out'
+
+def wait_for_all(get_statuses, ids, time_out=3600, interval=10, max_interval=60):
+    '''
+    params:
+    - get_statuses: Callable taking the ids still awaited and returning a dict
+      from id to SUCCESS, FAILED or IN_PROGRESS. It is called once per poll for
+      all of them, so that a single listing serves every object.
+    - ids: ids of the objects to wait for.
+
+    Function will poll till none of the objects is in progress. Returns a dict
+    from id to the final status and a dict from id to the seconds waited for
+    it. The objects still in progress after time_out are TIMED_OUT.
+    '''
+    statuses = dict((id, IN_PROGRESS) for id in ids)
+    waited = dict()
+    start_time = time.time()
+
+    def all_done():
+        pending = [id for id in ids if statuses[id] == IN_PROGRESS]
+        current_statuses = get_statuses(pending)
+        for id in pending:
+            status = current_statuses.get(id, IN_PROGRESS)
+            if status != IN_PROGRESS:
+                statuses[id] = status
+                waited[id] = time.time() - start_time
+        return all(status != IN_PROGRESS for status in statuses.values())
+
+    try:
+        wait_until(all_done, time_out=time_out, interval=interval,
+                   max_interval=max_interval)
+    except Exception as err:
+        if to_native(err) != OPERATION_TIMED_OUT:
+            raise
+        for id in ids:
+            if statuses[id] == IN_PROGRESS:
+                statuses[id] = TIMED_OUT
+                waited[id] = time.time() - start_time
+    return statuses, waited
+
+# (host, port) -> SHA-256 thumbprint of the certificate, for the module run
+_certificate_thumbprints = dict()
+
+def get_certificate_thumbprint(host, port=443, timeout=1):
+    '''
+    params:
+    - host: IPv4 or IPv6 address or name of the server.
+    result:
+    SHA-256 thumbprint, in hexadecimal, of the certificate the server presents.
+    The certificate of a server is only fetched once per module run.
+    '''
+    key = (host, port)
+    if key not in _certificate_thumbprints:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        sock = socket.create_connection((host, port), timeout=timeout)
+        try:
+            wrapped_socket = context.wrap_socket(sock, server_hostname=host)
+            try:
+                der_cert_bin = wrapped_socket.getpeercert(True)
+            finally:
+                wrapped_socket.close()
+        finally:
+            sock.close()
+        _certificate_thumbprints[key] = hashlib.sha256(der_cert_bin).hexdigest()
+    return _certificate_thumbprints[key]
+
+def get_certificate_thumbprints(hosts, port=443, timeout=1, max_workers=16):
+    '''
+    params:
+    - hosts: Servers whose certificate thumbprint is needed.
+    - max_workers: Maximum number of TLS handshakes done at the same time.
+    result:
+    A dict from host to its SHA-256 thumbprint and a dict from host to the
+    error raised while fetching it. The certificates are fetched concurrently.
+    '''
+    def fetch(host):
         try:
-            retrieved_value = traverse_and_retrieve_value(resp, attribute_list)
-            if retrieved_value in desired_attribute_values:
-                return None
-            if retrieved_value in undesired_attribute_values:
-                raise Exception(resp)
+            return host, get_certificate_thumbprint(host, port, timeout), None
         except Exception as err:
-            pass
-        time.sleep(10)
-        operation_time = operation_time + 10
-        if operation_time > time_out:
-            raise Exception('Operation timed out.')
+            return host, None, to_native(err)
+
+    thumbprints, errors = dict(), dict()
+    hosts = list(set(hosts))
+    if not hosts:
+        return thumbprints, errors
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(hosts)))
+    try:
+        for host, thumbprint, error in executor.map(fetch, hosts):
+            if error is None:
+                thumbprints[host] = thumbprint
+            else:
+                errors[host] = error
+    finally:
+        executor.shutdown()
+    return thumbprints, errors
+
+def append_json_line(path, record):
+    '''
+    Appends the record, as one JSON line, to the file at path, e.g. a timing
+    or progress log.
+    '''
+    with open(path, 'a') as log_file:
+        log_file.write(json.dumps(record, sort_keys=True) + '\n')
+
+
+# Size of the chunks files are read in
+FILE_CHUNK_SIZE = 1024 * 1024
+
+def get_file_sha256(file_path, chunk_size=FILE_CHUNK_SIZE):
+    '''
+    result:
+    The hex sha256 digest of the file, read in chunks.
+    '''
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as checked_file:
+        for chunk in iter(lambda: checked_file.read(chunk_size), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def write_file(path, write, compress=False, check_mode=False):
+    '''
+    params:
+    - path: File to write.
+    - write: Function writing the content to the text file it is passed.
+    - compress: Whether the file is gzip compressed. The gzip header has no
+      name nor time, so that the same content is written to the same bytes.
+    - check_mode: If True, path is left as it is.
+    result:
+    Dict with the size and sha256 of the file, and whether it is changed.
+    The file is replaced in one step, so that a failure leaves the previous
+    one in place, and only if its content differs.
+    '''
+    # In check mode the content is only written to compute its sha256,
+    # possibly before the directory of path exists.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=None if check_mode else os.path.dirname(os.path.abspath(path)),
+        prefix='.%s.' % os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as raw_file:
+            if compress:
+                text_file = io.TextIOWrapper(
+                    gzip.GzipFile(filename='', mode='wb', fileobj=raw_file,
+                                  mtime=0), encoding='utf-8')
+            else:
+                text_file = io.TextIOWrapper(raw_file, encoding='utf-8')
+            with text_file:
+                write(text_file)
+        sha256 = get_file_sha256(tmp_path)
+        size = os.path.getsize(tmp_path)
+        changed = not os.path.exists(path) or get_file_sha256(path) != sha256
+        if changed and not check_mode:
+            # mkstemp creates the file with mode 0600, so a replaced file
+            # keeps its mode and owner and a new one gets the umask.
+            if os.path.exists(path):
+                path_stat = os.stat(path)
+                os.chmod(tmp_path, path_stat.st_mode & 0o7777)
+                try:
+                    os.chown(tmp_path, path_stat.st_uid, path_stat.st_gid)
+                except OSError:
+                    pass
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            os.rename(tmp_path, path)
+        else:
+            os.remove(tmp_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return dict(size=size, sha256=sha256, changed=changed)
+
 
 def clean_and_get_params(args=None, extra_args_to_remove=[]):
     '''
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections import Counter
+
+# Lists of the Manager API whose order is meaningful. All the other lists
+# are compared regardless of the order of their items.
+ORDERED_LIST_KEYS = ('active_list', 'standby_list')
+
+# Lists of objects having an identity attribute. Their items are matched on
+# that attribute rather than on their position.
+IDENTITY_KEYS = {
+    'host_switches': 'host_switch_name',
+    'lags': 'name',
+    'named_teamings': 'name',
+    'transport_zone_endpoints': 'transport_zone_id',
+    'host_switch_profile_ids': 'key',
+    'switching_profile_ids': 'key',
+}
+
+# Lists NSX completes with default items, e.g. the default profiles of a
+# host switch. Only the items that are specified are compared.
+DEFAULTED_LIST_KEYS = ('host_switch_profile_ids', 'switching_profile_ids')
+
+
+def canonical(value, ordered_keys=ORDERED_LIST_KEYS, _key=None):
+    '''
+    params:
+    - value: Object to be canonicalized.
+    - ordered_keys: Keys of the lists whose order is meaningful.
+    result:
+    Hashable form of value. Two objects are equal once canonicalized if they
+    only differ by the order of their dict keys and of their unordered lists.
+    '''
+    if isinstance(value, dict):
+        return ('dict', frozenset((k, canonical(v, ordered_keys, k))
+                                  for k, v in value.items()))
+    if isinstance(value, list):
+        items = [canonical(item, ordered_keys, _key) for item in value]
+        if _key in ordered_keys:
+            return ('list', tuple(items))
+        return ('bag', frozenset(Counter(items).items()))
+    return value
+
+
+def is_equal(value1, value2, ordered_keys=ORDERED_LIST_KEYS):
+    '''
+    result:
+    True if value1 and value2 are the same object, regardless of the order of
+    their unordered lists.
+    '''
+    return canonical(value1, ordered_keys) == canonical(value2, ordered_keys)
+
+
+def contains(existing, desired, identity_keys=IDENTITY_KEYS,
+             ordered_keys=ORDERED_LIST_KEYS, ignored_keys=(), _key=None):
+    '''
+    params:
+    - existing: Object returned by NSX.
+    - desired: Object to be checked against existing.
+    - identity_keys: Dict from the key of a list of objects to the attribute
+      identifying its items.
+    - ordered_keys: Keys of the lists whose order is meaningful.
+    - ignored_keys: Keys not to be compared.
+    result:
+    True if every attribute of desired has the same value in existing.
+    Attributes that NSX doesn't return are not compared, as NSX fills
+    read-only attributes and omits write-only ones.
+    '''
+    if isinstance(desired, dict):
+        if not isinstance(existing, dict):
+            return False
+        for key, value in desired.items():
+            if key in ignored_keys or key not in existing:
+                continue
+            if not contains(existing[key], value, identity_keys, ordered_keys,
+                            ignored_keys, key):
+                return False
+        return True
+    if isinstance(desired, list):
+        if not isinstance(existing, list):
+            return False
+        if _key in identity_keys and _key in DEFAULTED_LIST_KEYS:
+            return _contains_identified_items(existing, desired, identity_keys,
+                                              ordered_keys, ignored_keys, _key)
+        if len(existing) != len(desired):
+            return False
+        if _key in identity_keys:
+            return _contains_identified_items(existing, desired, identity_keys,
+                                              ordered_keys, ignored_keys, _key)
+        if _key in ordered_keys:
+            return all(contains(existing_item, desired_item, identity_keys,
+                                ordered_keys, ignored_keys, _key)
+                       for existing_item, desired_item in zip(existing, desired))
+        return _contains_unordered_items(existing, desired, ordered_keys,
+                                         ignored_keys, _key)
+    return existing == desired
+
+
+def _contains_identified_items(existing, desired, identity_keys, ordered_keys,
+                               ignored_keys, key):
+    identity = identity_keys[key]
+    existing_items = dict((item.get(identity), item) for item in existing
+                          if isinstance(item, dict))
+    for desired_item in desired:
+        if not isinstance(desired_item, dict) or \
+                desired_item.get(identity) not in existing_items:
+            return False
+        if not contains(existing_items[desired_item[identity]], desired_item,
+                        identity_keys, ordered_keys, ignored_keys, key):
+            return False
+    return True
+
+
+def _contains_unordered_items(existing, desired, ordered_keys, ignored_keys,
+                              key):
+    # Only the attributes set on the desired items are compared, so the
+    # existing items are projected on them before being hashed.
+    compared_keys = set()
+    for desired_item in desired:
+        if isinstance(desired_item, dict):
+            compared_keys.update(k for k in desired_item
+                                 if k not in ignored_keys)
+
+    def project(item):
+        if isinstance(item, dict):
+            item = dict((k, v) for k, v in item.items() if k in compared_keys)
+        return canonical(item, ordered_keys, key)
+
+    return Counter(project(item) for item in existing) == \
+        Counter(project(item) for item in desired)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import contains
+
+def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_port_params ):
+    logical_port_params['logical_switch_id'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                                            '/logical-switches', logical_port_params.pop('logical_switch_name', None))
+    host_switch_profile_ids = []
+    host_switch_profiles = logical_port_params.pop('switching_profiles', None)
+    if host_switch_profiles:
+        for host_switch_profile in host_switch_profiles:
+            profile_obj = {}
+            profile_obj['value'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                    "/switching-profiles", host_switch_profile['name'])
+            profile_obj['key'] = host_switch_profile['type']
+            host_switch_profile_ids.append(profile_obj)
+    logical_port_params['switching_profile_ids'] = host_switch_profile_ids
+
+    if logical_port_params.__contains__('attachment') and logical_port_params['attachment'].__contains__('context') and \
+        logical_port_params['attachment']['context'].__contains__('transport_node_name'):
+        logical_port_params['attachment']['context']['transport_node_uuid'] = get_id_from_display_name(module, manager_url, mgr_username, mgr_password,
+                validate_certs, '/transport-nodes', logical_port_params['attachment']['context']['transport_node_name'])
+    return logical_port_params
+
+def logical_port_needs_update(existing_logical_port, logical_port_with_ids):
+    if existing_logical_port.__contains__('attachment') and existing_logical_port['attachment'].__contains__('attachment_type') and \
+        logical_port_with_ids.__contains__('attachment') and logical_port_with_ids['attachment'].__contains__('attachment_type') and \
+        (existing_logical_port['attachment']['attachment_type'] != logical_port_with_ids['attachment']['attachment_type'] or \
+        existing_logical_port['attachment']['id'] != logical_port_with_ids['attachment']['id']):
+        return True
+    if existing_logical_port.__contains__('switching_profile_ids') and logical_port_with_ids.__contains__('switching_profile_ids') and \
+        not contains(existing_logical_port, {'switching_profile_ids': logical_port_with_ids['switching_profile_ids']}):
+        return True
+    if existing_logical_port['admin_state'] != logical_port_with_ids['admin_state']:
+        return True
+    return False
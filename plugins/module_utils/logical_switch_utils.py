@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import contains
+
+def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_switch_params ):
+    if 'ip_pool_name' in logical_switch_params:
+        logical_switch_params['ip_pool_id'] = get_id_from_display_name (module, manager_url,
+                                                                mgr_username, mgr_password, validate_certs,
+                                                                "/pools/ip-pools", logical_switch_params.pop('ip_pool_name', None))
+    if 'mac_pool_name' in logical_switch_params and 'mac_pool_id' not in logical_switch_params:
+        logical_switch_params['mac_pool_id'] = get_id_from_display_name (module, manager_url,
+                                                                mgr_username, mgr_password, validate_certs,
+                                                                "/pools/mac-pools", logical_switch_params.pop('mac_pool_name', None))
+    if 'mac_pool_name' in logical_switch_params and 'mac_pool_id' in logical_switch_params:
+        logical_switch_params.pop('mac_pool_name', None)
+    logical_switch_params['transport_zone_id'] = get_id_from_display_name (module, manager_url,
+                                                                mgr_username, mgr_password, validate_certs,
+                                                                "/transport-zones", logical_switch_params.pop('transport_zone_name', None))
+    switch_profiles = logical_switch_params.pop('switching_profiles', None)
+
+    switch_profile_ids = []
+    for switch_profile in switch_profiles or []:
+        profile_obj = {}
+        profile_obj['value'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                "/switching-profiles", switch_profile['name'])
+        profile_obj['key'] = switch_profile['type']
+        switch_profile_ids.append(profile_obj)
+    logical_switch_params['switching_profile_ids'] = switch_profile_ids
+    return logical_switch_params
+
+def logical_switch_needs_update(existing_logical_switch, logical_switch_with_ids):
+    if existing_logical_switch.__contains__('vlan') and logical_switch_with_ids.__contains__('vlan') and \
+        existing_logical_switch['vlan'] != logical_switch_with_ids['vlan']:
+        return True
+
+    if logical_switch_with_ids.__contains__('vlan_trunk_spec') and existing_logical_switch.__contains__('vlan_trunk_spec') and \
+        existing_logical_switch['vlan_trunk_spec']['vlan_ranges'] != logical_switch_with_ids['vlan_trunk_spec']['vlan_ranges']:
+        return True
+    if existing_logical_switch.__contains__('switching_profile_ids') and logical_switch_with_ids.__contains__('switching_profile_ids') and \
+        not contains(existing_logical_switch, {'switching_profile_ids': logical_switch_with_ids['switching_profile_ids']}):
+        return True
+    if existing_logical_switch['admin_state'] != logical_switch_with_ids['admin_state']:
+        return True
+    if existing_logical_switch.__contains__('replication_mode') and logical_switch_with_ids.__contains__('replication_mode') and \
+        existing_logical_switch['replication_mode'] != logical_switch_with_ids['replication_mode']:
+        return True
+    if existing_logical_switch.__contains__('hybrid') and logical_switch_with_ids.__contains__('hybrid') and \
+        existing_logical_switch['hybrid'] != logical_switch_with_ids['hybrid']:
+        return True
+    return False
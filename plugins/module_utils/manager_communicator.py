@@ -0,0 +1,803 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import gzip
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils._text import to_native
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import (
+    request, batch_request, is_batch_request_successful, BATCH_MAX_REQUESTS)
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import write_file
+
+import six.moves.urllib.parse as urlparse
+
+# Attribute holding the time an object was last modified, in epoch ms
+LAST_MODIFIED_TIME = '_last_modified_time'
+
+# Query parameter -> dotted path of the attribute it filters on, for the
+# filters not named after the attribute
+QUERY_FILTER_ATTRIBUTES = {
+    'attachment_id': 'attachment.id',
+    'attachment_type': 'attachment.attachment_type',
+    'hostswitch_profile_type': 'resource_type',
+    'node_types': 'node_deployment_info.resource_type',
+}
+
+# Query parameters filtering on something the results don't have as an
+# attribute, e.g. node_ip, or not on all the endpoints accepting them, hence
+# only applied by the NSX manager
+QUERY_ONLY_FILTERS = ('bridge_cluster_id', 'cluster_moid', 'container_ports_only',
+                      'in_maintenance_mode', 'include_system_owned', 'node_ip',
+                      'parent_vif_id', 'switching_profile_id', 'transport_node_id',
+                      'transport_zone_id', 'uplink_teaming_policy_name')
+
+
+class ManagerCommunicator:
+
+    __instances = dict()
+
+    NULL_CURSOR_PREFIX = '0000'
+
+    @staticmethod
+    def get_instance(manager_url, mgr_username=None, mgr_password=None,
+                     validate_certs=True):
+        """
+            Returns the ManagerCommunicator associated with
+            (manager_url, mgr_username, mgr_password, validate_certs).
+            All the lookups of a module run share this instance and hence
+            its collection cache.
+        """
+        key = tuple([manager_url, mgr_username, mgr_password, validate_certs])
+        if key not in ManagerCommunicator.__instances:
+            ManagerCommunicator(key, manager_url, mgr_username, mgr_password,
+                                validate_certs)
+        return ManagerCommunicator.__instances.get(key)
+
+    def __init__(self, key, manager_url, mgr_username, mgr_password,
+                 validate_certs):
+        if key in ManagerCommunicator.__instances:
+            raise Exception("The associated ManagerCommunicator is"
+                            " already present! Please use get_instance to"
+                            " retrieve it.")
+        self.manager_url = manager_url
+        self.mgr_username = mgr_username
+        self.mgr_password = mgr_password
+        self.validate_certs = validate_certs
+
+        # endpoint -> list of all the results of the collection
+        self._collections = dict()
+        # endpoint -> {display_name: results with that display_name}
+        self._display_name_indexes = dict()
+        # filtered endpoints cached with the unfiltered collection, as their
+        # filters were rejected
+        self._unfiltered_endpoints = set()
+
+        ManagerCommunicator.__instances[key] = self
+
+    def request(self, endpoint, data=None, method='GET', headers=None,
+                ignore_errors=False, paginate=True):
+        """
+            Sends the request to manager_url + endpoint. data can either be
+            a dict or an already serialized JSON string. Any write invalidates
+            the cached collections the endpoint belongs to.
+        """
+        request_headers = dict(Accept='application/json')
+        if data is not None:
+            request_headers['Content-Type'] = 'application/json'
+            if not isinstance(data, str):
+                data = json.dumps(data)
+        if headers:
+            request_headers.update(headers)
+        if method != 'GET':
+            self.invalidate(endpoint)
+        return request(self.manager_url + endpoint, data=data,
+                       headers=request_headers, method=method,
+                       url_username=self.mgr_username,
+                       url_password=self.mgr_password,
+                       validate_certs=self.validate_certs,
+                       ignore_errors=ignore_errors, paginate=paginate)
+
+    def batch(self, sub_requests, atomic=False, continue_on_error=True,
+              chunk_size=BATCH_MAX_REQUESTS):
+        """
+            Submits the sub-requests through the Batch API. See
+            vmware_nsxt.batch_request for the format of sub_requests and of
+            the returned results.
+        """
+        for sub_request in sub_requests:
+            if sub_request['method'] != 'GET':
+                self.invalidate(sub_request['uri'])
+        return batch_request(self.manager_url, sub_requests, atomic=atomic,
+                             continue_on_error=continue_on_error,
+                             chunk_size=chunk_size,
+                             validate_certs=self.validate_certs,
+                             url_username=self.mgr_username,
+                             url_password=self.mgr_password)
+
+    def get_pages(self, endpoint, page_size=None):
+        """
+            Generator over the pages of a collection. Each page is the list of
+            results returned by one request; the next page is only requested
+            once the caller asks for it.
+        """
+        op = '&' if urlparse.urlparse(endpoint).query else '?'
+        if page_size:
+            endpoint += op + 'page_size=%s' % page_size
+            op = '&'
+        cursor = None
+        while True:
+            url = endpoint
+            if cursor:
+                url = endpoint + op + 'cursor=' + cursor
+            rc, page = self.request(url, paginate=False)
+            if rc != 200 or not isinstance(page, dict):
+                raise Exception(rc, page)
+            yield page.get('results', [])
+            cursor = page.get('cursor')
+            if not cursor or cursor.startswith(self.NULL_CURSOR_PREFIX):
+                return
+
+    def iter_results(self, endpoint, page_size=None):
+        for page in self.get_pages(endpoint, page_size):
+            for result in page:
+                yield result
+
+    def get_all_results(self, endpoint):
+        """
+            Returns all the results of the collection. The collection is
+            listed only once per module run.
+        """
+        if endpoint not in self._collections:
+            self._collections[endpoint] = list(self.iter_results(endpoint))
+        return self._collections[endpoint]
+
+    def get_from_display_name(self, endpoint, display_name, filters=None,
+                              filter_display_name=False, attributes=None):
+        """
+            Returns the first result of the collection with the given
+            display_name or None.
+            filters are query parameters the endpoint filters on, e.g.
+            dict(logical_router_id=...), so that only the matching part of
+            the collection is listed. If filter_display_name is True, the
+            endpoint also filters on display_name, unless the whole
+            collection is already cached. If the endpoint rejects the
+            filters, the unfiltered collection is scanned instead, and
+            is used for the following lookups with the same filters. Its
+            results must then have the attribute each filter constrains,
+            see QUERY_FILTER_ATTRIBUTES, with the filtered value.
+            attributes are matched on the cached collection, so that
+            lookups differing only by them share a single listing.
+        """
+        filtered_endpoint = add_query_params(endpoint, filters)
+        if filter_display_name and filtered_endpoint not in self._collections:
+            filtered_endpoint = add_query_params(
+                filtered_endpoint, dict(display_name=display_name))
+        try:
+            index = self._get_display_name_index(filtered_endpoint)
+        except Exception as err:
+            if filtered_endpoint == endpoint or not err.args or \
+                    err.args[0] != 400:
+                raise
+            self._collections[filtered_endpoint] = self.get_all_results(
+                endpoint)
+            self._unfiltered_endpoints.add(filtered_endpoint)
+            index = self._get_display_name_index(filtered_endpoint)
+        unfiltered = filtered_endpoint in self._unfiltered_endpoints
+        for result in index.get(display_name, []):
+            if unfiltered and not all(
+                    self._matches_query_filter(result, key, value)
+                    for key, value in (filters or {}).items()):
+                continue
+            if all(result.get(key) == value
+                   for key, value in (attributes or {}).items()):
+                return result
+        return None
+
+    @staticmethod
+    def _matches_query_filter(result, key, value):
+        # The query parameters accept comma separated values
+        actual = get_field(result, QUERY_FILTER_ATTRIBUTES.get(key, key))
+        if actual is None:
+            return False
+        return actual == value or \
+            str(actual) in [v.strip() for v in str(value).split(',')]
+
+    def _get_display_name_index(self, endpoint):
+        # display_name -> results with that display_name, in listing order
+        index = self._display_name_indexes.get(endpoint)
+        if index is None:
+            index = dict()
+            for result in self.get_all_results(endpoint):
+                if 'display_name' in result:
+                    index.setdefault(result['display_name'], []).append(result)
+            self._display_name_indexes[endpoint] = index
+        return index
+
+    def invalidate(self, endpoint=None):
+        """
+            Drops the cached collections related to endpoint, or all of them
+            if no endpoint is specified.
+        """
+        if endpoint is None:
+            self._collections.clear()
+            self._display_name_indexes.clear()
+            self._unfiltered_endpoints.clear()
+            return
+        path = urlparse.urlparse(endpoint).path.rstrip('/')
+        for cached_endpoint in list(self._collections):
+            cached_path = urlparse.urlparse(cached_endpoint).path.rstrip('/')
+            if path.startswith(cached_path) or cached_path.startswith(path):
+                self._collections.pop(cached_endpoint, None)
+                self._display_name_indexes.pop(cached_endpoint, None)
+                self._unfiltered_endpoints.discard(cached_endpoint)
+
+
+def add_query_params(endpoint, params):
+    """
+        Returns endpoint with the query parameters added, in a stable order so
+        that the result can be used as cache key.
+    """
+    if not params:
+        return endpoint
+    op = '&' if urlparse.urlparse(endpoint).query else '?'
+    return endpoint + op + urlparse.urlencode(sorted(params.items()))
+
+
+def get_manager_communicator(manager_url, mgr_username, mgr_password,
+                             validate_certs):
+    return ManagerCommunicator.get_instance(manager_url, mgr_username,
+                                            mgr_password, validate_certs)
+
+
+def get_all_resources(module, manager_url, mgr_username, mgr_password,
+                      validate_certs, endpoint):
+    '''
+    params:
+    - endpoint: API endpoint of the collection.
+    result:
+    All the objects of the collection, listed once per module run.
+    '''
+    communicator = get_manager_communicator(manager_url, mgr_username,
+                                            mgr_password, validate_certs)
+    try:
+        return communicator.get_all_results(endpoint)
+    except Exception as err:
+        module.fail_json(msg='Error accessing %s. Error [%s]' %
+                             (endpoint, to_native(err)))
+
+
+def get_resource_from_display_name(module, manager_url, mgr_username,
+                                   mgr_password, validate_certs, endpoint,
+                                   display_name, filters=None,
+                                   filter_display_name=False, attributes=None):
+    '''
+    params:
+    - endpoint: API endpoint of the collection.
+    - display_name: The name to be matched.
+    - filters: Query parameters the endpoint filters on server side.
+    - filter_display_name: Whether the endpoint filters on display_name.
+    - attributes: Attributes the object must have, matched on the listed
+      collection.
+    result:
+    The object of the collection with the display name provided or None.
+    '''
+    communicator = get_manager_communicator(manager_url, mgr_username,
+                                            mgr_password, validate_certs)
+    try:
+        return communicator.get_from_display_name(
+            endpoint, display_name, filters, filter_display_name, attributes)
+    except Exception as err:
+        module.fail_json(msg='Error accessing %s. Error [%s]' %
+                             (endpoint, to_native(err)))
+
+
+def get_id_from_display_name(module, manager_url, mgr_username, mgr_password,
+                             validate_certs, endpoint, display_name,
+                             exit_if_not_found=True, id_attribute='id',
+                             filters=None, filter_display_name=False,
+                             attributes=None):
+    '''
+    params:
+    - endpoint: API endpoint of the collection.
+    - display_name: The name to be matched.
+    - id_attribute: Attribute of the object holding its id.
+    - filters: Query parameters the endpoint filters on server side.
+    - filter_display_name: Whether the endpoint filters on display_name.
+    - attributes: Attributes the object must have, matched on the listed
+      collection.
+    result:
+    id of the object with the display name provided. Fails the module if no
+    such object exists unless exit_if_not_found is False.
+    '''
+    communicator = get_manager_communicator(manager_url, mgr_username,
+                                            mgr_password, validate_certs)
+    try:
+        resource = communicator.get_from_display_name(
+            endpoint, display_name, filters, filter_display_name, attributes)
+    except Exception as err:
+        module.fail_json(msg='Error accessing id for display name %s. '
+                             'Error [%s]' % (display_name, to_native(err)))
+    if resource is not None:
+        return resource[id_attribute]
+    if exit_if_not_found:
+        module.fail_json(msg='No id exist with display name %s' % display_name)
+
+
+def bulk_argument_spec():
+    return dict(
+        atomic=dict(required=False, type='bool', default=False),
+        batch_size=dict(required=False, type='int',
+                        default=BATCH_MAX_REQUESTS))
+
+
+def get_bulk_operation(endpoint, display_name, state, params, existing,
+                       needs_update):
+    '''
+    params:
+    - endpoint: API endpoint of the collection.
+    - params: Desired object, with the references already resolved to ids.
+    - existing: The object with the same display name or None.
+    - needs_update: Whether the existing object differs from params.
+    result:
+    The operation that brings the object to the desired state.
+    '''
+    operation = dict(display_name=display_name, endpoint=endpoint,
+                     action='none', uri=endpoint, method=None, body=None)
+    if existing is not None:
+        operation['id'] = existing['id']
+        operation['uri'] = '%s/%s' % (endpoint, existing['id'])
+    if state == 'absent':
+        if existing is not None:
+            operation.update(action='delete', method='DELETE')
+    elif existing is None:
+        operation.update(action='create', method='POST', body=params)
+    elif needs_update:
+        body = dict(params)
+        body['_revision'] = existing['_revision']
+        operation.update(action='update', method='PUT', body=body)
+    return operation
+
+
+def submit_bulk_operations(module, communicator, operations, resource_name):
+    '''
+    params:
+    - operations: list of dict with display_name, action ('create', 'update',
+      'delete' or 'none'), uri, method and body.
+    - resource_name: Name of the resource used in the messages.
+    result:
+    Submits the operations that change something through the Batch API and
+    exits the module with one result per operation.
+    '''
+    seen = set()
+    for operation in operations:
+        key = (operation['endpoint'], operation['display_name'])
+        if key in seen:
+            module.fail_json(msg="%s with display name %s is specified more "
+                                 "than once." % (resource_name.capitalize(),
+                                                 operation['display_name']))
+        seen.add(key)
+    pending = [operation for operation in operations
+               if operation['action'] != 'none']
+    results = []
+    for operation in operations:
+        result = dict(display_name=operation['display_name'],
+                      action=operation['action'])
+        if operation.get('id'):
+            result['id'] = operation['id']
+        results.append(result)
+    if not pending:
+        module.exit_json(changed=False, results=results,
+                         message="All the %ss are already in the desired "
+                                 "state." % resource_name)
+    if module.check_mode:
+        module.exit_json(changed=True, results=results,
+                         debug_out=str(json.dumps([dict(
+                             uri=operation['uri'],
+                             method=operation['method'],
+                             body=operation.get('body'))
+                             for operation in pending])))
+
+    try:
+        batch_results = communicator.batch(
+            pending, atomic=module.params['atomic'],
+            chunk_size=module.params['batch_size'])
+    except Exception as err:
+        module.fail_json(msg="Failed to submit the %s batch. Error[%s]." %
+                             (resource_name, to_native(err)), results=results)
+
+    result_by_operation = dict(
+        (id(operation), batch_result)
+        for operation, batch_result in zip(pending, batch_results))
+    failed = []
+    changed = False
+    for operation, result in zip(operations, results):
+        batch_result = result_by_operation.get(id(operation))
+        if batch_result is None:
+            continue
+        result['code'] = batch_result['code']
+        if is_batch_request_successful(batch_result):
+            changed = True
+            body = batch_result['body']
+            if isinstance(body, dict) and body.get('id'):
+                result['id'] = body['id']
+            continue
+        if batch_result['code'] is None:
+            result['error'] = 'Not submitted'
+        elif batch_result['rolled_back'] and batch_result['code'] < 400:
+            result['error'] = 'Rolled back'
+        else:
+            result['error'] = batch_result['body']
+        failed.append(operation['display_name'])
+
+    if failed:
+        module.fail_json(changed=changed, results=results,
+                         msg="Failed to apply the %ss with display names %s." %
+                             (resource_name, ', '.join(failed)))
+    module.exit_json(changed=True, results=results,
+                     message="%d %s operations applied." %
+                             (len(pending), resource_name))
+
+
+def facts_argument_spec():
+    return dict(
+        filters=dict(required=False, type='dict'),
+        page_size=dict(required=False, type='int'),
+        max_results=dict(required=False, type='int'),
+        fields=dict(required=False, type='list', elements='str'),
+        sort_by=dict(required=False, type='str'),
+        sort_ascending=dict(required=False, type='bool'),
+        dest=dict(required=False, type='path'),
+        since=dict(required=False, type='int'),
+        state_file=dict(required=False, type='path'))
+
+
+def get_field(result, path):
+    '''
+    result:
+    The value at the dotted path of result, e.g. 'attachment.id', or None.
+    '''
+    value = result
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def matches_filters(result, filters):
+    '''
+    params:
+    - filters: Dict from a dotted path to the expected value, or to a list of
+      accepted values.
+    result:
+    True if result has the expected values.
+    '''
+    for path, expected in filters.items():
+        value = get_field(result, path)
+        if isinstance(expected, list):
+            if value not in expected:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+def project_fields(result, fields):
+    '''
+    result:
+    Copy of result reduced to the dotted paths of fields, keeping their
+    nesting. The fields result doesn't have are omitted.
+    '''
+    projection = dict()
+    for path in fields:
+        keys = path.split('.')
+        value = get_field(result, path)
+        if value is None and get_field(result, '.'.join(keys[:-1])) is None:
+            continue
+        target = projection
+        for key in keys[:-1]:
+            target = target.setdefault(key, dict())
+        target[keys[-1]] = value
+    return projection
+
+
+def split_filters(filters, server_filters=()):
+    '''
+    result:
+    The query parameters for the filters the endpoint supports and the dict
+    of the other filters, to be applied with matches_filters. A list of
+    accepted values for a filter the endpoint supports is matched on the
+    attribute the filter constrains, see QUERY_FILTER_ATTRIBUTES, and is
+    rejected for the QUERY_ONLY_FILTERS.
+    '''
+    query = dict()
+    client_filters = dict()
+    for key, value in (filters or dict()).items():
+        if key in server_filters and not isinstance(value, (list, dict)):
+            if isinstance(value, bool):
+                value = str(value).lower()
+            query[key] = value
+        elif key in server_filters and isinstance(value, list):
+            if key in QUERY_ONLY_FILTERS:
+                raise Exception('The filter %s is only applied by the NSX '
+                                'manager and accepts a single value' % key)
+            client_filters[QUERY_FILTER_ATTRIBUTES.get(key, key)] = value
+        else:
+            client_filters[key] = value
+    return query, client_filters
+
+
+def iter_facts(communicator, endpoint, params, server_filters=()):
+    '''
+    params:
+    - endpoint: API endpoint of the collection.
+    - params: Module parameters with the options of facts_argument_spec.
+    - server_filters: Query parameters the endpoint filters on.
+    result:
+    Generator over the results of the collection. The filters the endpoint
+    supports are passed as query parameters, along with the sort options and
+    the fields to be returned; the other filters are applied while the pages
+    are received. No page is requested once max_results results are found.
+    If since is set, the results are listed from the most recently modified
+    one and no page is requested once an older one is received.
+    '''
+    fields = params.get('fields')
+    max_results = params.get('max_results')
+    since = params.get('since')
+    query, client_filters = split_filters(params.get('filters'),
+                                          server_filters)
+    if since is not None:
+        query.update(sort_by=LAST_MODIFIED_TIME, sort_ascending='false')
+    elif params.get('sort_by'):
+        query['sort_by'] = params['sort_by']
+        if params.get('sort_ascending') is not None:
+            query['sort_ascending'] = str(params['sort_ascending']).lower()
+    if fields:
+        # The client side filters need their attributes to be returned too.
+        included_fields = set(path.split('.')[0]
+                              for path in list(fields) + list(client_filters))
+        if since is not None:
+            included_fields.add(LAST_MODIFIED_TIME)
+        query['included_fields'] = ','.join(sorted(included_fields))
+
+    if max_results is not None and max_results <= 0:
+        return
+    count = 0
+    for result in communicator.iter_results(add_query_params(endpoint, query),
+                                            params.get('page_size')):
+        if since is not None and \
+                result.get(LAST_MODIFIED_TIME, since) < since:
+            return
+        if not matches_filters(result, client_filters):
+            continue
+        yield project_fields(result, fields) if fields else result
+        count += 1
+        if max_results and count >= max_results:
+            return
+
+
+def write_facts(path, results, check_mode=False):
+    '''
+    params:
+    - path: File the results are written to, one JSON object per line. The
+      file is gzip compressed if its name ends with .gz.
+    - results: Iterable over the results, consumed as they are written.
+    - check_mode: If True, the file is left as it is.
+    result:
+    Dict with dest, result_count, size and sha256 of the file, and whether it
+    is changed, as written by write_file.
+    '''
+    written = dict(count=0)
+
+    def write_results(facts_file):
+        for result in results:
+            facts_file.write(json.dumps(result, sort_keys=True) + '\n')
+            written['count'] += 1
+
+    summary = write_file(path, write_results, compress=path.endswith('.gz'),
+                         check_mode=check_mode)
+    return dict(summary, dest=path, result_count=written['count'])
+
+
+def get_facts(communicator, endpoint, params, server_filters=(),
+              check_mode=False):
+    '''
+    result:
+    Dict with the results of the collection, as listed by iter_facts, and
+    result_count. If params has a dest, the results are written to it with
+    write_facts instead and only its summary is returned, changed if the file
+    is. If params has a state_file, only the changes since the previous run
+    are returned, by get_incremental_facts.
+    '''
+    if params.get('state_file'):
+        return get_incremental_facts(communicator, endpoint, params,
+                                     server_filters, check_mode)
+    results = iter_facts(communicator, endpoint, params, server_filters)
+    if params.get('dest'):
+        return write_facts(params['dest'], results, check_mode)
+    results = list(results)
+    return dict(results=results, result_count=len(results), changed=False)
+
+
+def load_facts_snapshot(path):
+    '''
+    result:
+    The snapshot stored at path by save_facts_snapshot, or None if there is
+    none.
+    '''
+    if not os.path.exists(path):
+        return None
+    if path.endswith('.gz'):
+        snapshot_file = gzip.open(path, 'rt', encoding='utf-8')
+    else:
+        snapshot_file = io.open(path, 'r', encoding='utf-8')
+    with snapshot_file:
+        return json.load(snapshot_file)
+
+
+def save_facts_snapshot(path, snapshot):
+    '''
+    Writes snapshot to path with write_file, gzip compressed if its name ends
+    with .gz.
+    '''
+    write_file(path, lambda snapshot_file: json.dump(snapshot, snapshot_file,
+                                                     sort_keys=True),
+               compress=path.endswith('.gz'))
+
+
+def get_incremental_facts(communicator, endpoint, params, server_filters=(),
+                          check_mode=False):
+    '''
+    params:
+    - params: Module parameters with the options of facts_argument_spec,
+      state_file being set.
+    - check_mode: If True, state_file is left as it is.
+    result:
+    Dict with the results created or modified since the previous run, the
+    deleted_ids, the result_count of the whole collection and its
+    high_water_mark, the latest _last_modified_time seen. It is changed if
+    the snapshot in state_file is, i.e. on the first run or if any result
+    was created, modified or deleted.
+
+    The first run lists the whole collection and stores it in state_file.
+    The later ones list the ids and _last_modified_time of the collection,
+    then the modified results from the most recently modified one, until
+    they are all found or one older than high_water_mark is received. The
+    snapshot is reset if the filters the endpoint supports change.
+    '''
+    query, client_filters = split_filters(params.get('filters'),
+                                          server_filters)
+    filtered_endpoint = add_query_params(endpoint, query)
+    page_size = params.get('page_size')
+    snapshot = load_facts_snapshot(params['state_file'])
+    full_listing = snapshot is None or \
+        snapshot.get('endpoint') != filtered_endpoint
+    changed_ids = set()
+    deleted = []
+    if full_listing:
+        objects = dict()
+        for result in communicator.iter_results(filtered_endpoint, page_size):
+            objects[result['id']] = result
+        changed_ids.update(objects)
+        high_water_mark = None
+    else:
+        objects = snapshot['objects']
+        high_water_mark = snapshot.get('high_water_mark')
+        modified_times = dict()
+        for result in communicator.iter_results(add_query_params(
+                filtered_endpoint, dict(included_fields='id,%s' %
+                                        LAST_MODIFIED_TIME)), page_size):
+            modified_times[result['id']] = result.get(LAST_MODIFIED_TIME)
+        for id in list(objects):
+            if id not in modified_times:
+                deleted.append(objects.pop(id))
+        changed_ids.update(
+            id for id, modified_time in modified_times.items()
+            if id not in objects or
+            objects[id].get(LAST_MODIFIED_TIME) != modified_time)
+        pending = set(changed_ids)
+        if pending:
+            for result in communicator.iter_results(add_query_params(
+                    filtered_endpoint, dict(sort_by=LAST_MODIFIED_TIME,
+                                            sort_ascending='false')),
+                    page_size):
+                if result['id'] in pending:
+                    objects[result['id']] = result
+                    pending.discard(result['id'])
+                modified_time = result.get(LAST_MODIFIED_TIME)
+                if not pending or (high_water_mark is not None and
+                                   modified_time is not None and
+                                   modified_time < high_water_mark):
+                    break
+        # Results the sorted listing didn't reach, e.g. restored with an
+        # older _last_modified_time, are read one by one.
+        path = urlparse.urlparse(endpoint).path.rstrip('/')
+        for id in pending:
+            try:
+                rc, objects[id] = communicator.request(
+                    '%s/%s' % (path, id), paginate=False)
+            except Exception as err:
+                if len(err.args) < 2 or not isinstance(err.args[1], dict) \
+                        or err.args[1].get('httpStatus') != 'NOT_FOUND':
+                    raise
+                changed_ids.discard(id)
+                deleted.append(objects.pop(id, dict(id=id)))
+
+    modified_times = [result[LAST_MODIFIED_TIME]
+                      for result in objects.values()
+                      if result.get(LAST_MODIFIED_TIME) is not None]
+    if modified_times:
+        high_water_mark = max(modified_times)
+    changed = full_listing or bool(changed_ids) or bool(deleted)
+    if changed and not check_mode:
+        save_facts_snapshot(params['state_file'], dict(
+            endpoint=filtered_endpoint, high_water_mark=high_water_mark,
+            objects=objects))
+
+    fields = params.get('fields')
+    results = [project_fields(objects[id], fields) if fields else objects[id]
+               for id in sorted(changed_ids)
+               if matches_filters(objects[id], client_filters)]
+    return dict(results=results,
+                deleted_ids=sorted(result['id'] for result in deleted
+                                   if matches_filters(result, client_filters)),
+                result_count=sum(1 for result in objects.values()
+                                 if matches_filters(result, client_filters)),
+                high_water_mark=high_water_mark, full_listing=full_listing,
+                changed=changed)
+
+
+def get_facts_concurrently(collections, max_workers=4, check_mode=False):
+    '''
+    params:
+    - collections: list of dict with the name of the collection, the
+      communicator and endpoint it is listed with and the params of get_facts.
+    - max_workers: Maximum number of collections listed at the same time.
+    - check_mode: If True, no dest file is written.
+    result:
+    A dict from the name of each collection to what get_facts returned for
+    it, with the seconds the listing took as elapsed, or to its error.
+    '''
+    def list_collection(collection):
+        start_time = time.time()
+        try:
+            facts = get_facts(collection['communicator'],
+                              collection['endpoint'], collection['params'],
+                              collection.get('server_filters', ()),
+                              check_mode)
+        except Exception as err:
+            facts = dict(error=to_native(err))
+        facts.update(endpoint=collection['endpoint'],
+                     elapsed=round(time.time() - start_time, 3))
+        return collection['name'], facts
+
+    if not collections:
+        return dict()
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(collections)))
+    try:
+        return dict(executor.map(list_collection, collections))
+    finally:
+        executor.shutdown()
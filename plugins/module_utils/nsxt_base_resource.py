@@ -21,6 +21,7 @@
 
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.policy_communicator import PolicyCommunicator
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.policy_communicator import DuplicateRequestError
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.policy_export_utils import load_export, index_by_path
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
@@ -33,6 +34,7 @@ from abc import ABC, abstractmethod
 
 import time
 import json
+import copy
 
 import inspect
 # Add all the base resources that can be configured in the
@@ -42,11 +44,34 @@ BASE_RESOURCES = {"NSXTSegment", "NSXTTier0", "NSXTTier1",
                   "NSXTIpBlock", "NSXTIpPool", "NSXTBFDProfile",
                   "NSXTGatewayPolicy", "NSXTL2BridgeEpProfile"}
 
+# drift_snapshot -> (path -> object, path -> objects directly under it), so
+# that the snapshot is only loaded once per module run
+_drift_snapshots = {}
+
+
+def get_drift_snapshot(path):
+    """
+        Returns the objects of the export written by nsxt_policy_export at
+        path, indexed by their path and by the path they are under.
+    """
+    if path not in _drift_snapshots:
+        objects = index_by_path(load_export(path))
+        children = {}
+        for object_path, policy_object in objects.items():
+            children.setdefault(object_path.rsplit('/', 1)[0], []).append(
+                policy_object)
+        _drift_snapshots[path] = (objects, children)
+    return _drift_snapshots[path]
+
 
 class NSXTBaseRealizableResource(ABC):
 
     INCORRECT_ARGUMENT_NAME_VALUE = "error_invalid_parameter"
 
+    # HTTP status and NSX error code returned when a PATCH carries a stale
+    # _revision because the resource was modified by another client.
+    REVISION_CONFLICT_ERROR_CODES = {412, 604}
+
     def realize(self, supports_check_mode=True,
                 successful_resource_exec_logs=[],
                 baseline_arg_names=[], resource_params=None):
@@ -67,6 +92,18 @@ class NSXTBaseRealizableResource(ABC):
 
             self.set_baseline_args(baseline_arg_names)
 
+        # In drift mode the resources are read from the snapshot and nothing
+        # is changed on the Manager.
+        self.drift_snapshot = self.module.params.get('drift_snapshot')
+        if self.drift_snapshot:
+            try:
+                get_drift_snapshot(self.drift_snapshot)
+            except Exception as err:
+                self.module.fail_json(
+                    msg="Failed to load the drift snapshot %s. Error[%s]." %
+                        (self.drift_snapshot, to_native(err)))
+            self.module.check_mode = True
+
         # Infer manager credentials
         mgr_hostname = self.module.params['hostname']
         mgr_username = self.module.params['username']
@@ -113,6 +150,10 @@ class NSXTBaseRealizableResource(ABC):
         # Extract the resource params from module
         self.nsx_resource_params = self._extract_nsx_resource_params(
             resource_params)
+        # Keep the params as specified by the user so that they can be
+        # merged again with a fresh copy of the resource on a conflict
+        self._requested_nsx_resource_params = copy.deepcopy(
+            self.nsx_resource_params)
 
         # parent_info is passed to subresources of a resource automatically
         if not hasattr(self, "_parent_info"):
@@ -124,8 +165,9 @@ class NSXTBaseRealizableResource(ABC):
             _, self.existing_resource = self._send_request_to_API(
                 suffix="/" + self.id, ignore_error=False,
                 accepted_error_codes=set([404]))
-            self.existing_resource_revision = self.existing_resource[
-                '_revision']
+            # The exports don't keep the _revision
+            self.existing_resource_revision = self.existing_resource.get(
+                '_revision')
             # As Policy API's PATCH requires all attributes to be filled,
             # we fill the missing resource params (the params not specified)
             # by user using the existing params
@@ -196,6 +238,11 @@ class NSXTBaseRealizableResource(ABC):
         # updated before its subresource is to be realized.
         return self.resource_params.get("do_wait_till_create", False)
 
+    def get_revision_conflict_retries(self):
+        # By default, an update rejected because of a stale _revision is not
+        # retried.
+        return self.resource_params.get("revision_conflict_retries") or 0
+
     @staticmethod
     def get_resource_update_priority():
         # this priority can be used to create/delete subresources
@@ -443,6 +490,7 @@ class NSXTBaseRealizableResource(ABC):
             # Update it with VMware arg spec
             self._arg_spec.update(
                 PolicyCommunicator.get_vmware_argument_spec())
+            self._arg_spec.update(drift_snapshot=dict(type='path'))
 
             # ... then update it with top most resource spec ...
             self._update_arg_spec_with_resource(
@@ -542,6 +590,10 @@ class NSXTBaseRealizableResource(ABC):
             do_wait_till_create=dict(
                 default=False,
                 type='bool'
+            ),
+            revision_conflict_retries=dict(
+                default=0,
+                type='int'
             )
         )
         return resource_base_arg_spec
@@ -564,6 +616,10 @@ class NSXTBaseRealizableResource(ABC):
         self.update_resource_params(self.nsx_resource_params)
         is_resource_updated = self.check_for_update(
             self.existing_resource, self.nsx_resource_params)
+        if getattr(self, 'drift_snapshot', None):
+            self._report_drift(successful_resource_exec_logs,
+                               is_resource_updated)
+            return
         if not is_resource_updated:
             # Either the resource does not exist or it exists but was not
             # updated in the YAML.
@@ -620,46 +676,137 @@ class NSXTBaseRealizableResource(ABC):
                     "resource_type": self.get_resource_name()
                 })
                 return
-            self.nsx_resource_params['_revision'] = \
-                self.existing_resource['_revision']
-            try:
-                _, patch_resp = self._send_request_to_API(
-                    suffix="/"+self.id, method="PATCH",
-                    data=self.nsx_resource_params)
-                # Get the resource again and compare version numbers
-                _, updated_resource_spec = self._send_request_to_API(
-                    suffix="/"+self.id, method="GET")
-                if updated_resource_spec[
-                        '_revision'] != self.existing_resource_revision:
-                    successful_resource_exec_logs.append({
-                        "changed": True,
-                        "id": self.id,
-                        "body": str(patch_resp),
-                        "message": "%s with id %s updated." %
-                        (self.get_resource_name(), self.id),
-                        "resource_type": self.get_resource_name()
-                    })
-                else:
-                    successful_resource_exec_logs.append({
-                        "changed": False,
-                        "id": self.id,
-                        "message": "%s with id %s already exists." %
-                        (self.get_resource_name(), self.id),
-                        "resource_type": self.get_resource_name()
-                    })
-            except Exception as err:
-                srel = successful_resource_exec_logs
-                self.module.fail_json(msg="Failed to update %s with id %s."
-                                          "Request body [%s]. Error[%s]." %
-                                          (self.get_resource_name(), self.id,
-                                           self.nsx_resource_params, to_native(
-                                               err)
-                                           ),
-                                      successfully_updated_resources=srel)
+            retries_left = self.get_revision_conflict_retries()
+            while True:
+                self.nsx_resource_params['_revision'] = \
+                    self.existing_resource['_revision']
+                accepted_error_codes = set()
+                if retries_left > 0:
+                    accepted_error_codes = self.REVISION_CONFLICT_ERROR_CODES
+                try:
+                    _, patch_resp = self._send_request_to_API(
+                        suffix="/"+self.id, method="PATCH",
+                        data=self.nsx_resource_params,
+                        accepted_error_codes=accepted_error_codes)
+                    # Get the resource again and compare version numbers
+                    _, updated_resource_spec = self._send_request_to_API(
+                        suffix="/"+self.id, method="GET")
+                    if updated_resource_spec[
+                            '_revision'] != self.existing_resource_revision:
+                        successful_resource_exec_logs.append({
+                            "changed": True,
+                            "id": self.id,
+                            "body": str(patch_resp),
+                            "message": "%s with id %s updated." %
+                            (self.get_resource_name(), self.id),
+                            "resource_type": self.get_resource_name()
+                        })
+                    else:
+                        successful_resource_exec_logs.append({
+                            "changed": False,
+                            "id": self.id,
+                            "message": "%s with id %s already exists." %
+                            (self.get_resource_name(), self.id),
+                            "resource_type": self.get_resource_name()
+                        })
+                    return
+                except Exception as err:
+                    if retries_left > 0 and self._is_revision_conflict(err):
+                        retries_left -= 1
+                        try:
+                            is_resource_updated = (
+                                self._reload_existing_resource())
+                        except Exception as reload_err:
+                            err = reload_err
+                        else:
+                            if is_resource_updated:
+                                continue
+                            # The concurrent change already brought the
+                            # resource to the desired state.
+                            successful_resource_exec_logs.append({
+                                "changed": False,
+                                "id": self.id,
+                                "message": "%s with id %s already exists." %
+                                (self.get_resource_name(), self.id),
+                                "resource_type": self.get_resource_name()
+                            })
+                            return
+                    srel = successful_resource_exec_logs
+                    self.module.fail_json(
+                        msg="Failed to update %s with id %s."
+                            "Request body [%s]. Error[%s]." %
+                            (self.get_resource_name(), self.id,
+                             self.nsx_resource_params, to_native(err)),
+                        successfully_updated_resources=srel)
+                    return
+
+    def _report_drift(self, successful_resource_exec_logs,
+                      is_resource_updated=False):
+        """
+            Logs how the resource in the drift snapshot differs from the
+            desired state: missing, modified (with the differing
+            attributes), unexpected (present while it should be absent) or
+            in_sync.
+        """
+        differences = []
+        if self._state == 'absent':
+            drift = 'unexpected' if self.existing_resource else 'in_sync'
+        elif self.existing_resource is None:
+            drift = 'missing'
+        elif is_resource_updated:
+            drift = 'modified'
+            # The comparison of the resource, which may override it, is
+            # applied to every attribute on its own.
+            differences = sorted(
+                key for key, value in self.nsx_resource_params.items()
+                if self.check_for_update(self.existing_resource,
+                                         {key: value}))
+        else:
+            drift = 'in_sync'
+        drift_log = {
+            "changed": drift != 'in_sync',
+            "id": self.id,
+            "drift": drift,
+            "message": "%s with id %s is %s." %
+            (self.get_resource_name(), self.id, drift.replace('_', ' ')),
+            "resource_type": self.get_resource_name()
+        }
+        if differences:
+            drift_log["differences"] = differences
+        successful_resource_exec_logs.append(drift_log)
+
+    def _is_revision_conflict(self, err):
+        return (len(err.args) > 0 and
+                err.args[0] in self.REVISION_CONFLICT_ERROR_CODES)
+
+    def _reload_existing_resource(self):
+        """
+            Reads the resource again from the Manager after a revision
+            conflict, merges the user specified params with it and returns
+            True if an update is still required.
+        """
+        _, self.existing_resource = self._send_request_to_API(
+            suffix="/" + self.id, method="GET")
+        self.existing_resource_revision = self.existing_resource['_revision']
+        requested_params = getattr(self, '_requested_nsx_resource_params',
+                                   None)
+        if requested_params is not None:
+            self.nsx_resource_params = copy.deepcopy(requested_params)
+        self.nsx_resource_params.pop('_revision', None)
+        self._fill_missing_resource_params(
+            self.existing_resource, self.nsx_resource_params)
+        self._clean_none_resource_params(
+            self.existing_resource, self.nsx_resource_params)
+        self.update_resource_params(self.nsx_resource_params)
+        return self.check_for_update(
+            self.existing_resource, self.nsx_resource_params)
 
     def _achieve_absent_state(self, successful_resource_exec_logs):
         if self.skip_delete():
             return
+        if getattr(self, 'drift_snapshot', None):
+            self._report_drift(successful_resource_exec_logs)
+            return
 
         if self.existing_resource is None:
             successful_resource_exec_logs.append({
@@ -707,6 +854,9 @@ class NSXTBaseRealizableResource(ABC):
                     resource_base_url = (self.resource_class.
                                          get_resource_base_url(
                                              baseline_args=self.baseline_args))
+            if getattr(self, 'drift_snapshot', None):
+                return self._read_drift_snapshot(resource_base_url + suffix,
+                                                 method, suffix)
             if not suffix:
                 rc, resp = self.policy_communicator.get_all_results(
                     resource_base_url, ignore_errors=ignore_error)
@@ -729,6 +879,18 @@ class NSXTBaseRealizableResource(ABC):
                 self.module.fail_json(msg=msg)
             raise e
 
+    def _read_drift_snapshot(self, url, method, suffix):
+        # Serves the reads from the drift snapshot as the Manager would
+        if method != 'GET':
+            raise Exception(405, "Only reads are served in drift mode")
+        objects, children = get_drift_snapshot(self.drift_snapshot)
+        path = url.split('?', 1)[0].rstrip('/')
+        if not suffix:
+            return 200, copy.deepcopy(children.get(path, []))
+        if path not in objects:
+            raise Exception(404, "%s is not in the drift snapshot" % path)
+        return 200, copy.deepcopy(objects[path])
+
     def get_all_resources_from_nsx(self):
         rc, resp = self._send_request_to_API()
         if rc != 200:
@@ -777,8 +939,14 @@ class NSXTBaseRealizableResource(ABC):
                     changed = True
                     break
             srel = successful_resource_exec_logs
-            self.module.exit_json(changed=changed,
-                                  successfully_updated_resources=srel)
+            if getattr(self, 'drift_snapshot', None):
+                self.module.exit_json(
+                    changed=changed, successfully_updated_resources=srel,
+                    drift=[log for log in srel
+                           if log.get("drift", "in_sync") != "in_sync"])
+            else:
+                self.module.exit_json(changed=changed,
+                                      successfully_updated_resources=srel)
 
     def _get_sub_resources_class_of(self, resource_class):
         subresources = []
@@ -66,3 +66,5 @@ VM_UPDATE_URL = '/virtual-machines'
 BFD_PROFILE_URL = '/infra/bfd-profiles'
 
 GATEWAY_POLICY_URL = _DOMAIN_URL + '/{}/gateway-policies'
+
+INFRA_URL = '/infra'
@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import os
+import re
+import subprocess
+import tarfile
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+
+# Make ovftool report its progress line by line, in a parsable form
+OVFTOOL_PROGRESS_OPTIONS = ['--X:logToConsole', '--machineOutput']
+
+# Options of nsxt_deploy_ova that are set all together or not at all
+OVA_REQUIRED_TOGETHER = [['gateway6_0', 'ip_address6_0', 'netmask6_0'], ['portgroup_ext', 'portgroup_transport']]
+
+# Deployment phases, in the order ovftool goes through them
+PHASES = ('validation', 'disk_upload', 'power_on')
+
+
+def ova_argument_spec():
+    return dict(
+        ovftool_path=dict(type='str'),
+        folder=dict(required=False, type='str'),
+        datacenter=dict(required=True, type='str'),
+        datastore=dict(required=True, type='str'),
+        portgroup=dict(required=True, type='str'),
+        portgroup_ext=dict(type='str'),
+        portgroup_transport=dict(type='str'),
+        cluster=dict(required=True, type='str'),
+        vmname=dict(required=True, type='str'),
+        hostname=dict(required=True, type='str'),
+        dns_server=dict(required=True, type='str'),
+        ntp_server=dict(required=True, type='str'),
+        dns_domain=dict(required=True, type='str'),
+        gateway=dict(required=True, type='str'),
+        gateway6_0=dict(type='str'),
+        ip_address=dict(required=True, type='str'),
+        ip_address6_0=dict(type='str'),
+        netmask=dict(required=True, type='str'),
+        netmask6_0=dict(type='str'),
+        admin_password=dict(required=True, type='str', no_log=True),
+        cli_password=dict(required=True, type='str', no_log=True),
+        ssh_enabled=dict(default=False),
+        allow_ssh_root_login=dict(default=False),
+        deployment_size=dict(default='medium', type='str'),
+        path_to_ova=dict(required=True, type='str'),
+        ova_file=dict(required=True, type='str'),
+        disk_mode=dict(default='thin'),
+        vcenter=dict(required=True, type='str'),
+        vcenter_user=dict(required=True, type='str'),
+        vcenter_passwd=dict(required=True, type='str', no_log=True),
+        extra_para=dict(type='str'),
+        role=dict(required=True, type='str'),
+        ip_protocol=dict(required=False, type='str'),
+        timing_log=dict(required=False, type='str')
+    )
+
+
+def get_ova_source(params):
+    return '{}/{}'.format(params['path_to_ova'], params['ova_file'])
+
+
+def get_ovftool_command(params):
+    '''
+    params:
+    - params: Options of nsxt_deploy_ova for the appliance to deploy.
+    result:
+    ovftool command line deploying the appliance.
+    '''
+    ovftool_exec = '{}/ovftool'.format(params['ovftool_path'])
+    ovf_command = [ovftool_exec]
+
+    ovf_base_options = OVFTOOL_PROGRESS_OPTIONS + ['--acceptAllEulas', '--skipManifestCheck', '--X:injectOvfEnv',
+                                                   '--powerOn', '--noSSLVerify',
+                                                   '--allowExtraConfig', '--diskMode={}'.format(params['disk_mode']),
+                                                   '--datastore={}'.format(params['datastore']),
+                                                   '--name={}'.format(params['vmname'])
+                                                   ]
+
+    if params['ip_protocol']:
+        ovf_base_options.extend(['--ipProtocol={}'.format(params['ip_protocol'])])
+
+    if params['portgroup_ext']:
+        ovf_base_options.extend(['--net:Network 0={}'.format(params['portgroup']),
+                                 '--net:Network 1={}'.format(params['portgroup_ext']),
+                                 '--net:Network 2={}'.format(params['portgroup_transport']),
+                                 '--net:Network 3={}'.format(params['portgroup'])])
+    else:
+        ovf_base_options.extend(['--network={}'.format(params['portgroup'])])
+    ovf_command.extend(ovf_base_options)
+
+    ovf_deployement_size = ['--deploymentOption={}'.format(params['deployment_size'])]
+    ovf_command.extend(ovf_deployement_size)
+
+    ovf_ext_prop = ['--prop:nsx_hostname={}'.format(params['hostname']),
+                    '--prop:nsx_dns1_0={}'.format(params['dns_server']),
+                    '--prop:nsx_domain_0={}'.format(params['dns_domain']),
+                    '--prop:nsx_ntp_0={}'.format(params['ntp_server']),
+                    '--prop:nsx_gateway_0={}'.format(params['gateway']),
+                    '--prop:nsx_ip_0={}'.format(params['ip_address']),
+                    '--prop:nsx_netmask_0={}'.format(params['netmask']),
+                    '--prop:nsx_passwd_0={}'.format(params['admin_password']),
+                    '--prop:nsx_cli_passwd_0={}'.format(params['cli_password']),
+                    '--prop:nsx_isSSHEnabled={}'.format(params['ssh_enabled']),
+                    '--prop:nsx_allowSSHRootLogin={}'.format(params['allow_ssh_root_login']),
+                    '--prop:nsx_role={}'.format(params['role'])]
+    ovf_command.extend(ovf_ext_prop)
+
+    if params['extra_para']:
+        ovf_command.extend(['--prop:extraPara={}'.format(params['extra_para'])])
+
+    if params['gateway6_0']:
+        ovf_command.extend(['--prop:nsx_gateway6_0={}'.format(params['gateway6_0'])])
+
+    if params['ip_address6_0']:
+        ovf_command.extend(['--prop:nsx_ip6_0={}'.format(params['ip_address6_0'])])
+
+    if params['netmask6_0']:
+        ovf_command.extend(['--prop:nsx_netmask6_0={}'.format(params['netmask6_0'])])
+
+    ovf_command.append(get_ova_source(params))
+
+    vi_string = 'vi://{}:{}@{}/'.format(params['vcenter_user'],
+                                        params['vcenter_passwd'], params['vcenter'])
+    if params.__contains__('folder') and params['folder']:
+        vi_string = vi_string + params['folder']
+
+    vi_string = vi_string + '/{}/host/{}/'.format(params['datacenter'], params['cluster'])
+
+    ovf_command.append(vi_string)
+    return ovf_command
+
+
+class OvftoolProgress:
+    """
+        Follows the output of an ovftool deployment, line by line, and times
+        its phases: validation of the source and of the target, upload of
+        the disks and power on of the VM.
+    """
+
+    PROGRESS_PATTERN = re.compile(r'progress\D*(\d+)\s*%', re.IGNORECASE)
+    UPLOAD_START_MESSAGES = ('deploying to vi', 'disk transfer', 'transfer started')
+    UPLOAD_END_MESSAGES = ('transfer completed',)
+    POWER_ON_MESSAGES = ('powering on vm',)
+    END_MESSAGES = ('completed successfully', 'task completed')
+
+    def __init__(self, start_time=None):
+        self.start_time = time.time() if start_time is None else start_time
+        # phase -> (start time, end time)
+        self.phases = dict(validation=[self.start_time, None])
+        self.progress = 0
+        self._expect_progress = False
+
+    def feed(self, line, now=None):
+        now = time.time() if now is None else now
+        # Machine output lines are prefixed with '+ ', the log lines aren't
+        text = line.strip().lstrip('+-').strip()
+        lowered = text.lower()
+        progress = None
+        if self._expect_progress and text.isdigit():
+            progress = int(text)
+        self._expect_progress = lowered == 'progress'
+        match = self.PROGRESS_PATTERN.search(text)
+        if match:
+            progress = int(match.group(1))
+
+        if progress is not None or any(message in lowered for message in self.UPLOAD_START_MESSAGES):
+            self._start('disk_upload', now)
+        if progress is not None:
+            self.progress = max(self.progress, progress)
+        if (progress is not None and progress >= 100) or \
+                any(message in lowered for message in self.UPLOAD_END_MESSAGES):
+            self._end('disk_upload', now)
+        if any(message in lowered for message in self.POWER_ON_MESSAGES):
+            self._start('power_on', now)
+        if any(message in lowered for message in self.END_MESSAGES):
+            self._end('power_on', now)
+
+    def _start(self, phase, now):
+        if phase in self.phases:
+            return
+        # Starting a phase ends the previous ones
+        for previous_phase in PHASES[:PHASES.index(phase)]:
+            self._end(previous_phase, now)
+        self.phases[phase] = [now, None]
+
+    def _end(self, phase, now):
+        if phase in self.phases and self.phases[phase][1] is None:
+            self.phases[phase][1] = now
+
+    def get_timings(self, source_size=None, end_time=None):
+        """
+            Returns the seconds spent in each phase, the total and, if the
+            size of the source is known, the upload throughput.
+        """
+        end_time = time.time() if end_time is None else end_time
+        timings = dict(progress=self.progress,
+                       total=round(end_time - self.start_time, 1))
+        for phase in PHASES:
+            if phase in self.phases:
+                start, end = self.phases[phase]
+                timings[phase] = round((end_time if end is None else end) - start, 1)
+        timings['bytes'] = source_size
+        timings['bytes_per_second'] = None
+        if source_size and timings.get('disk_upload'):
+            timings['bytes_per_second'] = int(source_size / timings['disk_upload'])
+        return timings
+
+
+def get_source_size(source):
+    '''
+    params:
+    - source: Path of the OVA or OVF file.
+    result:
+    Size in bytes of the files the OVF references, i.e. of the uploaded disks,
+    or None if the source is not a local file.
+    '''
+    if not os.path.isfile(source):
+        return None
+    try:
+        if tarfile.is_tarfile(source):
+            with tarfile.open(source) as ova:
+                for member in ova.getmembers():
+                    if member.name.endswith('.ovf'):
+                        return _get_referenced_size(ova.extractfile(member).read())
+            return os.path.getsize(source)
+        with open(source, 'rb') as ovf:
+            return _get_referenced_size(ovf.read())
+    except (IOError, OSError, tarfile.TarError, ElementTree.ParseError):
+        return None
+
+
+def _get_referenced_size(ovf_descriptor):
+    size = 0
+    for element in ElementTree.fromstring(ovf_descriptor).iter():
+        if element.tag.endswith('}File') or element.tag == 'File':
+            for attribute, value in element.attrib.items():
+                if attribute.endswith('}size') or attribute == 'size':
+                    size += int(value)
+    return size or None
+
+
+def run_ovftool(ovf_command, timeout=None, output_lines=20, source_size=None):
+    '''
+    params:
+    - ovf_command: ovftool command line.
+    - timeout: Seconds after which ovftool is killed. No limit if None.
+    - output_lines: Number of trailing output lines kept, all if None.
+    - source_size: Size in bytes of the uploaded disks, if known.
+    result:
+    dict with the return code of ovftool, its last output lines, the seconds
+    it ran, whether it was killed on timeout and the timings of its phases.
+    The output is parsed while ovftool runs rather than buffered till it
+    exits.
+    '''
+    start_time = time.time()
+    process = subprocess.Popen(ovf_command, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT,
+                               universal_newlines=True)
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    timer = None
+    if timeout:
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+    output = collections.deque(maxlen=output_lines)
+    progress = OvftoolProgress(start_time)
+    try:
+        for line in process.stdout:
+            output.append(line.rstrip('\n'))
+            progress.feed(line)
+        rc = process.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+    end_time = time.time()
+    return dict(rc=rc, output='\n'.join(output),
+                elapsed=round(end_time - start_time, 1),
+                timed_out=timed_out.is_set(),
+                timings=progress.get_timings(source_size, end_time))
+
+
+def run_ovftool_commands(ovf_commands, max_workers=3, timeout=None, source_sizes=None):
+    '''
+    params:
+    - source_sizes: Size in bytes of the disks uploaded by each command.
+    result:
+    Runs the ovftool commands, max_workers of them at a time, and returns the
+    result of run_ovftool for each of them, in the same order.
+    '''
+    def run(command_and_size):
+        ovf_command, source_size = command_and_size
+        try:
+            return run_ovftool(ovf_command, timeout, source_size=source_size)
+        except OSError as err:
+            return dict(rc=None, output=str(err), elapsed=0, timed_out=False, timings=None)
+
+    if not ovf_commands:
+        return []
+    source_sizes = source_sizes or [None] * len(ovf_commands)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        return list(executor.map(run, zip(ovf_commands, source_sizes)))
+    finally:
+        executor.shutdown()
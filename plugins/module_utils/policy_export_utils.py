@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import gzip
+import io
+import json
+
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import write_file
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.nsxt_resource_urls import INFRA_URL
+
+import six.moves.urllib.parse as urlparse
+
+# Attributes NSX updates on every change, which are left out of the exports
+# so that they only differ by the intent
+METADATA_ATTRIBUTES = ('_create_time', '_create_user', '_last_modified_time',
+                       '_last_modified_user', '_protection', '_revision')
+
+
+def get_infra_url(types=None, base_path=None):
+    '''
+    params:
+    - types: Resource types to be read, e.g. ['Tier0', 'Segment'], along with
+      the objects they are under. All of them if not specified.
+    - base_path: Policy path of the subtree to be read, e.g.
+      /infra/tier-0s/t0. The whole tree if not specified.
+    result:
+    URL of the hierarchical read of the Policy intent.
+    '''
+    params = dict()
+    if types:
+        params['filter'] = 'Type-' + '|'.join(types)
+    if base_path:
+        params['base_path'] = base_path
+    if not params:
+        return INFRA_URL
+    return INFRA_URL + '?' + urlparse.urlencode(sorted(params.items()))
+
+
+def get_child_object(child):
+    '''
+    result:
+    The object wrapped by a Child* entry of a hierarchical read, e.g. the
+    Tier0 of a ChildTier0, or the entry itself if it wraps none, as
+    ChildResourceReference does.
+    '''
+    for value in child.values():
+        if isinstance(value, dict) and 'resource_type' in value:
+            return value
+    return child
+
+
+def normalize_hierarchy(node, strip_metadata=True, exclude_system_owned=False):
+    '''
+    params:
+    - node: Object of a hierarchical read, e.g. the Infra.
+    - strip_metadata: Whether METADATA_ATTRIBUTES are left out.
+    - exclude_system_owned: Whether the system owned objects are left out.
+    result:
+    Copy of node whose children are sorted on their resource_type and path,
+    so that two reads of the same intent are equal.
+    '''
+    if isinstance(node, list):
+        return [normalize_hierarchy(item, strip_metadata, exclude_system_owned)
+                for item in node]
+    if not isinstance(node, dict):
+        return node
+    normalized = dict()
+    for key, value in node.items():
+        if strip_metadata and key in METADATA_ATTRIBUTES:
+            continue
+        if key == 'children' and isinstance(value, list):
+            children = [child for child in value if not (
+                exclude_system_owned and
+                get_child_object(child).get('_system_owned'))]
+            value = sorted(
+                normalize_hierarchy(children, strip_metadata,
+                                    exclude_system_owned),
+                key=lambda child: (
+                    child.get('resource_type', ''),
+                    get_child_object(child).get('path') or
+                    get_child_object(child).get('id') or ''))
+        else:
+            value = normalize_hierarchy(value, strip_metadata,
+                                        exclude_system_owned)
+        normalized[key] = value
+    return normalized
+
+
+def iter_objects(node):
+    '''
+    Generator over node and the objects under it, parents first.
+    '''
+    yield node
+    for child in node.get('children', []):
+        for policy_object in iter_objects(get_child_object(child)):
+            yield policy_object
+
+
+def count_objects(node):
+    '''
+    result:
+    A dict from the resource_type of the objects under node to their number.
+    '''
+    counts = dict()
+    for policy_object in iter_objects(node):
+        if policy_object is node or 'resource_type' not in policy_object:
+            continue
+        resource_type = policy_object['resource_type']
+        counts[resource_type] = counts.get(resource_type, 0) + 1
+    return counts
+
+
+def index_by_path(node):
+    '''
+    result:
+    A dict from the path of every object under node to the object without
+    its children, e.g. to look the objects up without reading them again.
+    '''
+    index = dict()
+    for policy_object in iter_objects(node):
+        if 'path' in policy_object:
+            index[policy_object['path']] = dict(
+                (key, value) for key, value in policy_object.items()
+                if key != 'children')
+    return index
+
+
+def write_export(path, infra, check_mode=False):
+    '''
+    Writes infra to path as indented JSON with sorted keys, gzip compressed if
+    the name ends with .gz, with write_file.
+    result:
+    Dict with the dest, size and sha256 of the file, and whether it is
+    changed. In check mode the file is left as it is.
+    '''
+    def write_infra(export_file):
+        json.dump(infra, export_file, indent=2, sort_keys=True)
+        export_file.write(u'\n')
+
+    summary = write_file(path, write_infra, compress=path.endswith('.gz'),
+                         check_mode=check_mode)
+    return dict(summary, dest=path)
+
+
+def load_export(path):
+    '''
+    result:
+    The Infra written to path by write_export.
+    '''
+    if path.endswith('.gz'):
+        export_file = gzip.open(path, 'rt', encoding='utf-8')
+    else:
+        export_file = io.open(path, 'r', encoding='utf-8')
+    with export_file:
+        return json.load(export_file)
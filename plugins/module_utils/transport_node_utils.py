@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import get_vc_ip_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import contains, is_equal
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vcenter_utils import get_resource_id_from_name, get_data_network_id_from_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_certificate_thumbprint, \
+    IN_PROGRESS, SUCCESS, FAILED
+
+FAILED_STATES = ["failed"]
+IN_PROGRESS_STATES = ["pending", "in_progress"]
+SUCCESS_STATES = ["partial_success", "success", "NODE_READY"]
+FABRIC_VIRTUAL_SWITCH_TYPE = ["VDS"]
+
+
+def transport_node_argument_spec():
+    return dict(display_name=dict(required=True, type='str'),
+                ignore_ssl_verification=dict(required=False, type='boolean'),
+                description=dict(required=False, type='str'),
+                host_switch_spec=dict(required=False, type='dict',
+                host_switches=dict(required=True, type='list'),
+                resource_type=dict(required=True, type='str')),
+                node_deployment_info=dict(required=False, type='dict',
+                discovered_node_id=dict(required=False, type='str'),
+                deployment_config=dict(required=False, type='dict',
+                node_user_settings=dict(required=True, type='dict',
+                cli_username=dict(required=False, type='str'),
+                audit_username=dict(required=False, type='str'),
+                root_password=dict(required=False, type='str', no_log=True),
+                cli_password=dict(required=False, type='str', no_log=True),
+                audit_password=dict(required=False, type='str', no_log=True)),
+                vm_deployment_config=dict(required=True, type='dict',
+                data_networks=dict(required=True, type='list'),
+                management_network=dict(required=True, type='str'),
+                vc_username=dict(required=False, type='str'),
+                vc_password=dict(required=False, type='str', no_log=True),
+                placement_type=dict(required=True, type='str'),
+                compute=dict(required=True, type='str'),
+                vc_name=dict(required=True, type='str'),
+                ipv4_assignment_enabled=dict(required=False, type='boolean'),
+                ipv6_assignment_type=dict(required=False, type='str'),
+                storage=dict(required=True, type='str'),
+                default_gateway_addresses=dict(required=False, type='list'),
+                management_port_subnets=dict(required=False, type='list'),
+                host=dict(required=False, type='str'),
+                reservation_info=dict(required=False, type='dict',
+                cpu_reservation=dict(required=False, type='dict',
+                reservation_in_mhz=dict(required=False, type='int'),
+                reservation_in_shares=dict(required=False, type='str')),
+                memory_reservation=dict(required=False, type='dict',
+                reservation_percentage=dict(required=False, type='int'))),
+                resource_allocation=dict(required=False, type='dict',
+                cpu_count=dict(required=False, type='int'),
+                memory_allocation_in_mb=dict(required=False, type='int'))),
+                form_factor=dict(required=False, type='str')),
+                discovered_ip_addresses=dict(required=False, type='list'),
+                ip_addresses=dict(required=False, type='list'),
+                node_settings=dict(required=False, type='dict',
+                advanced_configuration=dict(required=False, type='str'),
+                allow_ssh_root_login=dict(required=False, type='boolean'),
+                dns_servers=dict(required=False, type='str'),
+                enable_ssh=dict(required=False, type='boolean'),
+                hostname=dict(required=True, type='str'),
+                ntp_servers=dict(required=False, type='list'),
+                search_domains=dict(required=False, type='list'),
+                syslog_servers=dict(required=False, type='list')),
+                fqdn=dict(required=False, type='str'),
+                os_version=dict(required=False, type='str'),
+                managed_by_server=dict(required=False, type='str'),
+                host_credential=dict(required=False, type='dict',
+                username=dict(required=False, type='str'),
+                password=dict(required=False, type='str', no_log=True),
+                thumbprint=dict(required=False, type='str')),
+                allocation_list=dict(required=False, type='list'),
+                os_type=dict(required=True, type='str'),
+                external_id=dict(required=False, type='str'),
+                resource_type=dict(required=True, type='str'),
+                deployment_type=dict(required=False, type='str')),
+                maintenance_mode=dict(required=False, type='str'),
+                remote_tunnel_endpoint=dict(required=False, type='dict',
+                host_switch_name=dict(required=True, type='str'),
+                named_teaming_policy=dict(required=False, type='str'),
+                rtep_vlan=dict(required=True, type='dict',
+                VlanID=dict(required=False, type='int')),
+                ip_assignment_spec=dict(required=True, type='dict',
+                resource_type=dict(required=True, type='str'),
+                ip_pool_id=dict(required=False, type='str'),
+                ip_list=dict(required=False, type='list'),
+                ip_mac_list=dict(required=False, type='list'),
+                default_gateway=dict(required=False, type='dict',
+                IPAddress=dict(required=False, type='str')),
+                subnet_mask=dict(required=False, type='dict',
+                IPAddress=dict(required=False, type='str')))),
+                tags=dict(required=False, type='list'),
+                state=dict(required=True, choices=['present', 'absent']))
+
+
+def get_transport_node_params(args=None):
+    args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs']
+    for key in args_to_remove:
+        args.pop(key, None)
+    for key, value in args.copy().items():
+        if value == None:
+            args.pop(key, None)
+    return args
+
+
+def get_tn_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/transport-nodes', display_name)
+
+
+def get_dn_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
+  return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                        '/fabric/discovered-nodes', display_name, filter_display_name=True)
+
+
+def get_host_switch_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
+    return get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint,
+                                    display_name, exit_if_not_found, id_attribute='uuid')
+
+
+def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_params ):
+    if transport_node_params.__contains__('host_switch_spec'):
+        for host_switch in transport_node_params['host_switch_spec']['host_switches']:
+            if host_switch.__contains__('host_switch_type') and host_switch[
+              'host_switch_type'] in FABRIC_VIRTUAL_SWITCH_TYPE:
+                if host_switch.__contains__('host_switch_name'):
+                  host_switch['host_switch_id'] = get_host_switch_id_from_display_name(module, manager_url, mgr_username,
+                                                                                   mgr_password, validate_certs,
+                                                                                   '/fabric/virtual-switches',
+                                                                                   host_switch['host_switch_name'])
+                else:
+                  module.fail_json(
+                    msg='Failing as host_switch_name is not provided for host switch of type: %s' % host_switch[
+                      'host_switch_type'])
+            host_switch_profiles = host_switch.pop('host_switch_profiles', None)
+
+            host_switch_profile_ids = []
+            if host_switch_profiles is not None:
+                for host_switch_profile in host_switch_profiles:
+                    profile_obj = {}
+                    profile_obj['value'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                        "/host-switch-profiles?include_system_owned=true", host_switch_profile['name'],
+                                                        attributes=dict(resource_type=host_switch_profile['type']))
+                    profile_obj['key'] = host_switch_profile['type']
+                    host_switch_profile_ids.append(profile_obj)
+            host_switch['host_switch_profile_ids'] = host_switch_profile_ids
+            ip_pool_id = None
+            if host_switch.__contains__('ip_assignment_spec') and host_switch['ip_assignment_spec']['resource_type'] == 'StaticIpPoolSpec':
+                ip_pool_name = host_switch['ip_assignment_spec'].pop('ip_pool_name', None)
+                host_switch['ip_assignment_spec']['ip_pool_id'] = get_id_from_display_name (module, manager_url,
+                                                                                            mgr_username, mgr_password, validate_certs,
+                                                                                            "/pools/ip-pools", ip_pool_name)
+            if host_switch.__contains__('transport_zone_endpoints'):
+                for transport_zone_endpoint in host_switch['transport_zone_endpoints']:
+                    transport_zone_name = transport_zone_endpoint.pop('transport_zone_name', None)
+                    transport_zone_endpoint['transport_zone_id'] = get_id_from_display_name (module, manager_url,
+                                                                                             mgr_username, mgr_password, validate_certs,
+                                                                                             "/transport-zones", transport_zone_name)
+            if host_switch.__contains__('vmk_install_migration'):
+                for network in host_switch['vmk_install_migration']:
+                    if network.__contains__('destination_network'):
+                        network['destination_network'] = get_id_from_display_name (module, manager_url, mgr_username,
+                                                                                   mgr_password, validate_certs,
+                                                                                   "/logical-switches", network['destination_network'])
+
+    if transport_node_params.__contains__('transport_zone_endpoints'):
+        for transport_zone_endpoint in transport_node_params['transport_zone_endpoints']:
+            transport_zone_name = transport_zone_endpoint.pop('transport_zone_name', None)
+            transport_zone_endpoint['transport_zone_id'] = get_id_from_display_name (module, manager_url,
+                                                                                    mgr_username, mgr_password, validate_certs,
+                                                                                    "/transport-zones", transport_zone_name)
+    if transport_node_params.__contains__('node_deployment_info') and transport_node_params['node_deployment_info'].__contains__('resource_type') and transport_node_params['node_deployment_info']['resource_type'] == 'EdgeNode':
+        vc_name = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('vc_name', None)
+        transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['vc_id'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                    "/fabric/compute-managers", vc_name)
+
+    transport_node_params['display_name'] = transport_node_params.pop('display_name', None)
+    return transport_node_params
+
+
+def get_api_cert_thumbprint(ip_address, module):
+    try:
+        return get_certificate_thumbprint(ip_address)
+    except Exception as err:
+        module.fail_json(msg='Failed to get node ID from ESXi host with IP {}. Error: {}'.format(ip_address, err))
+
+def inject_vcenter_info(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_params):
+  '''
+  params:
+  - transport_node_params: These are the transport node parameters passed from playbook file
+  result:
+  - takes the vecenter parameters accepted by playbook and converts it into the form accepted
+    by transport node api using pyvmomi functions.
+  '''
+  vm_deployment_config = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']
+  if vm_deployment_config.__contains__('ignore_ssl_verification'):
+      ignore_ssl_verification = vm_deployment_config['ignore_ssl_verification']
+  else:
+      ignore_ssl_verification = True
+  if vm_deployment_config.__contains__('vc_username') and vm_deployment_config.__contains__('vc_password'):
+    vc_name = vm_deployment_config['vc_name']
+    vc_ip = get_vc_ip_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                                         "/fabric/compute-managers", vc_name)
+    
+        
+    vc_username = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('vc_username', None)
+        
+    vc_password = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('vc_password', None)
+
+    if vm_deployment_config.__contains__('host'):
+      host = vm_deployment_config.pop('host', None)
+      host_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
+                                    'host', host, ignore_ssl_verification)
+      transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['host_id'] = str(host_id)
+
+    storage = vm_deployment_config.pop('storage')
+    storage_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
+                                           'storage', storage, ignore_ssl_verification)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['storage_id'] = str(storage_id)
+
+    cluster = vm_deployment_config.pop('compute')
+    cluster_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
+                                           'cluster', cluster, ignore_ssl_verification)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['compute_id'] = str(cluster_id)
+
+    management_network = vm_deployment_config.pop('management_network')
+    management_network_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
+                                               'network', management_network, ignore_ssl_verification)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['management_network_id'] = str(management_network_id)
+
+    data_networks = vm_deployment_config.pop('data_networks')
+    data_network_ids = get_data_network_id_from_name(module, vc_ip, vc_username, vc_password,
+                                                data_networks, ignore_ssl_verification)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['data_network_ids'] = data_network_ids
+        
+    if vm_deployment_config.__contains__('host'):
+      transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('host', None)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('cluster', None)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('storage', None)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('management_network', None)
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('data_networks', None)
+  else:
+    if vm_deployment_config.__contains__('host'):
+      host_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('host', None)
+      transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['host_id'] = host_id
+        
+    cluster_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('compute', None)
+    storage_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('storage', None)
+    management_network_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('management_network', None)
+    data_network_ids = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('data_networks', None)
+        
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['compute_id'] = cluster_id
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['storage_id'] = storage_id
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['management_network_id'] = management_network_id
+    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['data_network_ids'] = data_network_ids
+    transport_node_params['node_deployment_info']['vm_deployment_config'].pop('ignore_ssl_verification', None)
+
+
+def compareTags(existing_transport_node, new_transport_nodes):
+    return is_equal(existing_transport_node['tags'], new_transport_nodes['tags'])
+
+
+def transport_node_needs_update(existing_transport_node, transport_node_with_ids):
+    if not existing_transport_node.__contains__('description') and transport_node_with_ids.__contains__('description'):
+        return True
+    if existing_transport_node.__contains__('description') and transport_node_with_ids.__contains__('description') and existing_transport_node['description'] != transport_node_with_ids['description']:
+        return True
+    if existing_transport_node.__contains__('description') and not transport_node_with_ids.__contains__('description'):
+        return True
+    if existing_transport_node.__contains__('tags') and not transport_node_with_ids.__contains__('tags'):
+        return True
+    if not existing_transport_node.__contains__('tags') and transport_node_with_ids.__contains__('tags'):
+        return True
+    if existing_transport_node.__contains__('tags') and transport_node_with_ids.__contains__('tags') and (not compareTags(existing_transport_node, transport_node_with_ids)):
+        return True
+
+    if transport_node_with_ids.__contains__('host_switch_spec') and transport_node_with_ids['host_switch_spec'].__contains__('host_switches'):
+        if not contains(existing_transport_node['host_switch_spec'],
+                        {'host_switches': transport_node_with_ids['host_switch_spec']['host_switches']}):
+            return True
+    return False
+
+
+def inject_host_thumbprint(module, transport_node_params):
+    '''
+    params:
+    - transport_node_params: Transport node with the references resolved to ids.
+    result:
+    - sets the thumbprint of the host credential, read from the API certificate
+      of the first ESXi ip address, if the playbook doesn't provide it.
+    '''
+    node_deployment_info = transport_node_params.get('node_deployment_info', {})
+    if not node_deployment_info.__contains__('host_credential') or \
+            node_deployment_info['host_credential'].__contains__('thumbprint'):
+        return
+    if not node_deployment_info.__contains__('ip_addresses'):
+        module.fail_json(msg="ESXi ip adresses are not provided")
+    esxi_ip_address = node_deployment_info['ip_addresses'][0]
+    node_deployment_info['host_credential']['thumbprint'] = get_api_cert_thumbprint(esxi_ip_address, module)
+
+
+def get_transport_node_status(transport_node_state):
+    '''
+    params:
+    - transport_node_state: TransportNodeState returned by NSX.
+    result:
+    - common_utils SUCCESS, FAILED or IN_PROGRESS depending on the state of the
+      transport node and on the state of its node deployment.
+    '''
+    states = [transport_node_state.get('state')]
+    if transport_node_state.__contains__('node_deployment_state'):
+        states.append(transport_node_state['node_deployment_state'].get('state'))
+    if any(state in FAILED_STATES for state in states):
+        return FAILED
+    if all(state in SUCCESS_STATES for state in states):
+        return SUCCESS
+    return IN_PROGRESS
+
+
+def get_transport_node_states(communicator):
+    '''
+    result:
+    - dict from transport node id to its TransportNodeState, listed in one
+      paginated request for all the transport nodes.
+    '''
+    (rc, resp) = communicator.request('/transport-nodes/state')
+    return dict((state['transport_node_id'], state) for state in resp.get('results', []))
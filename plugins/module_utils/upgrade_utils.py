@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import time
+
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import write_file
+
+# Statuses of a component whose upgrade has begun but isn't done
+ACTIVE_COMPONENT_STATUSES = ('IN_PROGRESS', 'PAUSING', 'PAUSED', 'FAILED')
+
+# Overall statuses of an upgrade a later run can resume
+RESUMABLE_UPGRADE_STATUSES = ('IN_PROGRESS', 'PAUSING', 'PAUSED')
+
+
+def new_checkpoint(manager, paused_upgrade):
+    '''
+    result:
+    Empty checkpoint of the upgrade driven through manager.
+    '''
+    now = time.time()
+    return dict(manager=manager, paused_upgrade=paused_upgrade, started=now,
+                updated=now, actions=[], overall_status=None, component=None,
+                component_statuses=dict(), unit_group_statuses=dict())
+
+
+def load_checkpoint(path, manager):
+    '''
+    result:
+    Checkpoint saved at path by an earlier run against manager, None if there
+    is none or it can't be read.
+    '''
+    try:
+        with open(path) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(checkpoint, dict) or checkpoint.get('manager') != manager:
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path, checkpoint):
+    '''
+    Writes checkpoint to path with write_file, so that an interruption leaves
+    the previous checkpoint in place.
+    '''
+    checkpoint['updated'] = time.time()
+    write_file(path, lambda checkpoint_file: json.dump(checkpoint, checkpoint_file,
+                                                       indent=2, sort_keys=True))
+
+
+def can_resume(checkpoint):
+    '''
+    result:
+    Whether checkpoint is the one of an upgrade started or continued by an
+    earlier run and neither done nor failed since.
+    '''
+    return len(checkpoint['actions']) > 0 and \
+        checkpoint.get('overall_status') in RESUMABLE_UPGRADE_STATUSES
+
+
+def record_completion(checkpoint):
+    '''
+    Records that the whole system is upgraded, so that no later run resumes
+    from checkpoint.
+    '''
+    checkpoint['overall_status'] = 'SUCCESS'
+    checkpoint['component'] = None
+
+
+def record_action(checkpoint, action):
+    '''
+    Records that the upgrade plan was started or continued for the current
+    component.
+    '''
+    checkpoint['actions'].append(dict(action=action, component=checkpoint['component'],
+                                      time=time.time()))
+
+
+def get_current_component(component_status_list):
+    '''
+    params:
+    - component_status_list: component_status of /upgrade/status-summary.
+    result:
+    Type of the component being upgraded, i.e. the first one whose upgrade
+    has begun but isn't done or else the first one not started, None once
+    all of them are upgraded.
+    '''
+    for component_status in component_status_list:
+        if component_status['status'] in ACTIVE_COMPONENT_STATUSES:
+            return component_status['component_type']
+    for component_status in component_status_list:
+        if component_status['status'] == 'NOT_STARTED':
+            return component_status['component_type']
+    return None
+
+
+def record_statuses(checkpoint, status_summary, unit_group_statuses=None):
+    '''
+    params:
+    - status_summary: Response of /upgrade/status-summary.
+    - unit_group_statuses: Dict from the id of an upgrade unit group to its
+      status, kept from the last record if None.
+    '''
+    component_status_list = status_summary.get('component_status', [])
+    checkpoint['overall_status'] = status_summary.get('overall_upgrade_status')
+    checkpoint['component'] = get_current_component(component_status_list)
+    checkpoint['component_statuses'] = dict(
+        (component_status['component_type'], component_status['status'])
+        for component_status in component_status_list)
+    if unit_group_statuses is not None:
+        checkpoint['unit_group_statuses'] = unit_group_statuses
+
+
+def get_unit_group_statuses(manager_url, mgr_username, mgr_password, validate_certs):
+    '''
+    result:
+    Dict from the id of every upgrade unit group to its status.
+    '''
+    (rc, resp) = request(manager_url + '/upgrade/upgrade-unit-groups-status',
+                         headers=dict(Accept='application/json'),
+                         url_username=mgr_username, url_password=mgr_password,
+                         validate_certs=validate_certs)
+    return dict((group_status['group_id'], group_status['status'])
+                for group_status in resp.get('results', []))
+
+
+# Statuses of an upgrade unit whose upgrade is over
+DONE_UNIT_STATUSES = ('SUCCESS', 'FAILED')
+
+
+class UpgradeProgress(object):
+    '''
+    Tracks the upgrade units through the aggregate info of their groups. The
+    units of a group are only listed again once the status or the completion
+    percentage of the group changed. The time at which every unit is seen
+    starting and ending gives the duration of the units and the throughput
+    and ETA of every component.
+    '''
+
+    def __init__(self, state=None):
+        # Only made of JSON types, so that it can be saved in a checkpoint
+        self.state = state
+        if state is None:
+            self.reset()
+
+    def reset(self):
+        self.state = dict(groups=dict(), units=dict(), components=dict())
+
+    def update_components(self, component_status_list, now):
+        changed = False
+        for component_status in component_status_list:
+            component = self.state['components'].setdefault(
+                component_status['component_type'], dict(status=None, since=None))
+            if component['status'] != component_status['status']:
+                component['status'] = component_status['status']
+                changed = True
+            if component['since'] is None and component['status'] == 'IN_PROGRESS':
+                component['since'] = now
+        return changed
+
+    def get_changed_groups(self, group_infos, now):
+        '''
+        params:
+        - group_infos: results of /upgrade/upgrade-unit-groups/aggregate-info.
+        result:
+        ids of the groups whose units are to be listed again. The groups first
+        seen not started or already upgraded are not listed, their unit count
+        is enough.
+        '''
+        changed_groups = []
+        for group_info in group_infos:
+            group = group_info.get('group', group_info)
+            known_group = self.state['groups'].get(group['id'])
+            signature = [group_info.get('status'), group_info.get('percent_complete')]
+            if known_group is not None and known_group['signature'] == signature:
+                continue
+            if known_group is not None or signature[0] not in ('NOT_STARTED', 'SUCCESS'):
+                changed_groups.append(group['id'])
+            self.state['groups'][group['id']] = dict(
+                component_type=group.get('type'), signature=signature,
+                unit_count=group.get('upgrade_unit_count', 0))
+        return changed_groups
+
+    def update_units(self, group_id, unit_infos, now):
+        group = self.state['groups'][group_id]
+        for unit_info in unit_infos:
+            status = unit_info.get('status')
+            unit = self.state['units'].get(unit_info['id'])
+            if unit is None:
+                unit = self.state['units'][unit_info['id']] = dict(
+                    group_id=group_id, component_type=group['component_type'],
+                    status=None, started=None, finished=None)
+                if status in DONE_UNIT_STATUSES:
+                    # Upgraded before being tracked, so its duration is unknown
+                    unit['status'] = status
+                    continue
+            if status == 'IN_PROGRESS' and unit['started'] is None:
+                unit['started'] = now
+                component = self.state['components'].setdefault(
+                    group['component_type'], dict(status=None, since=None))
+                if component['since'] is None:
+                    component['since'] = now
+            if status in DONE_UNIT_STATUSES and unit['status'] not in DONE_UNIT_STATUSES:
+                unit['finished'] = now
+            unit['status'] = status
+
+    def get_summary(self, now):
+        '''
+        result:
+        For every component, its number of units, of upgraded and of failed
+        ones, the mean duration of its units in seconds, its throughput in
+        units per hour and its ETA in seconds. The ETA of the whole upgrade is
+        the sum of the ETA of the components left, None while one is unknown.
+        '''
+        components = dict()
+
+        def get_component_summary(component_type):
+            if component_type not in components:
+                components[component_type] = dict(
+                    status=self.state['components'].get(component_type, {}).get('status'),
+                    units=0, done=0, failed=0, completed=0, durations=[], last_finished=None)
+            return components[component_type]
+
+        for component_type in self.state['components']:
+            get_component_summary(component_type)
+        for group in self.state['groups'].values():
+            summary = get_component_summary(group['component_type'])
+            summary['units'] += group['unit_count']
+            if group['signature'][0] == 'SUCCESS':
+                summary['done'] += group['unit_count']
+        for unit in self.state['units'].values():
+            summary = get_component_summary(unit['component_type'])
+            if unit['status'] in DONE_UNIT_STATUSES and \
+                    self.state['groups'][unit['group_id']]['signature'][0] != 'SUCCESS':
+                summary['done'] += 1
+            if unit['status'] == 'FAILED':
+                summary['failed'] += 1
+            if unit['finished'] is not None:
+                # Seen ending while tracked
+                summary['completed'] += 1
+                summary['last_finished'] = max(summary['last_finished'] or 0, unit['finished'])
+                if unit['started'] is not None:
+                    summary['durations'].append(unit['finished'] - unit['started'])
+
+        eta = 0
+        for component_type, summary in components.items():
+            durations = summary.pop('durations')
+            last_finished = summary.pop('last_finished')
+            completed = summary.pop('completed')
+            since = self.state['components'].get(component_type, {}).get('since')
+            remaining = max(summary['units'] - summary['done'], 0)
+            end = now if remaining else last_finished
+            summary['throughput'] = None
+            if since is not None and end is not None and completed and end > since:
+                summary['throughput'] = round(completed * 3600.0 / (end - since), 1)
+            summary['mean_unit_duration'] = int(sum(durations) / len(durations)) if durations else None
+            if not remaining:
+                summary['eta'] = 0
+            elif summary['throughput']:
+                summary['eta'] = int(remaining * 3600 / summary['throughput'])
+            else:
+                summary['eta'] = None
+            if eta is not None:
+                eta = None if summary['eta'] is None else eta + summary['eta']
+        return dict(components=components, eta=eta)
+
+
+def update_upgrade_progress(progress, status_summary, manager_url, mgr_username,
+                            mgr_password, validate_certs):
+    '''
+    Updates progress from status_summary, the response of
+    /upgrade/status-summary, and from the aggregate info of the upgrade unit
+    groups, listing the units of the changed groups only.
+    result:
+    True if a status or a completion percentage changed.
+    '''
+    now = time.time()
+    changed = progress.update_components(status_summary.get('component_status', []), now)
+    (rc, resp) = request(manager_url + '/upgrade/upgrade-unit-groups/aggregate-info',
+                         headers=dict(Accept='application/json'),
+                         url_username=mgr_username, url_password=mgr_password,
+                         validate_certs=validate_certs)
+    for group_id in progress.get_changed_groups(resp.get('results', []), now):
+        changed = True
+        (rc, resp) = request(manager_url + '/upgrade/upgrade-units/aggregate-info?group_id=%s' % group_id,
+                             headers=dict(Accept='application/json'),
+                             url_username=mgr_username, url_password=mgr_password,
+                             validate_certs=validate_certs)
+        progress.update_units(group_id, resp.get('results', []), now)
+    return changed
+
+
+def split_evenly(items, count):
+    '''
+    result:
+    items dealt into count lists whose sizes differ by one at most.
+    '''
+    count = max(min(count, len(items)), 1)
+    return [items[index::count] for index in range(count)]
+
+
+def plan_upgrade_groups(component_type, units_by_cluster, max_units_down,
+                        group_name_prefix=''):
+    '''
+    params:
+    - component_type: HOST or EDGE.
+    - units_by_cluster: Dict from the name of a cluster to its upgrade units,
+      each a dict with their id and display_name.
+    - max_units_down: Dict from the name of a cluster to the number of its
+      units that can be upgraded at the same time. No limit for the clusters
+      not in it.
+    result:
+    Upgrade unit groups upgrading the units of each cluster with as much
+    parallelism as its limit allows, assuming the groups of the component
+    are upgraded in parallel, and the sorted names of the skipped clusters.
+    A cluster whose units can all be upgraded at once gets one parallel
+    group, otherwise its units are dealt into as many serial groups as units
+    can be upgraded at the same time. A cluster none of whose units can be
+    upgraded, e.g. an edge cluster of one edge that must stay up, is skipped
+    and its units are left in their groups.
+    '''
+    groups = []
+    skipped_clusters = []
+    for cluster in sorted(units_by_cluster):
+        units = sorted(units_by_cluster[cluster], key=lambda unit: unit['display_name'])
+        limit = max_units_down.get(cluster, len(units))
+        if limit < 1:
+            skipped_clusters.append(cluster)
+            continue
+        parallel = limit >= len(units)
+        for index, group_units in enumerate(split_evenly(units, 1 if parallel else limit)):
+            groups.append(dict(display_name='%s%s-%d' % (group_name_prefix, cluster, index + 1),
+                               type=component_type, parallel=parallel, enabled=True,
+                               upgrade_units=[dict(id=unit['id']) for unit in group_units]))
+    return groups, skipped_clusters
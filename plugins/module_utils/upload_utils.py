@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import hashlib
+import os
+import socket
+import threading
+import time
+import uuid
+
+from ansible.module_utils.six.moves import BaseHTTPServer, socketserver
+from ansible.module_utils.six.moves.urllib.parse import quote, unquote
+
+# Bytes read from disk per chunk of an upload
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartFileStream:
+    """
+        File-like request body holding a multipart/form-data form with a
+        single file field. The file is read from disk one chunk at a time
+        while the request is sent, so that its size doesn't matter, and its
+        SHA-256 is computed on the way.
+    """
+
+    def __init__(self, file_path, field_name='file', chunk_size=UPLOAD_CHUNK_SIZE):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.file_size = os.path.getsize(file_path)
+        boundary = uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary=%s' % boundary
+        self._preamble = ('--%s\r\n'
+                          'Content-Disposition: form-data; name="%s"; filename="%s"\r\n'
+                          'Content-Type: application/octet-stream\r\n\r\n' %
+                          (boundary, field_name, os.path.basename(file_path))).encode('utf-8')
+        self._epilogue = ('\r\n--%s--\r\n' % boundary).encode('utf-8')
+        self.content_length = len(self._preamble) + self.file_size + len(self._epilogue)
+
+        self._file = None
+        self._buffer = self._preamble
+        self._offset = 0
+        self._epilogue_sent = False
+        self._sha256 = hashlib.sha256()
+        self.bytes_sent = 0
+        self.start_time = None
+        self.end_time = None
+
+    def get_headers(self):
+        return {'Content-Type': self.content_type,
+                'Content-Length': str(self.content_length)}
+
+    def read(self, size=-1):
+        if self.start_time is None:
+            self.start_time = time.time()
+            self._file = open(self.file_path, 'rb')
+        if size is None or size < 0:
+            size = self.content_length
+        pieces = []
+        while size > 0:
+            if self._offset >= len(self._buffer) and not self._next_buffer():
+                break
+            data = self._buffer[self._offset:self._offset + size]
+            self._offset += len(data)
+            size -= len(data)
+            pieces.append(data)
+        data = b''.join(pieces)
+        self.bytes_sent += len(data)
+        return data
+
+    def _next_buffer(self):
+        if self._epilogue_sent:
+            return False
+        chunk = self._file.read(self.chunk_size)
+        if chunk:
+            self._sha256.update(chunk)
+            self._buffer = chunk
+        else:
+            self._buffer = self._epilogue
+            self._epilogue_sent = True
+            self._file.close()
+            self.end_time = time.time()
+        self._offset = 0
+        return True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+    @property
+    def sha256(self):
+        """
+            SHA-256 of the file, once it has been entirely sent.
+        """
+        if not self._epilogue_sent:
+            return None
+        return self._sha256.hexdigest()
+
+    def get_statistics(self):
+        """
+            Returns the size of the file, its SHA-256, the seconds spent
+            sending it and the resulting throughput.
+        """
+        elapsed = None
+        bytes_per_second = None
+        if self.start_time is not None:
+            elapsed = (self.end_time or time.time()) - self.start_time
+            if elapsed > 0:
+                bytes_per_second = int(self.bytes_sent / elapsed)
+            elapsed = round(elapsed, 1)
+        return dict(bytes=self.file_size, sha256=self.sha256,
+                    elapsed=elapsed, bytes_per_second=bytes_per_second)
+
+
+def get_local_address(remote_host, port=443):
+    """
+        Returns the address of this host on the route to remote_host, i.e.
+        the address at which remote_host can reach it. No packet is sent.
+    """
+    family, socktype, proto, canonname, sockaddr = socket.getaddrinfo(
+        remote_host, port, 0, socket.SOCK_DGRAM)[0]
+    sock = socket.socket(family, socktype, proto)
+    try:
+        sock.connect(sockaddr)
+        return sock.getsockname()[0]
+    finally:
+        sock.close()
+
+
+def get_byte_range(range_header, size):
+    """
+        Parses the Range header of a request for a file of size bytes.
+        Returns the (first, last) bytes requested, or None if the whole file
+        is to be sent. Raises ValueError if the range can't be satisfied.
+        Multiple ranges are not supported and the whole file is sent then.
+    """
+    if not range_header or not range_header.startswith('bytes=') or ',' in range_header:
+        return None
+    first, sep, last = range_header[len('bytes='):].strip().partition('-')
+    try:
+        first = int(first) if first else None
+        last = int(last) if last else None
+    except ValueError:
+        first = last = None
+    if first is None and last is None:
+        # Invalid ranges are ignored
+        return None
+    if first is None:
+        # Suffix range, the last bytes of the file
+        if not last or size == 0:
+            raise ValueError('Range %s not satisfiable for %d bytes' % (range_header, size))
+        return max(size - last, 0), size - 1
+    if last is None:
+        last = size - 1
+    if first >= size or last < first:
+        raise ValueError('Range %s not satisfiable for %d bytes' % (range_header, size))
+    return first, min(last, size - 1)
+
+
+class _BundleRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_HEAD(self):
+        self._send_file(False)
+
+    def do_GET(self):
+        self._send_file(True)
+
+    def _send_file(self, send_body):
+        bundle_server = self.server.bundle_server
+        if unquote(self.path.split('?')[0]).lstrip('/') != bundle_server.file_name:
+            self.send_error(404)
+            return
+        size = bundle_server.file_size
+        try:
+            byte_range = get_byte_range(self.headers.get('Range'), size)
+        except ValueError:
+            self.send_response(416)
+            self.send_header('Content-Range', 'bytes */%d' % size)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if byte_range is None:
+            first, last = 0, size - 1
+            self.send_response(200)
+        else:
+            first, last = byte_range
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (first, last, size))
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(last - first + 1))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+        if not send_body:
+            return
+        bytes_sent = 0
+        start_time = time.time()
+        try:
+            with open(bundle_server.file_path, 'rb') as bundle_file:
+                bundle_file.seek(first)
+                remaining = last - first + 1
+                while remaining > 0:
+                    chunk = bundle_file.read(min(bundle_server.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    bytes_sent += len(chunk)
+                    remaining -= len(chunk)
+        except (socket.error, IOError):
+            # The manager dropped the connection, it may resume later
+            pass
+        finally:
+            bundle_server.record_transfer(first, bytes_sent, start_time)
+
+    def log_message(self, format, *args):
+        # The output of a module must only be its JSON result
+        pass
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class _ThreadingHTTPServer6(_ThreadingHTTPServer):
+    address_family = socket.AF_INET6
+
+
+class BundleFileServer:
+    """
+        HTTP server sending a single file from a background thread, so that
+        the manager fetches the file by URL instead of it being uploaded.
+        Range requests are honoured, which lets the manager resume an
+        interrupted transfer instead of restarting it.
+    """
+
+    def __init__(self, file_path, address, port=0, chunk_size=UPLOAD_CHUNK_SIZE):
+        self.file_path = file_path
+        self.file_name = os.path.basename(file_path)
+        self.file_size = os.path.getsize(file_path)
+        self.address = address
+        self.chunk_size = chunk_size
+        self.requests = 0
+        self.resumed_requests = 0
+        self.bytes_served = 0
+        self.start_time = None
+        self.end_time = None
+        self._lock = threading.Lock()
+        self._thread = None
+        # The file is only served on the address the manager reaches, in
+        # its address family.
+        family, sockaddr = [(info[0], info[4]) for info in socket.getaddrinfo(
+            address, port, 0, socket.SOCK_STREAM)][0]
+        server_class = _ThreadingHTTPServer6 if family == socket.AF_INET6 else _ThreadingHTTPServer
+        self._server = server_class((sockaddr[0], port), _BundleRequestHandler)
+        self._server.bundle_server = self
+        self.port = self._server.server_address[1]
+
+    @property
+    def url(self):
+        address = self.address
+        if ':' in address:
+            address = '[%s]' % address
+        return 'http://%s:%d/%s' % (address, self.port, quote(self.file_name))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def record_transfer(self, first_byte, bytes_sent, start_time):
+        with self._lock:
+            self.requests += 1
+            if first_byte > 0:
+                self.resumed_requests += 1
+            self.bytes_served += bytes_sent
+            if self.start_time is None or start_time < self.start_time:
+                self.start_time = start_time
+            self.end_time = time.time()
+
+    def get_statistics(self):
+        """
+            Returns the size of the file, the bytes served to the manager,
+            the number of requests and of resumed ones, the seconds between
+            the first request and the end of the last one and the resulting
+            throughput.
+        """
+        with self._lock:
+            elapsed = None
+            bytes_per_second = None
+            if self.start_time is not None:
+                elapsed = self.end_time - self.start_time
+                if elapsed > 0:
+                    bytes_per_second = int(self.bytes_served / elapsed)
+                elapsed = round(elapsed, 1)
+            return dict(bytes=self.file_size, url=self.url,
+                        bytes_served=self.bytes_served, requests=self.requests,
+                        resumed_requests=self.resumed_requests,
+                        elapsed=elapsed, bytes_per_second=bytes_per_second)
@@ -22,15 +22,22 @@ except:
 from pyVmomi import vmodl
 from pyVmomi import vim
 
+# Types of the vCenter resources that can be looked up by name
+RESOURCE_TYPES = {
+    'host': vim.HostSystem,
+    'cluster': vim.ClusterComputeResource,
+    'storage': vim.Datastore,
+    'network': vim.Network,
+    'vm': vim.VirtualMachine,
+}
 
-def establish_vcenter_connection(module, vCenter_host, username, password, ignore_ssl_verification):
+# Number of objects retrieved per PropertyCollector page
+PROPERTY_COLLECTOR_PAGE_SIZE = 1000
+
+
+def _connect(module, vCenter_host, username, password, ignore_ssl_verification):
     """
-    params:
-    - vCenter_host: vCenter host IP
-    - username: vCenter username
-    - password: vCenter password
-    result:
-    Retrieves vCenter information from service instance and returns as content object.
+    Logs into vCenter and returns the ServiceInstance.
     """
     if ignore_ssl_verification is False:
         try:
@@ -44,8 +51,6 @@ def establish_vcenter_connection(module, vCenter_host, username, password, ignor
             if not service_instance:
                 module.fail_json(msg="Could not connect to the specified vCenter "
                                      "host using specified username and password")
-
-            atexit.register(connect.Disconnect, service_instance)
         except vmodl.MethodFault as error:
             module.fail_json(msg="Caught vmodl fault while connecting to vCenter: " + error.msg)
     else:
@@ -57,8 +62,6 @@ def establish_vcenter_connection(module, vCenter_host, username, password, ignor
             if not service_instance:
                 module.fail_json(msg="Could not connect to the specified vCenter "
                                      "host using specified username and password")
-
-            atexit.register(connect.Disconnect, service_instance)
         except (requests.ConnectionError, ssl.SSLError):
             try:
                 sslContext = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
@@ -71,44 +74,132 @@ def establish_vcenter_connection(module, vCenter_host, username, password, ignor
                 if not service_instance:
                     module.fail_json(msg="Could not connect to the specified vCenter "
                                          "host using specified username and password")
-
-                atexit.register(connect.Disconnect, service_instance)
             except vmodl.MethodFault as error:
                 module.fail_json(msg="Caught vmodl fault while connecting to vCenter: " + error.msg)
-    return service_instance.RetrieveContent()
+    return service_instance
+
+
+class VcenterSession:
+
+    __instances = dict()
+
+    @staticmethod
+    def get_instance(module, vCenter_host, username, password,
+                     ignore_ssl_verification):
+        """
+            Returns the VcenterSession associated with
+            (vCenter_host, username, password, ignore_ssl_verification),
+            logging into vCenter the first time only. All the vCenter lookups
+            of a module run share this session.
+        """
+        key = tuple([vCenter_host, username, password, ignore_ssl_verification])
+        if key not in VcenterSession.__instances:
+            VcenterSession(key, module, vCenter_host, username, password,
+                           ignore_ssl_verification)
+        return VcenterSession.__instances.get(key)
+
+    def __init__(self, key, module, vCenter_host, username, password,
+                 ignore_ssl_verification):
+        if key in VcenterSession.__instances:
+            raise Exception("The associated VcenterSession is already"
+                            " present! Please use get_instance to"
+                            " retrieve it.")
+        self.vCenter_host = vCenter_host
+        self.service_instance = _connect(module, vCenter_host, username,
+                                         password, ignore_ssl_verification)
+        atexit.register(connect.Disconnect, self.service_instance)
+        self.content = self.service_instance.RetrieveContent()
+
+        # resource type -> {name: managed object}
+        self._name_indexes = dict()
+
+        VcenterSession.__instances[key] = self
+
+    def get_name_index(self, resource_type):
+        """
+            Returns a dict from name to managed object for all the objects
+            of resource_type, one of RESOURCE_TYPES. The names are retrieved
+            once per session.
+        """
+        if resource_type not in self._name_indexes:
+            self._name_indexes[resource_type] = get_name_index(
+                self.content, RESOURCE_TYPES[resource_type])
+        return self._name_indexes[resource_type]
+
+
+def get_vcenter_session(module, vCenter_host, username, password, ignore_ssl_verification):
+    return VcenterSession.get_instance(module, vCenter_host, username, password,
+                                       ignore_ssl_verification)
+
+
+def establish_vcenter_connection(module, vCenter_host, username, password, ignore_ssl_verification):
+    """
+    params:
+    - vCenter_host: vCenter host IP
+    - username: vCenter username
+    - password: vCenter password
+    result:
+    Retrieves vCenter information from service instance and returns as content object.
+    The connection is shared by all the calls with the same vCenter and credentials.
+    """
+    return get_vcenter_session(module, vCenter_host, username, password,
+                               ignore_ssl_verification).content
+
+
+def get_name_index(content, vim_type, page_size=PROPERTY_COLLECTOR_PAGE_SIZE):
+    """
+    params:
+    - vim_type: Managed object type, e.g. vim.VirtualMachine.
+    result:
+    dict from name to managed object for all the objects of vim_type. Only the
+    name property is retrieved, page_size objects per PropertyCollector call,
+    rather than one round trip per object.
+    """
+    view = content.viewManager.CreateContainerView(content.rootFolder, [vim_type], True)
+    try:
+        traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+            name='traverseEntities', path='view', skip=False, type=vim.view.ContainerView)
+        object_spec = vmodl.query.PropertyCollector.ObjectSpec(
+            obj=view, skip=True, selectSet=[traversal_spec])
+        property_spec = vmodl.query.PropertyCollector.PropertySpec(
+            type=vim_type, pathSet=['name'], all=False)
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[object_spec], propSet=[property_spec])
+        options = vmodl.query.PropertyCollector.RetrieveOptions(maxObjects=page_size)
+
+        collector = content.propertyCollector
+        index = {}
+        result = collector.RetrievePropertiesEx([filter_spec], options)
+        while result:
+            for object_content in result.objects:
+                for dynamic_property in object_content.propSet:
+                    if dynamic_property.name == 'name':
+                        index.setdefault(dynamic_property.val, object_content.obj)
+            if not result.token:
+                break
+            result = collector.ContinueRetrievePropertiesEx(result.token)
+        return index
+    finally:
+        view.Destroy()
 
 
 def get_resource_id_from_name(module, vCenter_host, username, password,
                               resource_type, resource_name, ignore_ssl_verification):
     """
     params:
-    - resource_type: Type of vCenter resource. Accepted values 'host', 'cluster', 'storage' and 'network'.
+    - resource_type: Type of vCenter resource. Accepted values 'host', 'cluster', 'storage', 'network' and 'vm'.
     - resource_name: Name of the resource.
     result:
     - moref id of the resource name and type given.
     """
+    if resource_type not in RESOURCE_TYPES:
+        module.fail_json(msg='Resource type provided by user either doesn\'t'
+                             ' exist or is not supported')
     try:
-        content = establish_vcenter_connection(module, vCenter_host, username, password, ignore_ssl_verification)
-        if resource_type == 'host':
-            objview = content.viewManager.CreateContainerView(content.rootFolder,
-                                                              [vim.HostSystem], True)
-        elif resource_type == 'cluster':
-            objview = content.viewManager.CreateContainerView(content.rootFolder,
-                                                              [vim.ClusterComputeResource], True)
-        elif resource_type == 'storage':
-            objview = content.viewManager.CreateContainerView(content.rootFolder,
-                                                              [vim.Datastore], True)
-        elif resource_type == 'network':
-            objview = content.viewManager.CreateContainerView(content.rootFolder,
-                                                              [vim.Network], True)
-        else:
-            module.fail_json(msg='Resource type provided by user either doesn\'t'
-                                 ' exist or is not supported')
-        all_resources = objview.view
-        objview.Destroy()
-        for resource in all_resources:
-            if resource.name == resource_name:
-                return resource._moId
+        session = get_vcenter_session(module, vCenter_host, username, password, ignore_ssl_verification)
+        resource = session.get_name_index(resource_type).get(resource_name)
+        if resource is not None:
+            return resource._moId
         module.fail_json(msg='%s doesnt exist in %s' % (resource_name,
                                                         resource_type))
     except vmodl.MethodFault as error:
@@ -125,18 +216,12 @@ def get_data_network_id_from_name(module, vCenter_host, username, password,
     list of data network ids.
     """
     try:
-        content = establish_vcenter_connection(module, vCenter_host, username, password, ignore_ssl_verification)
-        objview = content.viewManager.CreateContainerView(content.rootFolder,
-                                                          [vim.Network], True)
-        all_networks = objview.view
-        objview.Destroy()
-        network_dict = {}
-        for network in all_networks:
-            network_dict[network.name] = network._moId
+        session = get_vcenter_session(module, vCenter_host, username, password, ignore_ssl_verification)
+        network_dict = session.get_name_index('network')
         data_network_id_list = []
         for data_network_name in data_network_name_list:
             if data_network_name in network_dict:
-                data_network_id_list.append(str(network_dict[data_network_name]))
+                data_network_id_list.append(str(network_dict[data_network_name]._moId))
             else:
                 module.fail_json(msg='data network %s doesnt exist in the available'
                                      'list of networks' % data_network_name)
@@ -30,11 +30,13 @@ def vmware_argument_spec():
 
 def request(url, data=None, headers=None, method='GET', use_proxy=True,
             force=False, last_mod_time=None, timeout=300, validate_certs=True,
-            url_username=None, url_password=None, http_agent=None, force_basic_auth=True, ignore_errors=False):
+            url_username=None, url_password=None, http_agent=None, force_basic_auth=True, ignore_errors=False,
+            paginate=True):
     '''
     The main function which hits the request to the manager. Username and password are given the topmost priority.
     In case username and password are not provided if the environment variable is set.
     Authentication fails if the details are not correct.
+    GET requests follow the cursor and return all the pages unless paginate is False.
     '''
     if url_username is None or url_password is None:
         force_basic_auth = False
@@ -45,7 +47,7 @@ def request(url, data=None, headers=None, method='GET', use_proxy=True,
     else:
         client_cert = None
 
-    if method == 'GET':
+    if method == 'GET' and paginate:
         return get_all_results(
             url, data, headers, method, use_proxy, force, last_mod_time,
             timeout, validate_certs, url_username, url_password, http_agent,
@@ -117,6 +119,63 @@ def _request(url, data, headers, method, use_proxy,
         raise Exception (resp_data['error_code'], resp_data)
     return resp_code, resp_data
 
+BATCH_MAX_REQUESTS = 50
+
+def batch_request(manager_url, sub_requests, atomic=False, continue_on_error=True,
+                  chunk_size=BATCH_MAX_REQUESTS, validate_certs=True,
+                  url_username=None, url_password=None, timeout=300):
+    '''
+    Submits the sub-requests through the Manager Batch API (POST /batch).
+    params:
+    - sub_requests: list of dict with 'uri' (relative to manager_url, e.g.
+      '/logical-switches'), 'method' and optionally 'body'.
+    - atomic: if True, a chunk is rolled back as a whole when one of its
+      sub-requests fails.
+    - chunk_size: maximum number of sub-requests sent in one batch.
+    result:
+    List with one dict(code, body, rolled_back) per sub-request, in the order of
+    sub_requests. Once a chunk has failed and atomic is set or
+    continue_on_error is not, the remaining sub-requests are not submitted and
+    their code is None.
+    '''
+    headers = dict(Accept='application/json')
+    headers['Content-Type'] = 'application/json'
+    url = manager_url + '/batch'
+    if atomic:
+        url += '?atomic=true'
+    # The sub-request uris are relative to /api
+    uri_prefix = urlparse.urlparse(manager_url).path.replace('/api', '', 1)
+
+    results = []
+    for start in range(0, len(sub_requests), chunk_size):
+        chunk = sub_requests[start:start + chunk_size]
+        batch = dict(continue_on_error=continue_on_error, requests=[])
+        for sub_request in chunk:
+            item = dict(uri=uri_prefix + sub_request['uri'], method=sub_request['method'])
+            if sub_request.get('body') is not None:
+                item['body'] = sub_request['body']
+            batch['requests'].append(item)
+        rc, resp = request(url, data=json.dumps(batch), headers=headers, method='POST',
+                           timeout=timeout, validate_certs=validate_certs,
+                           url_username=url_username, url_password=url_password)
+        rolled_back = bool(resp.get('rolled_back'))
+        chunk_results = resp.get('results', [])
+        for index in range(len(chunk)):
+            if index < len(chunk_results):
+                results.append(dict(code=chunk_results[index].get('code'),
+                                    body=chunk_results[index].get('body'),
+                                    rolled_back=rolled_back))
+            else:
+                results.append(dict(code=None, body=None, rolled_back=rolled_back))
+        if resp.get('has_errors') and (atomic or not continue_on_error):
+            break
+    for sub_request in sub_requests[len(results):]:
+        results.append(dict(code=None, body=None, rolled_back=False))
+    return results
+
+def is_batch_request_successful(result):
+    return result['code'] is not None and result['code'] < 400 and not result['rolled_back']
+
 def get_certificate_string(crt_file):
     '''
     param: crt_file is the file containing the public key string
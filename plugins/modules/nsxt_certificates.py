@@ -112,9 +112,10 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request, get_certificate_string, get_private_key_string
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
 from ansible.module_utils._text import to_native
 
 def update_params_with_pem_encoding(certificate_params):
@@ -136,23 +137,12 @@ def get_certificate_params(args=None):
             args.pop(key, None)
     return args
 
-def get_certificates(module, manager_url, mgr_username, mgr_password, validate_certs):
-  try:
-    (rc, resp) = request(manager_url+ '/trust-management/certificates', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-  except Exception as err:
-    module.fail_json(msg='Error accessing trust management certificates. Error [%s]' % (to_native(err)))
-  return resp
-
 def get_certificate_with_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
   '''
   result: returns the certificate object with the display name provided
   '''
-  certificates = get_certificates(module, manager_url, mgr_username, mgr_password, validate_certs)
-  for certificate in certificates['results']:
-     if certificate.__contains__('display_name') and certificate['display_name'] == display_name:
-        return certificate
-  return None
+  return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                        '/trust-management/certificates', display_name)
 
 def main():
   argument_spec = dict()
@@ -203,7 +193,6 @@ def main():
     except Exception as err:
       module.fail_json(msg="Failed to add certificate.\n Error: [%s].\n Request_body[%s]." % (to_native(err), request_data))
 
-    time.sleep(5)
     module.exit_json(changed=True, result=resp, message="certificate created. Response: [%s]" % str(resp))
 
   elif state == 'absent': 
@@ -217,7 +206,6 @@ def main():
     except Exception as err:
       module.fail_json(msg="Failed to delete certificate with display name \'%s\'. Error[%s]." % (display_name, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=certificate_id, message="Certificate with certificate id: %s deleted." % certificate_id)
 
 
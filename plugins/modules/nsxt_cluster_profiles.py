@@ -81,6 +81,8 @@ RETURN = '''# '''
 import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import contains
 from ansible.module_utils._text import to_native
 
 
@@ -93,47 +95,9 @@ def get_cluster_profiles_params(args=None):
             args.pop(key, None)
     return args
 
-def get_cluster_profiles(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/cluster-profiles', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing edge clusters. Error [%s]' % (to_native(err)))
-    return resp
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    module.fail_json(msg='No id exist with display name %s' % display_name)
-
-def cmp_dict(dict1, dict2):
-    for k2, v2 in dict2.items():
-        found = False
-        if k2 not in dict1:
-            continue
-        if type(v2) != list and dict1[k2] != dict2[k2]:
-            return False
-        for obj2 in v2:
-            for obj1 in dict1[k2]:
-                if all(item in obj1.items() for item in obj2.items()):
-                           found = True
-        if not found:
-            return False
-    return True
-
 def get_cluster_profiles_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    cluster_profiles = get_cluster_profiles(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for cluster_profile in cluster_profiles['results']:
-        if cluster_profile.__contains__('display_name') and cluster_profile['display_name'] == display_name:
-            return cluster_profile
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/cluster-profiles', display_name)
 
 # def ordered(obj):
 #     if isinstance(obj, dict):
@@ -173,7 +137,7 @@ def check_for_update(module, manager_url, mgr_username, mgr_password, validate_c
     if not existing_edge_cluster.__contains__('standby_relocation_config') and cluster_profiles_body.__contains__('standby_relocation_config'):
         return True
     if existing_edge_cluster.__contains__('standby_relocation_config') and cluster_profiles_body.__contains__('standby_relocation_config') and \
-        not cmp_dict(existing_edge_cluster['standby_relocation_config'], cluster_profiles_body['standby_relocation_config']):
+        not contains(existing_edge_cluster['standby_relocation_config'], cluster_profiles_body['standby_relocation_config']):
         return True
     return False
 
@@ -181,11 +145,8 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
     return cluster_profile_params
 
 def get_profile_id_from_profile_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    cluster_profiles = get_cluster_profiles(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for cluster_profile in cluster_profiles['results']:
-        if cluster_profile.__contains__('display_name') and cluster_profile['display_name'] == display_name:
-            return cluster_profile['id']
-    module.fail_json(msg='No id exist with display name %s' % display_name)
+    return get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                    '/cluster-profiles', display_name)
 
 def update_params_with_profile_id(module, manager_url, mgr_username, mgr_password, validate_certs, edge_cluster_params):
     if edge_cluster_params.__contains__('cluster_profile_bindings'):
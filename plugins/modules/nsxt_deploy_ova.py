@@ -169,6 +169,11 @@ options:
         description: IP Protocol
         required: false
         type: 'str'
+    timing_log:
+        description: "Path of a local file to which the timings of the
+                      deployment are appended, as one JSON line."
+        required: false
+        type: 'str'
 requirements:
     - PyVmOmi - Python library for vCenter api.
     - OVF Tools - Ovftool is used for ovf deployment.
@@ -206,28 +211,29 @@ EXAMPLES = '''
 
 '''
 
-RETURN = '''# '''
+RETURN = '''
+timings:
+    description: "Seconds spent validating the source and the target
+                  (validation), uploading the disks (disk_upload) and powering
+                  on the VM (power_on), the total, the last progress
+                  percentage reported by ovftool and, for a local source,
+                  the uploaded bytes and bytes_per_second."
+    returned: when ovftool ran
+    type: dict
+'''
 import requests
 import ssl
 
 from pyVim.connect import SmartConnect
 from pyVmomi import vim, vmodl
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vcenter_utils import get_name_index
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.ova_utils import ova_argument_spec, get_ovftool_command, \
+    get_ova_source, get_source_size, run_ovftool, OVA_REQUIRED_TOGETHER
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import append_json_line
 
 
 def find_virtual_machine(content, searched_vm_name):
-    virtual_machines = get_all_objs(content, [vim.VirtualMachine])
-    for vm in virtual_machines:
-        if vm.name == searched_vm_name:
-            return vm
-    return None
-
-
-def get_all_objs(content, vimtype):
-    obj = {}
-    container = content.viewManager.CreateContainerView(content.rootFolder, vimtype, True)
-    for managed_object_ref in container.view:
-        obj.update({managed_object_ref: managed_object_ref.name})
-    return obj
+    return get_name_index(content, vim.VirtualMachine).get(searched_vm_name)
 
 
 def connect_to_api(vchost, vc_user, vc_pwd):
@@ -245,43 +251,9 @@ def connect_to_api(vchost, vc_user, vc_pwd):
 
 def main():
     module = AnsibleModule(
-        argument_spec=dict(
-            ovftool_path=dict(type='str'),
-            folder=dict(required=False, type='str'),
-            datacenter=dict(required=True, type='str'),
-            datastore=dict(required=True, type='str'),
-            portgroup=dict(required=True, type='str'),
-            portgroup_ext=dict(type='str'),
-            portgroup_transport=dict(type='str'),
-            cluster=dict(required=True, type='str'),
-            vmname=dict(required=True, type='str'),
-            hostname=dict(required=True, type='str'),
-            dns_server=dict(required=True, type='str'),
-            ntp_server=dict(required=True, type='str'),
-            dns_domain=dict(required=True, type='str'),
-            gateway=dict(required=True, type='str'),
-            gateway6_0=dict(type='str'),
-            ip_address=dict(required=True, type='str'),
-            ip_address6_0=dict(type='str'),
-            netmask=dict(required=True, type='str'),
-            netmask6_0=dict(type='str'),
-            admin_password=dict(required=True, type='str', no_log=True),
-            cli_password=dict(required=True, type='str', no_log=True),
-            ssh_enabled=dict(default=False),
-            allow_ssh_root_login=dict(default=False),
-            deployment_size=dict(default='medium', type='str'),
-            path_to_ova=dict(required=True, type='str'),
-            ova_file=dict(required=True, type='str'),
-            disk_mode=dict(default='thin'),
-            vcenter=dict(required=True, type='str'),
-            vcenter_user=dict(required=True, type='str'),
-            vcenter_passwd=dict(required=True, type='str', no_log=True),
-            extra_para=dict(type='str'),
-            role=dict(required=True, type='str'),
-            ip_protocol=dict(required=False, type='str')
-        ),
+        argument_spec=ova_argument_spec(),
         supports_check_mode=True,
-        required_together=[['gateway6_0', 'ip_address6_0', 'netmask6_0'], ['portgroup_ext', 'portgroup_transport']]
+        required_together=OVA_REQUIRED_TOGETHER
     )
 
     try:
@@ -297,77 +269,29 @@ def main():
     if nsx_manager_vm:
         module.exit_json(changed=False, msg='A VM with the name {} was already present'.format(module.params['vmname']))
 
-    ovftool_exec = '{}/ovftool'.format(module.params['ovftool_path'])
-    ovf_command = [ovftool_exec]
-
-    ovf_base_options = ['--acceptAllEulas', '--skipManifestCheck', '--X:injectOvfEnv', '--powerOn', '--noSSLVerify',
-                        '--allowExtraConfig', '--diskMode={}'.format(module.params['disk_mode']),
-                        '--datastore={}'.format(module.params['datastore']),
-                        '--name={}'.format(module.params['vmname'])
-                        ]
-
-    if module.params['ip_protocol']:
-        ovf_base_options.extend(['--ipProtocol={}'.format(module.params['ip_protocol'])])
-
-    if module.params['portgroup_ext']:
-        ovf_base_options.extend(['--net:Network 0={}'.format(module.params['portgroup']),
-                                 '--net:Network 1={}'.format(module.params['portgroup_ext']),
-                                 '--net:Network 2={}'.format(module.params['portgroup_transport']),
-                                 '--net:Network 3={}'.format(module.params['portgroup'])])
-    else:
-        ovf_base_options.extend(['--network={}'.format(module.params['portgroup'])])
-    ovf_command.extend(ovf_base_options)
-
-    ovf_deployement_size = ['--deploymentOption={}'.format(module.params['deployment_size'])]
-    ovf_command.extend(ovf_deployement_size)
-
-    ovf_ext_prop = ['--prop:nsx_hostname={}'.format(module.params['hostname']),
-                    '--prop:nsx_dns1_0={}'.format(module.params['dns_server']),
-                    '--prop:nsx_domain_0={}'.format(module.params['dns_domain']),
-                    '--prop:nsx_ntp_0={}'.format(module.params['ntp_server']),
-                    '--prop:nsx_gateway_0={}'.format(module.params['gateway']),
-                    '--prop:nsx_ip_0={}'.format(module.params['ip_address']),
-                    '--prop:nsx_netmask_0={}'.format(module.params['netmask']),
-                    '--prop:nsx_passwd_0={}'.format(module.params['admin_password']),
-                    '--prop:nsx_cli_passwd_0={}'.format(module.params['cli_password']),
-                    '--prop:nsx_isSSHEnabled={}'.format(module.params['ssh_enabled']),
-                    '--prop:nsx_allowSSHRootLogin={}'.format(module.params['allow_ssh_root_login']),
-                    '--prop:nsx_role={}'.format(module.params['role'])]
-    ovf_command.extend(ovf_ext_prop)
-
-    if module.params['extra_para']:
-        ovf_command.extend(['--prop:extraPara={}'.format(module.params['extra_para'])])
-
-    if module.params['gateway6_0']:
-        ovf_command.extend(['--prop:nsx_gateway6_0={}'.format(module.params['gateway6_0'])])
-
-    if module.params['ip_address6_0']:
-        ovf_command.extend(['--prop:nsx_ip6_0={}'.format(module.params['ip_address6_0'])])
-
-    if module.params['netmask6_0']:
-        ovf_command.extend(['--prop:nsx_netmask6_0={}'.format(module.params['netmask6_0'])])
-
-    ova_file = '{}/{}'.format(module.params['path_to_ova'], module.params['ova_file'])
-    ovf_command.append(ova_file)
-
-    vi_string = 'vi://{}:{}@{}/'.format(module.params['vcenter_user'],
-                                        module.params['vcenter_passwd'], module.params['vcenter'])
-    if module.params.__contains__('folder') and module.params['folder']:
-        vi_string = vi_string + module.params['folder']
-
-    vi_string = vi_string + '/{}/host/{}/'.format(module.params['datacenter'], module.params['cluster'])
-
-    ovf_command.append(vi_string)
+    ovf_command = get_ovftool_command(module.params)
 
     if module.check_mode:
         module.exit_json(changed=True, debug_out=ovf_command)
 
-    ova_tool_result = module.run_command(ovf_command)
+    try:
+        result = run_ovftool(ovf_command, output_lines=None, source_size=get_source_size(get_ova_source(module.params)))
+    except (OSError, IOError) as err:
+        module.fail_json(msg='Failed to run ovftool: {}, the comand was {}'.format(err, ovf_command))
+    ova_tool_result = [result['rc'], result['output'], '']
+    if module.params['timing_log']:
+        try:
+            append_json_line(module.params['timing_log'], dict(vmname=module.params['vmname'], rc=result['rc'],
+                                                                timings=result['timings']))
+        except (OSError, IOError) as err:
+            module.fail_json(msg='Failed to write the timing log {}: {}'.format(module.params['timing_log'], err),
+                             ova_tool_result=ova_tool_result, timings=result['timings'])
 
     if ova_tool_result[0] != 0:
-        module.fail_json(msg='Failed to deploy OVA, error message from ovftool is: {}, the comand was {}'.format(ova_tool_result[1], ovf_command))
+        module.fail_json(msg='Failed to deploy OVA, error message from ovftool is: {}, the comand was {}'.format(ova_tool_result[1], ovf_command),
+                         timings=result['timings'])
 
-    module.exit_json(changed=True, ova_tool_result=ova_tool_result)
+    module.exit_json(changed=True, ova_tool_result=ova_tool_result, timings=result['timings'])
 
 from ansible.module_utils.basic import *
 
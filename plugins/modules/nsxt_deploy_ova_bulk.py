@@ -0,0 +1,464 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+DOCUMENTATION = '''
+---
+module: nsxt_deploy_ova_bulk
+short_description: Deploys multiple NSXT appliances
+description: "Deploys a list of NSXT appliances, running up to
+              max_concurrent_deployments ovftool processes at the same time.
+              The appliances whose VM already exists are skipped.
+
+              The other options of nsxt_deploy_ova are accepted at the top
+              level and apply to all the appliances that don't set them."
+version_added: "3.2"
+author: Rahul Raghuvanshi
+options:
+    appliances:
+        description: "Appliances to deploy. Each appliance accepts the
+                      options of nsxt_deploy_ova except ovftool_path, vcenter,
+                      vcenter_user, vcenter_passwd and timing_log. vmname, hostname and
+                      ip_address are required. The other options default to
+                      the value set at the top level of the task, and the ones
+                      required by nsxt_deploy_ova must be set at one level or
+                      the other."
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            vmname:
+                description: Name of VM
+                required: true
+                type: 'str'
+            hostname:
+                description: Name of host
+                required: true
+                type: 'str'
+            ip_address:
+                description: IP Address
+                required: true
+                type: 'str'
+            folder:
+                description: vCenter folder
+                required: false
+                type: 'str'
+            datacenter:
+                description: Datacenter name
+                required: false
+                type: 'str'
+            datastore:
+                description: Data Store
+                required: false
+                type: 'str'
+            portgroup:
+                description: Port group
+                required: false
+                type: 'str'
+            portgroup_ext:
+                description: External Portgroup. Set together with portgroup_transport.
+                required: false
+                type: 'str'
+            portgroup_transport:
+                description: Transport Port Group. Set together with portgroup_ext.
+                required: false
+                type: 'str'
+            cluster:
+                description: vCenter Cluster
+                required: false
+                type: 'str'
+            dns_server:
+                description: DNS server address
+                required: false
+                type: 'str'
+            ntp_server:
+                description: NTP Server Address
+                required: false
+                type: 'str'
+            dns_domain:
+                description: DNS Domain name
+                required: false
+                type: 'str'
+            gateway:
+                description: Gateway Address
+                required: false
+                type: 'str'
+            gateway6_0:
+                description: Gateway6 Address. Set together with ip_address6_0 and netmask6_0.
+                required: false
+                type: 'str'
+            ip_address6_0:
+                description: IPv6 Address. Set together with gateway6_0 and netmask6_0.
+                required: false
+                type: 'str'
+            netmask:
+                description: Netmask
+                required: false
+                type: 'str'
+            netmask6_0:
+                description: Netmask6. Set together with gateway6_0 and ip_address6_0.
+                required: false
+                type: 'str'
+            admin_password:
+                description: Admin Password
+                required: false
+                type: 'str'
+                no_log: true
+            cli_password:
+                description: CLI Password
+                required: false
+                type: 'str'
+                no_log: true
+            ssh_enabled:
+                description: If ssh is enabled
+                required: false
+            allow_ssh_root_login:
+                description: If SSH root login is allowed
+                required: false
+            deployment_size:
+                description: Size of the deployment
+                required: false
+                type: 'str'
+            path_to_ova:
+                description: Path to OVA file
+                required: false
+                type: 'str'
+            ova_file:
+                description: OVA File name
+                required: false
+                type: 'str'
+            disk_mode:
+                description: Disk mode to used. Thin or thick.
+                required: false
+            extra_para:
+                description: Extra Parameters
+                required: false
+                type: 'str'
+            role:
+                description: Roles
+                required: false
+                type: 'str'
+            ip_protocol:
+                description: IP Protocol
+                required: false
+                type: 'str'
+    max_concurrent_deployments:
+        description: "Maximum number of ovftool processes run at the same
+                      time, at least 1."
+        required: false
+        type: int
+        default: 3
+    deployment_timeout:
+        description: "Seconds after which the ovftool process of an appliance
+                      is killed. No limit if 0."
+        required: false
+        type: int
+        default: 3600
+    ovftool_path:
+        description: Path of ovf tool
+        type: 'str'
+    vcenter:
+        description: vCenter name
+        required: true
+        type: 'str'
+    vcenter_user:
+        description: vCenter username
+        required: true
+        type: 'str'
+    vcenter_passwd:
+        description: vCenter password
+        required: true
+        type: 'str'
+        no_log: true
+    timing_log:
+        description: "Path of a local file to which the timings of each
+                      deployment are appended, as one JSON line."
+        required: false
+        type: 'str'
+    folder:
+        description: vCenter folder
+        required: false
+        type: 'str'
+    datacenter:
+        description: Datacenter name
+        required: false
+        type: 'str'
+    datastore:
+        description: Data Store
+        required: false
+        type: 'str'
+    portgroup:
+        description: Port group
+        required: false
+        type: 'str'
+    portgroup_ext:
+        description: External Portgroup. Set together with portgroup_transport.
+        required: false
+        type: 'str'
+    portgroup_transport:
+        description: Transport Port Group. Set together with portgroup_ext.
+        required: false
+        type: 'str'
+    cluster:
+        description: vCenter Cluster
+        required: false
+        type: 'str'
+    dns_server:
+        description: DNS server address
+        required: false
+        type: 'str'
+    ntp_server:
+        description: NTP Server Address
+        required: false
+        type: 'str'
+    dns_domain:
+        description: DNS Domain name
+        required: false
+        type: 'str'
+    gateway:
+        description: Gateway Address
+        required: false
+        type: 'str'
+    gateway6_0:
+        description: Gateway6 Address. Set together with ip_address6_0 and netmask6_0.
+        required: false
+        type: 'str'
+    ip_address6_0:
+        description: IPv6 Address. Set together with gateway6_0 and netmask6_0.
+        required: false
+        type: 'str'
+    netmask:
+        description: Netmask
+        required: false
+        type: 'str'
+    netmask6_0:
+        description: Netmask6. Set together with gateway6_0 and ip_address6_0.
+        required: false
+        type: 'str'
+    admin_password:
+        description: Admin Password
+        required: false
+        type: 'str'
+        no_log: true
+    cli_password:
+        description: CLI Password
+        required: false
+        type: 'str'
+        no_log: true
+    ssh_enabled:
+        description: If ssh is enabled
+        required: false
+        default: false
+    allow_ssh_root_login:
+        description: If SSH root login is allowed
+        required: false
+        default: false
+    deployment_size:
+        description: Size of the deployment
+        required: false
+        type: 'str'
+        default: 'medium'
+    path_to_ova:
+        description: Path to OVA file
+        required: false
+        type: 'str'
+    ova_file:
+        description: OVA File name
+        required: false
+        type: 'str'
+    disk_mode:
+        description: Disk mode to used. Thin or thick.
+        required: false
+        default: 'thin'
+    extra_para:
+        description: Extra Parameters
+        required: false
+        type: 'str'
+    role:
+        description: Roles
+        required: false
+        type: 'str'
+    ip_protocol:
+        description: IP Protocol
+        required: false
+        type: 'str'
+'''
+
+EXAMPLES = '''
+- name: Deploy the NSX manager cluster
+  nsxt_deploy_ova_bulk:
+    ovftool_path: "/usr/bin"
+    datacenter: "Datacenter"
+    datastore: "data store"
+    portgroup: "VM Network"
+    cluster: "nsxt-cluster"
+    dns_server: "10.161.244.213"
+    dns_domain: "eng.vmware.com"
+    ntp_server: "123.108.200.124"
+    gateway: "10.112.203.253"
+    netmask: "255.255.252.0"
+    admin_password: "Admin!23Admin"
+    cli_password: "Admin!23Admin"
+    path_to_ova: "http://build-squid.eng.vmware.com/build/mts/release/bora-8411846/publish/nsx-unified-appliance/exports/ovf"
+    ova_file: "nsx-unified-appliance-2.2.0.0.0.8411854.ovf"
+    vcenter: "10.161.244.213"
+    vcenter_user: "administrator@vsphere.local"
+    vcenter_passwd: "Admin!23"
+    deployment_size: "small"
+    role: "nsx-manager nsx-controller"
+    appliances:
+    - vmname: "nsx-manager-1"
+      hostname: "nsx-manager-1"
+      ip_address: "10.112.201.24"
+    - vmname: "nsx-manager-2"
+      hostname: "nsx-manager-2"
+      ip_address: "10.112.201.25"
+    - vmname: "nsx-manager-3"
+      hostname: "nsx-manager-3"
+      ip_address: "10.112.201.26"
+      datastore: "other data store"
+'''
+
+RETURN = '''
+results:
+    description: "One entry per appliance with its vmname, whether it was
+                  deployed and, for the deployed ones, the return code of
+                  ovftool, the seconds it ran, whether it timed out, its last
+                  output lines and the timings of its phases as returned by
+                  nsxt_deploy_ova."
+    returned: always
+    type: list
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vcenter_utils import get_vcenter_session
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.ova_utils import ova_argument_spec, \
+    get_ovftool_command, get_ova_source, get_source_size, run_ovftool_commands, OVA_REQUIRED_TOGETHER
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import append_json_line
+
+# Options set once for all the appliances
+SHARED_OPTIONS = ('ovftool_path', 'vcenter', 'vcenter_user', 'vcenter_passwd', 'timing_log')
+# Options specific to each appliance
+APPLIANCE_OPTIONS = ('vmname', 'hostname', 'ip_address')
+
+
+def get_bulk_argument_spec():
+    argument_spec = dict()
+    appliance_spec = dict()
+    for key, spec in ova_argument_spec().items():
+        if key not in APPLIANCE_OPTIONS:
+            argument_spec[key] = dict(spec)
+            if key not in SHARED_OPTIONS:
+                argument_spec[key]['required'] = False
+        if key not in SHARED_OPTIONS:
+            appliance_spec[key] = dict(spec, required=key in APPLIANCE_OPTIONS)
+            appliance_spec[key].pop('default', None)
+    argument_spec.update(appliances=dict(required=True, type='list', elements='dict', options=appliance_spec),
+                         max_concurrent_deployments=dict(required=False, type='int', default=3),
+                         deployment_timeout=dict(required=False, type='int', default=3600))
+    return argument_spec
+
+
+def get_appliance_params(module, appliance):
+    '''
+    result:
+    Options of nsxt_deploy_ova for the appliance, the ones it doesn't set
+    taken from the top level of the task. They are checked as nsxt_deploy_ova
+    checks its own.
+    '''
+    params = dict((key, module.params.get(key)) for key in ova_argument_spec())
+    for key, value in appliance.items():
+        if value is not None:
+            params[key] = value
+    missing = [key for key, spec in ova_argument_spec().items()
+               if spec.get('required') and params.get(key) is None]
+    if missing:
+        module.fail_json(msg='Missing options {} for the appliance {}'.format(', '.join(missing), appliance['vmname']))
+    for group in OVA_REQUIRED_TOGETHER:
+        if any(params.get(key) is not None for key in group) and any(params.get(key) is None for key in group):
+            module.fail_json(msg='Options {} must be set together for the appliance {}'.format(', '.join(group),
+                                                                                             appliance['vmname']))
+    return params
+
+
+def main():
+    module = AnsibleModule(argument_spec=get_bulk_argument_spec(), supports_check_mode=True)
+
+    if module.params['max_concurrent_deployments'] < 1:
+        module.fail_json(msg='max_concurrent_deployments must be at least 1, got {}'.format(
+            module.params['max_concurrent_deployments']))
+
+    vmnames = [appliance['vmname'] for appliance in module.params['appliances']]
+    for vmname in vmnames:
+        if vmnames.count(vmname) > 1:
+            module.fail_json(msg='The appliance {} is specified more than once'.format(vmname))
+
+    # All the pre-existence checks are served by one session and one listing
+    # of the VM names.
+    try:
+        session = get_vcenter_session(module, module.params['vcenter'], module.params['vcenter_user'],
+                                      module.params['vcenter_passwd'], True)
+        virtual_machines = session.get_name_index('vm')
+    except Exception as err:
+        module.fail_json(msg='exception while listing the VMs of vCenter: {}'.format(err))
+
+    results = []
+    ovf_commands = []
+    for appliance in module.params['appliances']:
+        params = get_appliance_params(module, appliance)
+        result = dict(vmname=params['vmname'], deployed=False)
+        if params['vmname'] in virtual_machines:
+            result['msg'] = 'A VM with the name {} was already present'.format(params['vmname'])
+        else:
+            ovf_commands.append((result, get_ovftool_command(params), get_source_size(get_ova_source(params))))
+        results.append(result)
+
+    if not ovf_commands:
+        module.exit_json(changed=False, results=results)
+    if module.check_mode:
+        module.exit_json(changed=True, results=results,
+                         debug_out=[ovf_command for result, ovf_command, source_size in ovf_commands])
+
+    ovftool_results = run_ovftool_commands([ovf_command for result, ovf_command, source_size in ovf_commands],
+                                           max_workers=module.params['max_concurrent_deployments'],
+                                           timeout=module.params['deployment_timeout'] or None,
+                                           source_sizes=[source_size for result, ovf_command, source_size in ovf_commands])
+    failed = []
+    for (result, ovf_command, source_size), ovftool_result in zip(ovf_commands, ovftool_results):
+        result.update(ovftool_result)
+        if module.params['timing_log']:
+            try:
+                append_json_line(module.params['timing_log'], dict(vmname=result['vmname'], rc=result['rc'],
+                                                                    timings=result['timings']))
+            except (OSError, IOError) as err:
+                module.fail_json(msg='Failed to write the timing log {}: {}'.format(module.params['timing_log'], err),
+                                 results=results)
+        result['deployed'] = ovftool_result['rc'] == 0
+        if not result['deployed']:
+            failed.append(result['vmname'])
+
+    if failed:
+        module.fail_json(changed=len(failed) < len(ovf_commands), results=results,
+                         msg='Failed to deploy the appliances {}'.format(', '.join(failed)))
+    module.exit_json(changed=True, results=results)
+
+
+if __name__ == '__main__':
+    main()
@@ -127,6 +127,7 @@ RETURN = '''# '''
 import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name
 from ansible.module_utils._text import to_native
 
 
@@ -139,32 +140,9 @@ def get_edge_cluster_params(args=None):
             args.pop(key, None)
     return args
 
-def get_edge_clusters(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/edge-clusters', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing edge clusters. Error [%s]' % (to_native(err)))
-    return resp
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    module.fail_json(msg='No id exist with display name %s' % display_name)
-
 def get_edge_clusters_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    edge_clusters = get_edge_clusters(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for edge_cluster in edge_clusters['results']:
-        if edge_cluster.__contains__('display_name') and edge_cluster['display_name'] == display_name:
-            return edge_cluster
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/edge-clusters', display_name)
 
 # def ordered(obj):
 #     if isinstance(obj, dict):
@@ -202,23 +180,12 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
         for transport_node in edge_cluster_params['members']:
             transport_node_name = transport_node.pop('transport_node_name', None)
             transport_node['transport_node_id'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                                    "/transport-nodes", transport_node_name)
+                                                    "/transport-nodes", transport_node_name, filters=dict(node_types='EdgeNode'))
     return edge_cluster_params
 
-def get_cluster_profiles(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/cluster-profiles', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing edge clusters. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_profile_id_from_profile_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    cluster_profiles = get_cluster_profiles(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for cluster_profile in cluster_profiles['results']:
-        if cluster_profile.__contains__('display_name') and cluster_profile['display_name'] == display_name:
-            return cluster_profile['id']
-    module.fail_json(msg='No id exist with display name %s' % display_name)
+    return get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                    '/cluster-profiles', display_name)
 
 def update_params_with_profile_id(module, manager_url, mgr_username, mgr_password, validate_certs, edge_cluster_params):
     if edge_cluster_params.__contains__('cluster_profile_bindings'):
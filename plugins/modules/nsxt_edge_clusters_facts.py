@@ -31,6 +31,8 @@ description: Returns information about the configured edge clusters, which enabl
 
 version_added: "2.7"
 author: Rahul Raghuvanshi
+extends_documentation_fragment:
+    - vmware.ansible_for_nsxt.vmware_nsxt.facts
 options:
     hostname:
         description: Deployed NSX manager hostname.
@@ -59,11 +61,14 @@ RETURN = '''# '''
 
 import json
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_facts, facts_argument_spec
 from ansible.module_utils._text import to_native
 
 def main():
   argument_spec = vmware_argument_spec()
+  argument_spec.update(facts_argument_spec())
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
 
   mgr_hostname = module.params['hostname']
@@ -72,13 +77,12 @@ def main():
   validate_certs = module.params['validate_certs']
   manager_url = 'https://{}/api/v1'.format(mgr_hostname)
 
-  changed = False
   try:
-    (rc, resp) = request(manager_url+ '/edge-clusters', headers=dict(Accept='application/json'),
-                    url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+    communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+    resp = get_facts(communicator, '/edge-clusters', module.params, check_mode=module.check_mode)
   except Exception as err:
     module.fail_json(msg='Error accessing list of edge cluster. Error [%s]' % (to_native(err)))
 
-  module.exit_json(changed=changed, **resp)
+  module.exit_json(**resp)
 if __name__ == '__main__':
 	main()
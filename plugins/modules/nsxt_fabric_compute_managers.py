@@ -135,10 +135,9 @@ RETURN = '''# '''
 import json, time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_certificate_thumbprint, wait_until, OperationFailed
 from ansible.module_utils._text import to_native
-import ssl
-import socket
-import hashlib
 
 def get_fabric_compute_manager_params(args=None):
     args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs']
@@ -150,63 +149,44 @@ def get_fabric_compute_manager_params(args=None):
     return args
 
 def get_thumb(module):
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(10)
-    wrappedSocket = ssl.wrap_socket(sock)
     try:
-      wrappedSocket.connect((module.params['server'], 443))
-    except:
+      thumb_sha256 = get_certificate_thumbprint(module.params['server'], timeout=10)
+    except Exception:
       module.fail_json(msg='Connection error while fatching thumbprint for server [%s].' % module.params['server'])
-    else:
-      der_cert_bin = wrappedSocket.getpeercert(True)
-      pem_cert = ssl.DER_cert_to_PEM_cert(wrappedSocket.getpeercert(True))
-      print(pem_cert)
-
-      #Thumbprint
-      thumb_sha256 = hashlib.sha256(der_cert_bin).hexdigest()
-      wrappedSocket.close()
-      # The API call expects the Thumbprint in Uppercase. While the API call is fixed,
-      # below is a quick fix
-      thumbprint = ""
-      thumbprint = ':'.join(a+b for a,b in zip(thumb_sha256[::2], thumb_sha256[1::2]))
-      return thumbprint.upper()
 
-def get_fabric_compute_managers(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/fabric/compute-managers', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing fabric compute manager. Error [%s]' % (to_native(err)))
-    return resp
+    # The API call expects the Thumbprint in Uppercase. While the API call is fixed,
+    # below is a quick fix
+    thumbprint = ':'.join(a+b for a,b in zip(thumb_sha256[::2], thumb_sha256[1::2]))
+    return thumbprint.upper()
 
 def get_compute_manager_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    compute_managers = get_fabric_compute_managers(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for compute_manager in compute_managers['results']:
-        if compute_manager.__contains__('display_name') and compute_manager['display_name'] == display_name:
-            return compute_manager
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/fabric/compute-managers', display_name)
 
 def wait_till_create(id, module, manager_url, mgr_username, mgr_password, validate_certs):
+    down_counter = [0]
+
+    def is_connected():
+        (rc, resp) = request(manager_url+ '/fabric/compute-managers/%s/status'% id, headers=dict(Accept='application/json'),
+                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+        if resp['registration_status'] == "REGISTERING" or resp['registration_status'] == "UNREGISTERED":
+            return False
+        elif resp['registration_status'] == "REGISTERED":
+          if resp["connection_status"] == "CONNECTING":
+              return False
+          elif resp["connection_status"] == "DOWN" and down_counter[0] < 3:
+            down_counter[0] = down_counter[0] + 1
+            return False
+          elif resp["connection_status"] == "UP":
+            return True
+          raise OperationFailed('Error connecting to compute manager. Connection status : %s'%(str(resp["connection_status"])))
+        raise OperationFailed('Error in compute manager status: %s'%(str(resp['registration_status'])))
+    # Polled every 10 seconds, so that a compute manager may be DOWN for
+    # about 30 seconds after its registration
     try:
-      down_counter = 0
-      while True:
-          (rc, resp) = request(manager_url+ '/fabric/compute-managers/%s/status'% id, headers=dict(Accept='application/json'),
-                        url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-          if resp['registration_status'] == "REGISTERING" or resp['registration_status'] == "UNREGISTERED":
-              time.sleep(10)
-          elif resp['registration_status'] == "REGISTERED":
-            if resp["connection_status"] == "CONNECTING":
-                time.sleep(10)
-            elif resp["connection_status"] == "DOWN" and down_counter < 3:
-              time.sleep(10)
-              down_counter = down_counter + 1
-            elif resp["connection_status"] == "UP":
-              time.sleep(5)
-              return
-            else:
-              module.fail_json(msg= 'Error connecting to compute manager. Connection status : %s'%(str(resp["connection_status"])))
-          else:
-              module.fail_json(msg= 'Error in compute manager status: %s'%(str(resp['registration_status'])))
+      wait_until(is_connected, time_out=3600, interval=10, max_interval=10)
+    except OperationFailed as err:
+      module.fail_json(msg=to_native(err))
     except Exception as err:
       module.fail_json(msg='Error accessing compute manager status. Error [%s]' % (to_native(err)))
 
@@ -217,7 +197,6 @@ def wait_till_delete(id, module, manager_url, mgr_username, mgr_password, valida
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
           time.sleep(10)
     except Exception as err:
-      time.sleep(5)
       return
 
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, compute_manager_with_ids):
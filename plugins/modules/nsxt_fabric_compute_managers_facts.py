@@ -27,6 +27,8 @@ short_description: Return the List of Compute managers
 description: Returns information about all compute managers.
 version_added: "2.7"
 author: Rahul Raghuvanshi
+extends_documentation_fragment:
+    - vmware.ansible_for_nsxt.vmware_nsxt.facts
 options:
     hostname:
         description: Deployed NSX manager hostname.
@@ -56,13 +58,19 @@ RETURN = '''# '''
 
 import json
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_facts, facts_argument_spec
 from ansible.module_utils.urls import open_url, fetch_url
 from ansible.module_utils._text import to_native
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 
+# Query parameters the API filters the compute managers on
+SERVER_FILTERS = ('origin_type', 'server')
+
 def main():
   argument_spec = vmware_argument_spec()
+  argument_spec.update(facts_argument_spec())
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
 
@@ -73,13 +81,12 @@ def main():
 
   manager_url = 'https://{}/api/v1'.format(mgr_hostname)
 
-  changed = False
   try:
-    (rc, resp) = request(manager_url+ '/fabric/compute-managers', headers=dict(Accept='application/json'),
-                    url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+    communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+    resp = get_facts(communicator, '/fabric/compute-managers', module.params, server_filters=SERVER_FILTERS, check_mode=module.check_mode)
   except Exception as err:
     module.fail_json(msg='Error accessing fabric compute manager. Error [%s]' % (to_native(err)))
 
-  module.exit_json(changed=changed, **resp)
+  module.exit_json(**resp)
 if __name__ == '__main__':
 	main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2019 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+DOCUMENTATION = '''
+---
+module: nsxt_inventory_facts
+short_description: 'Lists multiple Manager and Policy API collections'
+description: "Lists a set of Manager API and Policy API collections in one
+              task, up to max_concurrent_requests of them at the same time.
+              Each collection is returned or written to its own file, along
+              with the number of its results and the seconds its listing took.
+
+              The collections are listed with the options of the facts
+              modules, e.g. nsxt_logical_ports_facts. Their filters are
+              applied while the results are received."
+version_added: '3.2'
+author: 'Rahul Raghuvanshi'
+options:
+    hostname:
+        description: 'Deployed NSX manager hostname.'
+        required: true
+        type: str
+    username:
+        description: 'The username to authenticate with the NSX manager.'
+        required: true
+        type: str
+    password:
+        description: 'The password to authenticate with the NSX manager.'
+        required: true
+        type: str
+    collections:
+        description: "Collections to be listed. All the known collections
+                      are listed if not specified."
+        required: false
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description: "Name of the collection in the result. The known
+                              collections, e.g. logical_switches or
+                              policy_segments, don't need an endpoint."
+                required: true
+                type: str
+            api:
+                description: 'API the endpoint belongs to.'
+                required: false
+                type: str
+                choices:
+                    - manager
+                    - policy
+                default: manager
+            endpoint:
+                description: "Endpoint of the collection, relative to
+                              /api/v1 or /policy/api/v1, e.g. /logical-ports
+                              or /infra/segments."
+                required: false
+                type: str
+            filters:
+                description: "Dict from an attribute of the results, or a
+                              dotted path, to its expected value or to a list
+                              of accepted values."
+                required: false
+                type: dict
+            page_size:
+                description: 'Maximum number of results returned per request.'
+                required: false
+                type: int
+            max_results:
+                description: 'Maximum number of results listed.'
+                required: false
+                type: int
+            fields:
+                description: 'Attributes of the results to be returned.'
+                required: false
+                type: list
+                elements: str
+            sort_by:
+                description: 'Attribute the NSX manager sorts the results on.'
+                required: false
+                type: str
+            sort_ascending:
+                description: 'Whether the results are sorted in ascending order.'
+                required: false
+                type: bool
+            dest:
+                description: "File the results are written to, one JSON object
+                              per line, gzip compressed if its name ends with
+                              .gz. It is only replaced if its content differs,
+                              and left as it is in check mode."
+                required: false
+                type: path
+            since:
+                description: "Time, in milliseconds since epoch, from which
+                              the returned results were modified."
+                required: false
+                type: int
+            state_file:
+                description: "File keeping a snapshot of the collection
+                              between runs, so that only the results created,
+                              modified or deleted since the previous run are
+                              returned."
+                required: false
+                type: path
+    dest_dir:
+        description: "Directory the collections without dest are written to,
+                      as <name>.jsonl.gz. The collections are returned if
+                      neither is specified."
+        required: false
+        type: path
+    max_concurrent_requests:
+        description: 'Maximum number of collections listed at the same time,
+                      at least 1.'
+        required: false
+        type: int
+        default: 4
+'''
+
+EXAMPLES = '''
+- name: Snapshot the site
+  nsxt_inventory_facts:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      dest_dir: /tmp/nsx-snapshot
+      max_concurrent_requests: 8
+
+- name: List the segments and the VIF ports
+  nsxt_inventory_facts:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      collections:
+        - name: policy_segments
+          fields:
+            - id
+            - display_name
+        - name: vif_ports
+          endpoint: /logical-ports
+          filters:
+            attachment.attachment_type: VIF
+'''
+
+RETURN = '''
+collections:
+    description: "Dict from the name of each collection to its endpoint,
+                  result_count and elapsed seconds, along with its results,
+                  or with the dest, size and sha256 of the file it was written
+                  to, or with its error."
+    returned: always
+    type: dict
+elapsed:
+    description: 'Seconds the listing of all the collections took.'
+    returned: always
+    type: float
+'''
+
+import os
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_facts_concurrently, facts_argument_spec
+
+# Name -> (API, endpoint) of the collections listed by default
+KNOWN_COLLECTIONS = {
+    'certificates': ('manager', '/trust-management/certificates'),
+    'compute_managers': ('manager', '/fabric/compute-managers'),
+    'edge_clusters': ('manager', '/edge-clusters'),
+    'ip_blocks': ('manager', '/pools/ip-blocks'),
+    'ip_pools': ('manager', '/pools/ip-pools'),
+    'logical_ports': ('manager', '/logical-ports'),
+    'logical_router_ports': ('manager', '/logical-router-ports'),
+    'logical_routers': ('manager', '/logical-routers'),
+    'logical_switches': ('manager', '/logical-switches'),
+    'transport_node_collections': ('manager', '/transport-node-collections'),
+    'transport_node_profiles': ('manager', '/transport-node-profiles'),
+    'transport_nodes': ('manager', '/transport-nodes'),
+    'transport_zones': ('manager', '/transport-zones'),
+    'uplink_profiles': ('manager', '/host-switch-profiles'),
+    'policy_gateway_policies': ('policy', '/infra/domains/default/gateway-policies'),
+    'policy_groups': ('policy', '/infra/domains/default/groups'),
+    'policy_ip_pools': ('policy', '/infra/ip-pools'),
+    'policy_security_policies': ('policy', '/infra/domains/default/security-policies'),
+    'policy_segments': ('policy', '/infra/segments'),
+    'policy_services': ('policy', '/infra/services'),
+    'policy_tier0s': ('policy', '/infra/tier-0s'),
+    'policy_tier1s': ('policy', '/infra/tier-1s'),
+}
+
+API_URLS = dict(manager='https://{}/api/v1', policy='https://{}/policy/api/v1')
+
+def get_collection_spec():
+  collection_spec = facts_argument_spec()
+  collection_spec.update(name=dict(required=True, type='str'),
+                         api=dict(required=False, type='str', choices=['manager', 'policy'], default='manager'),
+                         endpoint=dict(required=False, type='str'))
+  return collection_spec
+
+def get_collections(module):
+  '''
+  Returns the collections to be listed, with the communicator of their API,
+  their endpoint and the params of get_facts.
+  '''
+  mgr_hostname = module.params['hostname']
+  communicators = dict((api, get_manager_communicator(url.format(mgr_hostname), module.params['username'],
+                                                      module.params['password'], module.params['validate_certs']))
+                       for api, url in API_URLS.items())
+  requested = module.params['collections']
+  if requested is None:
+    requested = [dict(name=name) for name in sorted(KNOWN_COLLECTIONS)]
+  collections = []
+  names = set()
+  for collection in requested:
+    params = dict(collection)
+    name = params.pop('name')
+    if name in names:
+      module.fail_json(msg='The collection %s is specified more than once' % name)
+    names.add(name)
+    api, endpoint = params.pop('api', None) or 'manager', params.pop('endpoint', None)
+    if endpoint is None:
+      if name not in KNOWN_COLLECTIONS:
+        module.fail_json(msg='The endpoint of the collection %s must be specified' % name)
+      api, endpoint = KNOWN_COLLECTIONS[name]
+    if not params.get('dest') and module.params['dest_dir']:
+      params['dest'] = os.path.join(module.params['dest_dir'], '%s.jsonl.gz' % name)
+    collections.append(dict(name=name, communicator=communicators[api], endpoint=endpoint, params=params))
+  return collections
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(collections=dict(required=False, type='list', elements='dict', options=get_collection_spec()),
+                       dest_dir=dict(required=False, type='path'),
+                       max_concurrent_requests=dict(required=False, type='int', default=4))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+
+  if module.params['max_concurrent_requests'] < 1:
+    module.fail_json(msg='max_concurrent_requests must be at least 1, got %d' % module.params['max_concurrent_requests'])
+
+  collections = get_collections(module)
+  if module.params['dest_dir'] and not os.path.isdir(module.params['dest_dir']) and not module.check_mode:
+    os.makedirs(module.params['dest_dir'])
+
+  start_time = time.time()
+  facts = get_facts_concurrently(collections, max_workers=module.params['max_concurrent_requests'],
+                                 check_mode=module.check_mode)
+  elapsed = round(time.time() - start_time, 3)
+
+  failed = sorted(name for name, collection_facts in facts.items() if 'error' in collection_facts)
+  if failed:
+    module.fail_json(msg='Error listing the collections %s' % ', '.join(failed), collections=facts, elapsed=elapsed)
+  changed = any(collection_facts['changed'] for collection_facts in facts.values())
+  module.exit_json(changed=changed, collections=facts, elapsed=elapsed)
+
+if __name__ == '__main__':
+  main()
@@ -83,9 +83,10 @@ EXAMPLES = '''
 RETURN = '''# '''
 
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
 from ansible.module_utils._text import to_native
 
 def get_ip_block_params(args=None):
@@ -97,20 +98,9 @@ def get_ip_block_params(args=None):
             args.pop(key, None)
     return args
 
-def get_ip_blocks(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/pools/ip-blocks', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing ip blocks. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_ip_block_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    ip_blocks = get_ip_blocks(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for ip_block in ip_blocks['results']:
-        if ip_block.__contains__('display_name') and ip_block['display_name'] == display_name:
-            return ip_block
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/pools/ip-blocks', display_name)
 
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, ip_block_params):
     existing_ip_block = get_ip_block_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, ip_block_params['display_name'])
@@ -161,7 +151,6 @@ def main():
                                 url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
       except Exception as err:
           module.fail_json(msg="Failed to add ip block. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="IP block with display name %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -176,7 +165,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update ip block with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="ip block with block id %s updated." % id)
 
   elif state == 'absent':
@@ -192,7 +180,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete ip block with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="ip block with block id %s deleted." % id)
 
 
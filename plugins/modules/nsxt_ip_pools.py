@@ -93,9 +93,11 @@ EXAMPLES = '''
 RETURN = '''# '''
 
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.ip_pool_utils import ip_pool_needs_update
 from ansible.module_utils._text import to_native
 
 def get_ip_pool_params(args=None):
@@ -107,20 +109,9 @@ def get_ip_pool_params(args=None):
             args.pop(key, None)
     return args
 
-def get_ip_pools(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/pools/ip-pools', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing ip pools. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_ip_pool_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    ip_pools = get_ip_pools(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for ip_pool in ip_pools['results']:
-        if ip_pool.__contains__('display_name') and ip_pool['display_name'] == display_name:
-            return ip_pool
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/pools/ip-pools', display_name)
 
 # def ordered(obj):
 #     if isinstance(obj, dict):
@@ -134,9 +125,7 @@ def check_for_update(module, manager_url, mgr_username, mgr_password, validate_c
     existing_ip_pool = get_ip_pool_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, ip_pool_params['display_name'])
     if existing_ip_pool is None:
         return False
-    if  existing_ip_pool.__contains__('subnets') and ip_pool_params.__contains__('subnets') and existing_ip_pool['subnets'] != ip_pool_params['subnets']:
-        return True
-    return False
+    return ip_pool_needs_update(existing_ip_pool, ip_pool_params)
 
 def main():
   argument_spec = vmware_argument_spec()
@@ -181,7 +170,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to add ip pool. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="IP pool with display name %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -194,7 +182,6 @@ def main():
                                 url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
       except Exception as err:
           module.fail_json(msg="Failed to update ip pool with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="ip pool with pool id %s updated." % id)
 
   elif state == 'absent':
@@ -210,7 +197,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete ip pool with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="ip pool with pool id %s deleted." % id)
 
 
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+DOCUMENTATION = '''
+---
+module: nsxt_ip_pools_bulk
+short_description: 'Create, update or delete multiple IP Pools'
+description: "Brings a list of IP pools to their desired state. The creates,
+              updates and deletes are submitted through the NSX Manager Batch
+              API, batch_size of them per request."
+version_added: '3.2'
+author: 'Rahul Raghuvanshi'
+options:
+    hostname:
+        description: 'Deployed NSX manager hostname.'
+        required: true
+        type: str
+    username:
+        description: 'The username to authenticate with the NSX manager.'
+        required: true
+        type: str
+    password:
+        description: 'The password to authenticate with the NSX manager.'
+        required: true
+        type: str
+    atomic:
+        description: "If true, the requests of a batch are rolled back if one
+                      of them fails, and no further batch is submitted."
+        required: false
+        type: bool
+        default: false
+    batch_size:
+        description: 'Maximum number of requests submitted in one batch.'
+        required: false
+        type: int
+        default: 50
+    ip_pools:
+        description: 'IP pools to be managed. The options of each IP pool are
+                      the ones of nsxt_ip_pools.'
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            display_name:
+                description: 'Display name'
+                required: true
+                type: str
+            state:
+                choices:
+                    - present
+                    - absent
+                description: "State can be either 'present' or 'absent'.
+                              'present' is used to create or update resource.
+                              'absent' is used to delete resource."
+                required: true
+            subnets:
+                description: "Subnets can be IPv4 or IPv6 and they should not overlap. The maximum
+                              number will not exceed 5 subnets."
+                required: false
+                type: 'array of IpPoolSubnet'
+            tags:
+                description: 'Opaque identifiers meaningful to the API user'
+                required: false
+                type: str
+            description:
+                description: 'description of the resource'
+                required: false
+                type: str
+            ip_release_delay:
+                description: 'IP address release delay'
+                required: false
+                type: int
+'''
+
+EXAMPLES = '''
+- name: Create ip pools
+  nsxt_ip_pools_bulk:
+    hostname: "10.192.167.137"
+    username: "admin"
+    password: "Admin!23Admin"
+    validate_certs: False
+    atomic: True
+    ip_pools:
+    - display_name: IPPool-IPV4-1
+      subnets:
+      - allocation_ranges:
+        - start: "10.112.201.28"
+          end: "10.112.201.29"
+        cidr: "10.112.201.0/24"
+      state: "present"
+    - display_name: IPPool-IPV4-2
+      state: "absent"
+'''
+
+RETURN = '''
+results:
+    description: One entry per IP pool with its display_name, id, the action
+                 taken (create, update, delete or none) and, for the submitted
+                 ones, the code of the request and the error if any.
+    returned: always
+    type: list
+'''
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_resource_from_display_name, get_bulk_operation, submit_bulk_operations, bulk_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.ip_pool_utils import ip_pool_needs_update
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import clean_and_get_params
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(bulk_argument_spec())
+  argument_spec.update(ip_pools=dict(required=True, type='list', elements='dict',
+                        options=dict(display_name=dict(required=True, type='str'),
+                        subnets=dict(required=False, type='list'),
+                        tags=dict(required=False, type='list'),
+                        description=dict(required=False, type='str'),
+                        ip_release_delay=dict(required=False, type='int'),
+                        state=dict(required=True, choices=['present', 'absent']))))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+  mgr_hostname = module.params['hostname']
+  mgr_username = module.params['username']
+  mgr_password = module.params['password']
+  validate_certs = module.params['validate_certs']
+  manager_url = 'https://{}/api/v1'.format(mgr_hostname)
+  communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+
+  operations = []
+  for ip_pool in module.params['ip_pools']:
+    state = ip_pool['state']
+    ip_pool_params = clean_and_get_params(ip_pool.copy())
+    existing_ip_pool = get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                      '/pools/ip-pools', ip_pool_params['display_name'])
+    updated = existing_ip_pool is not None and ip_pool_needs_update(existing_ip_pool, ip_pool_params)
+    operations.append(get_bulk_operation('/pools/ip-pools', ip_pool_params['display_name'], state,
+                                         ip_pool_params, existing_ip_pool, updated))
+
+  submit_bulk_operations(module, communicator, operations, 'IP pool')
+
+
+if __name__ == '__main__':
+    main()
@@ -31,6 +31,8 @@ description: Returns information about the configured IP address pools. Informat
 
 version_added: "2.7"
 author: Rahul Raghuvanshi
+extends_documentation_fragment:
+    - vmware.ansible_for_nsxt.vmware_nsxt.facts
 options:
     hostname:
         description: Deployed NSX manager hostname.
@@ -54,19 +56,37 @@ EXAMPLES = '''
     username: "admin"
     password: "Admin!23Admin"
     validate_certs: False
+
+- name: List the IP pools by display name
+  nsxt_ip_pools_facts:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      filters:
+        display_name:
+          - IPPool-IPV4-1
+          - IPPool-IPV4-2
+      fields:
+        - id
+        - display_name
+        - pool_usage.allocated_ids
 '''
 
 RETURN = '''# '''
 
 import json
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_facts, facts_argument_spec
 from ansible.module_utils.urls import open_url, fetch_url
 from ansible.module_utils._text import to_native
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 
 def main():
   argument_spec = vmware_argument_spec()
+  argument_spec.update(facts_argument_spec())
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
 
@@ -77,13 +97,12 @@ def main():
 
   manager_url = 'https://{}/api/v1'.format(mgr_hostname)
 
-  changed = False
   try:
-    (rc, resp) = request(manager_url+ '/pools/ip-pools', headers=dict(Accept='application/json'),
-                    url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+    communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+    resp = get_facts(communicator, '/pools/ip-pools', module.params, check_mode=module.check_mode)
   except Exception as err:
     module.fail_json(msg='Error accessing list of ip pools. Error [%s]' % (to_native(err)))
 
-  module.exit_json(changed=changed, **resp)
+  module.exit_json(**resp)
 if __name__ == '__main__':
 	main()
@@ -72,7 +72,7 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
 from ansible.module_utils._text import to_native
@@ -126,7 +126,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to add license. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, result=resp, message="license with license key %s created." % module.params['license_key'])
 
   elif state == 'absent':
@@ -140,7 +139,6 @@ def main():
     except Exception as err:
       module.fail_json(msg="Failed to delete license with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="license with license key %s deleted." % id)
 
 
@@ -180,9 +180,11 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.logical_port_utils import update_params_with_id, logical_port_needs_update
 from ansible.module_utils._text import to_native
 
 
@@ -195,92 +197,15 @@ def get_logical_port_params(args=None):
             args.pop(key, None)
     return args
 
-def get_logical_ports(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/logical-ports', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing logical ports. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_logical_port_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    logical_ports = get_logical_ports(module, manager_url, mgr_username, mgr_password, validate_certs)
-    if logical_ports and len(logical_ports['results'])>0:
-        for logical_port in logical_ports['results']:
-            if logical_port.__contains__('display_name') and logical_port['display_name'] == display_name:
-                return logical_port
-    return None
-
-def get_transport_nodes(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/transport-nodes', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing transport nodes. Error [%s]' % (to_native(err)))
-    return resp
-
-def get_tn_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    transport_nodes = get_transport_nodes(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for transport_node in transport_nodes['results']:
-        if transport_node.__contains__('display_name') and transport_node['display_name'] == display_name:
-            return transport_node
-    return None
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    module.fail_json(msg='No id exists with display name %s' % display_name)
-
-def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_port_params ):
-    logical_port_params['logical_switch_id'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                            '/logical-switches', logical_port_params.pop('logical_switch_name', None))
-    host_switch_profile_ids = []
-    host_switch_profiles = logical_port_params.pop('switching_profiles', None)
-    if host_switch_profiles:
-        for host_switch_profile in host_switch_profiles:
-            profile_obj = {}
-            profile_obj['value'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                                    "/switching-profiles", host_switch_profile['name'])
-            profile_obj['key'] = host_switch_profile['type']
-            host_switch_profile_ids.append(profile_obj)
-    logical_port_params['switching_profile_ids'] = host_switch_profile_ids
-
-    if logical_port_params.__contains__('attachment') and logical_port_params['attachment'].__contains__('context') and \
-        logical_port_params['attachment']['context'].__contains__('transport_node_name'):
-        logical_port_params['attachment']['context']['transport_node_uuid'] = get_id_from_display_name(module, manager_url, mgr_username, mgr_password,
-                validate_certs, '/transport-nodes', logical_port_params['attachment']['context']['transport_node_name'])
-    return logical_port_params
-
-# def ordered(obj):
-#     if isinstance(obj, dict):
-#         return sorted((k, ordered(v)) for k, v in obj.items())
-#     if isinstance(obj, list):
-#         return sorted(ordered(x) for x in obj)
-#     else:
-#         return obj
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/logical-ports', display_name)
 
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, logical_port_with_ids):
     existing_logical_port = get_logical_port_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs, logical_port_with_ids['display_name'])
     if existing_logical_port is None:
         return False
-    if existing_logical_port.__contains__('attachment') and existing_logical_port['attachment'].__contains__('attachment_type') and \
-        logical_port_with_ids.__contains__('attachment') and logical_port_with_ids['attachment'].__contains__('attachment_type') and \
-        (existing_logical_port['attachment']['attachment_type'] != logical_port_with_ids['attachment']['attachment_type'] or \
-        existing_logical_port['attachment']['id'] != logical_port_with_ids['attachment']['id']):
-        return True
-    if existing_logical_port.__contains__('switching_profile_ids') and logical_port_with_ids.__contains__('switching_profile_ids') and \
-        existing_logical_port['switching_profile_ids'] != logical_port_with_ids['switching_profile_ids']:
-        return True
-    if existing_logical_port['admin_state'] != logical_port_with_ids['admin_state']:
-        return True
-    return False
+    return logical_port_needs_update(existing_logical_port, logical_port_with_ids)
 
 def main():
   argument_spec = vmware_argument_spec()
@@ -344,7 +269,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to add logical port. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="Logical port with displayname %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -358,7 +282,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update logical port with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="logical port with id %s updated." % id)
 
   elif state == 'absent':
@@ -374,7 +297,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete logical port with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="Logical port with id %s deleted." % id)
 
 
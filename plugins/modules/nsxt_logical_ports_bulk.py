@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: nsxt_logical_ports_bulk
+short_description: Create, update or delete multiple Logical Ports
+description: "Brings a list of logical switch ports to their desired state. The
+              creates, updates and deletes are submitted through the NSX Manager
+              Batch API, batch_size of them per request. The names of the logical
+              switches, switching profiles and transport nodes are resolved once
+              for the whole list."
+
+version_added: "3.2"
+author: Rahul Raghuvanshi
+options:
+    hostname:
+        description: Deployed NSX manager hostname.
+        required: true
+        type: str
+    username:
+        description: The username to authenticate with the NSX manager.
+        required: true
+        type: str
+    password:
+        description: The password to authenticate with the NSX manager.
+        required: true
+        type: str
+    atomic:
+        description: If true, the requests of a batch are rolled back if one
+                     of them fails, and no further batch is submitted.
+        required: false
+        type: bool
+        default: false
+    batch_size:
+        description: Maximum number of requests submitted in one batch.
+        required: false
+        type: int
+        default: 50
+    logical_ports:
+        description: Logical ports to be managed. Each logical port takes the
+                     options of nsxt_logical_ports.
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            display_name:
+                description: Display name
+                required: true
+                type: str
+            state:
+                choices:
+                - present
+                - absent
+                description: "State can be either 'present' or 'absent'.
+                             'present' is used to create or update resource.
+                             'absent' is used to delete resource."
+                required: true
+            admin_state:
+                description: Represents Desired state of the logical port.
+                             Required when state is present.
+                required: false
+                type: str
+            logical_switch_name:
+                description: Name of logical Switch. Required when state is present.
+                required: false
+                type: str
+            attachment:
+                description: Logical port attachment
+                required: false
+                type: dict
+            switching_profiles:
+                description: List of Switching Profiles name and type
+                required: false
+                type: list
+'''
+
+EXAMPLES = '''
+- name: Create Logical Ports
+  nsxt_logical_ports_bulk:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      logical_ports:
+      - display_name: LP1
+        logical_switch_name: LS1
+        attachment:
+          attachment_type: VIF
+          id: vif1
+        admin_state: UP
+        state: "present"
+      - display_name: LP2
+        logical_switch_name: LS1
+        attachment:
+          attachment_type: VIF
+          id: vif2
+        admin_state: UP
+        state: "present"
+'''
+
+RETURN = '''
+results:
+    description: One entry per logical port with its display_name, id, the
+                 action taken (create, update, delete or none) and, for the
+                 submitted ones, the code of the request and the error if any.
+    returned: always
+    type: list
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_resource_from_display_name, get_bulk_operation, submit_bulk_operations, bulk_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.logical_port_utils import update_params_with_id, logical_port_needs_update
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import clean_and_get_params
+
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(bulk_argument_spec())
+  argument_spec.update(logical_ports=dict(required=True, type='list', elements='dict',
+                        options=dict(display_name=dict(required=True, type='str'),
+                        logical_switch_name=dict(required=False, type='str'),
+                        init_state=dict(required=False, type='str'),
+                        switching_profiles=dict(required=False, type='list'),
+                        attachment=dict(required=False, type='dict'),
+                        admin_state=dict(required=False, type='str'),
+                        extra_configs=dict(required=False, type='list'),
+                        address_bindings=dict(required=False, type='list'),
+                        ignore_address_bindings=dict(required=False, type='list'),
+                        description=dict(required=False, type='str'),
+                        tags=dict(required=False, type='list'),
+                        state=dict(required=True, choices=['present', 'absent'])),
+                        required_if=[['state', 'present', ['logical_switch_name', 'admin_state']]]))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+  mgr_hostname = module.params['hostname']
+  mgr_username = module.params['username']
+  mgr_password = module.params['password']
+  validate_certs = module.params['validate_certs']
+  manager_url = 'https://{}/api/v1'.format(mgr_hostname)
+  communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+
+  operations = []
+  for logical_port in module.params['logical_ports']:
+    state = logical_port['state']
+    logical_port_params = clean_and_get_params(logical_port.copy())
+    display_name = logical_port_params['display_name']
+    existing_logical_port = get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                           '/logical-ports', display_name)
+    updated = False
+    if state == 'present':
+      update_params_with_id(module, manager_url, mgr_username, mgr_password, validate_certs, logical_port_params)
+      updated = existing_logical_port is not None and logical_port_needs_update(existing_logical_port, logical_port_params)
+    operations.append(get_bulk_operation('/logical-ports', display_name, state, logical_port_params,
+                                         existing_logical_port, updated))
+
+  submit_bulk_operations(module, communicator, operations, 'logical port')
+
+
+if __name__ == '__main__':
+    main()
@@ -30,6 +30,8 @@ description: Returns information about all configured logical switch ports. Logi
 
 version_added: "2.7"
 author: Rahul Raghuvanshi
+extends_documentation_fragment:
+    - vmware.ansible_for_nsxt.vmware_nsxt.facts
 options:
     hostname:
         description: Deployed NSX manager hostname.
@@ -53,19 +55,51 @@ EXAMPLES = '''
       username: "admin"
       password: "Admin!23Admin"
       validate_certs: False
+
+- name: List the VIF ports of a logical switch
+  nsxt_logical_ports_facts:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      filters:
+        logical_switch_id: "1ad2ccb0-3d75-4a29-a4f0-a9df1f1b6e2b"
+        attachment.attachment_type: VIF
+      fields:
+        - id
+        - display_name
+        - attachment.id
+      page_size: 500
+
+- name: Write all the logical ports to a compressed file
+  nsxt_logical_ports_facts:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      page_size: 1000
+      dest: /tmp/logical_ports.jsonl.gz
 '''
 
 RETURN = '''# '''
 
 import json
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_facts, facts_argument_spec
 from ansible.module_utils.urls import open_url, fetch_url
 from ansible.module_utils._text import to_native
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 
+# Query parameters the API filters the logical ports on
+SERVER_FILTERS = ('attachment_id', 'attachment_type', 'bridge_cluster_id', 'container_ports_only',
+                  'logical_switch_id', 'parent_vif_id', 'switching_profile_id',
+                  'transport_node_id', 'transport_zone_id')
+
 def main():
   argument_spec = vmware_argument_spec()
+  argument_spec.update(facts_argument_spec())
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
 
@@ -76,13 +110,12 @@ def main():
 
   manager_url = 'https://{}/api/v1'.format(mgr_hostname)
 
-  changed = False
   try:
-    (rc, resp) = request(manager_url+ '/logical-ports', headers=dict(Accept='application/json'),
-                    url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+    communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+    resp = get_facts(communicator, '/logical-ports', module.params, server_filters=SERVER_FILTERS, check_mode=module.check_mode)
   except Exception as err:
     module.fail_json(msg='Error accessing list of logical ports. Error [%s]' % (to_native(err)))
 
-  module.exit_json(changed=changed, **resp)
+  module.exit_json(**resp)
 if __name__ == '__main__':
 	main()
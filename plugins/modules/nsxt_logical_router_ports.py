@@ -384,9 +384,10 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name
 from ansible.module_utils._text import to_native
 
 def get_logical_router_port_params(args=None):
@@ -398,33 +399,10 @@ def get_logical_router_port_params(args=None):
             args.pop(key, None)
     return args
 
-def get_logical_router_ports(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/logical-router-ports', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing logical router ports. Error [%s]' % (to_native(err)))
-    return resp
-
-def get_lr_port_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    logical_router_ports = get_logical_router_ports(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for logical_router_port in logical_router_ports['results']:
-        if logical_router_port.__contains__('display_name') and logical_router_port['display_name'] == display_name:
-            return logical_router_port
-    return None
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    if exit_if_not_found:
-        module.fail_json(msg='No id exist with display name %s' % display_name)
+def get_lr_port_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name, logical_router_id):
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/logical-router-ports', display_name,
+                                          filters=dict(logical_router_id=logical_router_id))
 
 def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_port_params ):
     logical_router_port_params['logical_router_id'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
@@ -437,7 +415,8 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
     return logical_router_port_params
 
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_port_params):
-    existing_lr_port = get_lr_port_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_port_params['display_name'])
+    existing_lr_port = get_lr_port_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_port_params['display_name'],
+                                                     logical_router_port_params['logical_router_id'])
     if existing_lr_port is None:
         return False
     if existing_lr_port.__contains__('description') and logical_router_port_params.__contains__('description') and\
@@ -529,7 +508,12 @@ def main():
   display_name = module.params['display_name']
   manager_url = 'https://{}/api/v1'.format(mgr_hostname)
 
-  logical_router_port_dict = get_lr_port_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs, display_name)
+  logical_router_id = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                '/logical-routers', module.params['logical_router_name'], exit_if_not_found=False)
+  logical_router_port_dict = None
+  if logical_router_id:
+    logical_router_port_dict = get_lr_port_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                              display_name, logical_router_id)
   logical_router_port_id, revision = None, None
   if logical_router_port_dict:
     logical_router_port_id = logical_router_port_dict['id']
@@ -555,7 +539,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to add logical router port. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="Logical router port with displayname %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -569,7 +552,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update logical router port with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="logical router port with id %s updated." % id)
 
   elif state == 'absent':
@@ -585,7 +567,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete logical router port with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="Logical router port with id %s deleted." % id)
 
 
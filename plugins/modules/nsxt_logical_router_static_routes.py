@@ -104,9 +104,11 @@ RETURN = '''# '''
 
 
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.logical_router_static_route_utils import update_params_with_id, static_route_needs_update
 from ansible.module_utils._text import to_native
 
 def get_body_object(body):
@@ -126,24 +128,6 @@ def get_logical_router_static_route_params(args=None):
             args.pop(key, None)
     return args
 
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    if exit_if_not_found:
-        module.fail_json(msg='No id exist with display name %s' % display_name)
-
-def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_static_route_params ):
-    logical_router_static_route_params['logical_router_id'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                '/logical-routers', logical_router_static_route_params.pop('logical_router_name', None))
-    return logical_router_static_route_params
-
 def get_logical_router_static_routes(module, manager_url, mgr_username, mgr_password, validate_certs,logical_router_id):
     try:
       (rc, resp) = request(manager_url+ '/logical-routers/%s/routing/static-routes' % logical_router_id , headers=dict(Accept='application/json'),
@@ -170,28 +154,7 @@ def check_for_update(module, manager_url, mgr_username, mgr_password, validate_c
   existing_lr_static_route = get_lr_static_route_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_static_route_params)
   if existing_lr_static_route is None:
     return False
-  if existing_lr_static_route.__contains__('description') and not logical_router_static_route_params.__contains__('description'):
-    return True
-  if not existing_lr_static_route.__contains__('description') and logical_router_static_route_params.__contains__('description'):
-    return True
-  if existing_lr_static_route.__contains__('description') and logical_router_static_route_params.__contains__('description') and\
-     existing_lr_static_route['description'] != logical_router_static_route_params['description']:
-    return True
-  if existing_lr_static_route.__contains__('next_hops') and not logical_router_static_route_params.__contains__('next_hops'):
-    return True
-  if not existing_lr_static_route.__contains__('next_hops') and logical_router_static_route_params.__contains__('next_hops'):
-    return True
-  if existing_lr_static_route.__contains__('next_hops') and logical_router_static_route_params.__contains__('next_hops') and\
-     existing_lr_static_route['next_hops'] != logical_router_static_route_params['next_hops']:
-    return True
-  if existing_lr_static_route.__contains__('network') and not logical_router_static_route_params.__contains__('network'):
-    return True
-  if not existing_lr_static_route.__contains__('network') and logical_router_static_route_params.__contains__('network'):
-    return True
-  if existing_lr_static_route.__contains__('network') and logical_router_static_route_params.__contains__('network') and\
-     existing_lr_static_route['network'] != logical_router_static_route_params['network']:
-    return True
-  return False
+  return static_route_needs_update(existing_lr_static_route, logical_router_static_route_params)
 
 
 def main():
@@ -242,7 +205,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to add logical router port. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="Logical router static route  with network %s created." % module.params['network'])
     else:
       if module.check_mode:
@@ -256,7 +218,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update logical router static route with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="logical router static route  with id %s updated." % id)
 
   elif state == 'absent':
@@ -270,7 +231,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete logical static route with id %s. Error[%s]." % (logical_router_static_route_id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=logical_router_static_route_id, message="Logical router static route with id %s deleted." % logical_router_static_route_id)
 
 
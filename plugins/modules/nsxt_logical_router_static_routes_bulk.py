@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: nsxt_logical_router_static_routes_bulk
+short_description: Add, update or delete multiple Static Routes on Logical Routers
+description: Brings a list of static routes to their desired state. The routes
+             can belong to different logical routers. The creates, updates and
+             deletes are submitted through the NSX Manager Batch API, batch_size
+             of them per request.
+version_added: "3.2"
+author: Rahul Raghuvanshi
+options:
+    hostname:
+        description: Deployed NSX manager hostname.
+        required: true
+        type: str
+    username:
+        description: The username to authenticate with the NSX manager.
+        required: true
+        type: str
+    password:
+        description: The password to authenticate with the NSX manager.
+        required: true
+        type: str
+    atomic:
+        description: If true, the requests of a batch are rolled back if one
+                     of them fails, and no further batch is submitted.
+        required: false
+        type: bool
+        default: false
+    batch_size:
+        description: Maximum number of requests submitted in one batch.
+        required: false
+        type: int
+        default: 50
+    static_routes:
+        description: Static routes to be managed. Each static route takes the
+                     options of nsxt_logical_router_static_routes.
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            display_name:
+                description: Display name of the resource
+                required: True
+                type: str
+            description:
+                description: Description of the resource
+                required: false
+                type: str
+            tags:
+                description: Opaque identifier meaningful to API user
+                required: false
+                type: Array of Tag
+            logical_router_name:
+                description: Name of the logical router
+                required: true
+                type: str
+            network:
+                description: destination in cidr. Required when state is present.
+                required: false
+                type: str
+            next_hops:
+                description: Next Hops. Required when state is present.
+                required: false
+                type: array of StaticRouteNextHop
+            state:
+                choices:
+                - present
+                - absent
+                description: "State can be either 'present' or 'absent'.
+                              'present' is used to create or update resource.
+                              'absent' is used to delete resource."
+                required: true
+'''
+
+EXAMPLES = '''
+    - name: Add Static Routes on a Logical Router
+      nsxt_logical_router_static_routes_bulk:
+        hostname: "{{hostname}}"
+        username: "{{username}}"
+        password: "{{password}}"
+        validate_certs: False
+        static_routes:
+        - display_name: "static_route_1"
+          logical_router_name: "tier-0"
+          next_hops:
+          - administrative_distance: '2'
+            ip_address: 192.168.200.253
+          network: 192.168.200.0/24
+          state: "present"
+        - display_name: "static_route_2"
+          logical_router_name: "tier-0"
+          next_hops:
+          - administrative_distance: '2'
+            ip_address: 192.168.201.253
+          network: 192.168.201.0/24
+          state: "present"
+'''
+
+RETURN = '''
+results:
+    description: One entry per static route with its display_name, id, the
+                 action taken (create, update, delete or none) and, for the
+                 submitted ones, the code of the request and the error if any.
+    returned: always
+    type: list
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_resource_from_display_name, get_bulk_operation, submit_bulk_operations, bulk_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.logical_router_static_route_utils import update_params_with_id, static_route_needs_update
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import clean_and_get_params
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(bulk_argument_spec())
+  argument_spec.update(static_routes=dict(required=True, type='list', elements='dict',
+                options=dict(next_hops=dict(required=False, type='list'),
+                logical_router_name=dict(required=True, type='str'),
+                network=dict(required=False, type='str'),
+                display_name=dict(required=True, type='str'),
+                description=dict(required=False, type='str'),
+                tags=dict(required=False, type='list'),
+                state=dict(required=True, choices=['present', 'absent'])),
+                required_if=[['state', 'present', ['next_hops', 'network']]]))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+  mgr_hostname = module.params['hostname']
+  mgr_username = module.params['username']
+  mgr_password = module.params['password']
+  validate_certs = module.params['validate_certs']
+  manager_url = 'https://{}/api/v1'.format(mgr_hostname)
+  communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+
+  operations = []
+  for static_route in module.params['static_routes']:
+    state = static_route['state']
+    logical_router_static_route_params = clean_and_get_params(static_route.copy())
+    display_name = logical_router_static_route_params['display_name']
+    update_params_with_id(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_static_route_params)
+    logical_router_id = logical_router_static_route_params['logical_router_id']
+    endpoint = '/logical-routers/%s/routing/static-routes' % logical_router_id
+    existing_lr_static_route = get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                              endpoint, display_name)
+    updated = existing_lr_static_route is not None and \
+        static_route_needs_update(existing_lr_static_route, logical_router_static_route_params)
+    operations.append(get_bulk_operation(endpoint, display_name, state, logical_router_static_route_params,
+                                         existing_lr_static_route, updated))
+
+  submit_bulk_operations(module, communicator, operations, 'logical router static route')
+
+
+if __name__ == '__main__':
+    main()
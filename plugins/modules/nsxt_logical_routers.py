@@ -144,6 +144,13 @@ options:
         description: Used for tier0 routers only
         required: false
         type: int
+    realization_timeout:
+        description: "Seconds to wait for the logical router to be realized
+                      after it is created or updated. 0 returns as soon as the
+                      request is accepted."
+        required: false
+        type: int
+        default: 300
     resource_type:
         choices:
         - LogicalRouter
@@ -206,13 +213,17 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name, \
+    get_all_resources, add_query_params
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import wait_for_realized_state
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import is_equal
 from ansible.module_utils._text import to_native
 
 def get_logical_router_params(args=None):
-    args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs']
+    args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs', 'realization_timeout']
     for key in args_to_remove:
         args.pop(key, None)
     for key, value in args.copy().items():
@@ -220,34 +231,11 @@ def get_logical_router_params(args=None):
             args.pop(key, None)
     return args
 
-def get_logical_routers(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/logical-routers', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing logical routers. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_lr_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    logical_routers = get_logical_routers(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for logical_router in logical_routers['results']:
-        if logical_router.__contains__('display_name') and logical_router['display_name'] == display_name:
-            return logical_router
-    return None
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    module.fail_json(msg='No id exists with display name %s' % display_name)
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/logical-routers', display_name)
 
-def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_params ):
+def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_params, logical_router_id=None):
 
     if logical_router_params.__contains__('edge_cluster_name'):
         edge_cluster_name = logical_router_params.pop('edge_cluster_name', None)
@@ -292,7 +280,7 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
             ha_vip_config.pop('redundant_uplink_port_names', None)
             uplink_profile_ids = get_id_from_display_name_uplink(module, manager_url, mgr_username, mgr_password,
                                                                  validate_certs,
-                                                                 "/logical-router-ports", uplink_profiles_names)
+                                                                 "/logical-router-ports", uplink_profiles_names, logical_router_id)
             ha_vip_config['redundant_uplink_port_ids'] = uplink_profile_ids
             logical_router_params['advanced_config']['ha_vip_configs'][i] = ha_vip_config
 
@@ -300,20 +288,17 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
 
 
 def get_id_from_display_name_uplink(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint,
-                                    uplink_profiles_display_names):
+                                    uplink_profiles_display_names, logical_router_id=None):
     uplink_profile_display_name1 = uplink_profiles_display_names[0]
     uplink_profile_display_name2 = uplink_profiles_display_names[1]
-    try:
-        (rc, resp) = request(manager_url + endpoint, headers=dict(Accept='application/json'),
-                             url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs,
-                             ignore_errors=True)
-    except Exception as err:
-        module.fail_json(msg='Error accessing id for uplink display names %s, %s. Error [%s]' % (
-        uplink_profile_display_name1, uplink_profile_display_name2, to_native(err)))
+    if logical_router_id:
+        endpoint = add_query_params(endpoint, dict(logical_router_id=logical_router_id,
+                                                   resource_type='LogicalRouterUpLinkPort'))
+    results = get_all_resources(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint)
 
     uplink_profile_ids = []
 
-    for result in resp['results']:
+    for result in results:
         if result.__contains__('display_name') and (result['display_name'] == uplink_profile_display_name1 or result[
             'display_name'] == uplink_profile_display_name2):
             uplink_profile_ids.append(result['id'])
@@ -323,6 +308,17 @@ def get_id_from_display_name_uplink(module, manager_url, mgr_username, mgr_passw
     return uplink_profile_ids
 
 
+def wait_till_realized(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_id):
+    if not module.params['realization_timeout']:
+        return
+    try:
+        warning = wait_for_realized_state(manager_url, '/logical-routers/%s/state' % logical_router_id, mgr_username, mgr_password,
+                                          validate_certs, module.params['realization_timeout'])
+    except Exception as err:
+        module.fail_json(msg='Logical router with id %s is not realized. Error [%s]' % (logical_router_id, to_native(err)))
+    if warning:
+        module.warn('Logical router with id %s: %s' % (logical_router_id, warning))
+
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_with_ids):
     existing_logical_router = get_lr_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_with_ids['display_name'])
     if existing_logical_router is None:
@@ -411,6 +407,7 @@ def main():
                         dad_profile_name=dict(required=False, type='str'),
                         ndra_profile_name=dict(required=False, type='str')),
                         resource_type=dict(required=False, type='str', choices=['LogicalRouter']),
+                        realization_timeout=dict(required=False, type='int', default=300),
                         state=dict(required=True, choices=['present', 'absent']))
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
@@ -430,7 +427,7 @@ def main():
     revision = logical_router_dict['_revision']
 
   if state == 'present':
-    body = update_params_with_id(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_params)
+    body = update_params_with_id(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_params, logical_router_id)
     updated = check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, body)
     headers = dict(Accept="application/json")
     headers['Content-Type'] = 'application/json'
@@ -449,7 +446,7 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to add logical router. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
+      wait_till_realized(module, manager_url, mgr_username, mgr_password, validate_certs, resp["id"])
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="Logical router with display_name %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -464,7 +461,7 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update logical router with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
+      wait_till_realized(module, manager_url, mgr_username, mgr_password, validate_certs, resp["id"])
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="logical router with id %s updated." % id)
 
   elif state == 'absent':
@@ -480,7 +477,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete logical router with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="logical router with id %s deleted." % id)
 
 
@@ -488,24 +484,12 @@ def checkRedundantUplinkPortIds(existingHaVipConfigs, newHaVipConfigs):
     if len(existingHaVipConfigs) != len(newHaVipConfigs):
         return False
     for i in range(len(existingHaVipConfigs)):
-        firstVal = ordered(existingHaVipConfigs[i]['redundant_uplink_port_ids'])
-        secondVal = ordered(newHaVipConfigs[i]['redundant_uplink_port_ids'])
-        if firstVal != secondVal:
+        if not is_equal(existingHaVipConfigs[i]['redundant_uplink_port_ids'], newHaVipConfigs[i]['redundant_uplink_port_ids']):
             return False
     return True
 
-
 def compareTags(existing_logical_router, new_logical_router):
-    return ordered(existing_logical_router['tags']) == ordered(new_logical_router['tags'])
-
-
-def ordered(obj):
-    if isinstance(obj, dict):
-        return sorted((k, ordered(v)) for k, v in obj.items())
-    if isinstance(obj, list):
-        return sorted(ordered(x) for x in obj)
-    else:
-        return obj
+    return is_equal(existing_logical_router['tags'], new_logical_router['tags'])
 
 
 if __name__ == '__main__':
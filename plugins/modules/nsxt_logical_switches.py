@@ -95,6 +95,13 @@ options:
         description: Mac pool name that associated with a LogicalSwitch.
         required: false
         type: str
+    realization_timeout:
+        description: "Seconds to wait for the logical switch to be realized after it is
+                      created or updated. 0 returns as soon as the request is
+                      accepted."
+        required: false
+        type: int
+        default: 300
     replication_mode:
         description: Replication mode of the Logical Switch
         required: false
@@ -184,13 +191,16 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.logical_switch_utils import update_params_with_id, logical_switch_needs_update
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import wait_for_realized_state
 from ansible.module_utils._text import to_native
 
 def get_logical_switch_params(args=None):
-    args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs', 'lswitch_id']
+    args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs', 'lswitch_id', 'realization_timeout']
     for key in args_to_remove:
         args.pop(key, None)
     for key, value in args.copy().items():
@@ -198,82 +208,26 @@ def get_logical_switch_params(args=None):
             args.pop(key, None)
     return args
 
-def get_logical_switches(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/logical-switches', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing logical switches. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_lswitch_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    logical_switchs = get_logical_switches(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for logical_switch in logical_switchs['results']:
-        if logical_switch.__contains__('display_name') and logical_switch['display_name'] == display_name:
-            return logical_switch
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/logical-switches', display_name)
 
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name):
+def wait_till_realized(module, manager_url, mgr_username, mgr_password, validate_certs, lswitch_id):
+    if not module.params['realization_timeout']:
+        return
     try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+        warning = wait_for_realized_state(manager_url, '/logical-switches/%s/state' % lswitch_id, mgr_username, mgr_password,
+                                          validate_certs, module.params['realization_timeout'])
     except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    module.fail_json(msg='No id existe with display name %s' % display_name)
-
-def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, logical_switch_params ):
-    if 'ip_pool_name' in logical_switch_params:
-        logical_switch_params['ip_pool_id'] = get_id_from_display_name (module, manager_url,
-                                                                mgr_username, mgr_password, validate_certs,
-                                                                "/pools/ip-pools", logical_switch_params.pop('ip_pool_name', None))
-    if 'mac_pool_name' in logical_switch_params and 'mac_pool_id' not in logical_switch_params:
-        logical_switch_params['mac_pool_id'] = get_id_from_display_name (module, manager_url,
-                                                                mgr_username, mgr_password, validate_certs,
-                                                                "/pools/mac-pools", logical_switch_params.pop('mac_pool_name', None))
-    if 'mac_pool_name' in logical_switch_params and 'mac_pool_id' in logical_switch_params:
-        logical_switch_params.pop('mac_pool_name', None)
-    logical_switch_params['transport_zone_id'] = get_id_from_display_name (module, manager_url,
-                                                                mgr_username, mgr_password, validate_certs,
-                                                                "/transport-zones", logical_switch_params.pop('transport_zone_name', None))
-    switch_profiles = logical_switch_params.pop('switching_profiles', None)
-
-    switch_profile_ids = []
-    for switch_profile in switch_profiles or []:
-        profile_obj = {}
-        profile_obj['value'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                                "/switching-profiles", switch_profile['name'])
-        profile_obj['key'] = switch_profile['type']
-        switch_profile_ids.append(profile_obj)
-    logical_switch_params['switching_profile_ids'] = switch_profile_ids
-    return logical_switch_params
+        module.fail_json(msg='Logical switch with id %s is not realized. Error [%s]' % (lswitch_id, to_native(err)))
+    if warning:
+        module.warn('Logical switch with id %s: %s' % (lswitch_id, warning))
 
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, logical_switch_with_ids):
     existing_logical_switch = get_lswitch_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, logical_switch_with_ids['display_name'])
     if existing_logical_switch is None:
         return False
-    if existing_logical_switch.__contains__('vlan') and logical_switch_with_ids.__contains__('vlan') and \
-        existing_logical_switch['vlan'] != logical_switch_with_ids['vlan']:
-        return True
-
-    if logical_switch_with_ids.__contains__('vlan_trunk_spec') and existing_logical_switch.__contains__('vlan_trunk_spec') and \
-        existing_logical_switch['vlan_trunk_spec']['vlan_ranges'] != logical_switch_with_ids['vlan_trunk_spec']['vlan_ranges']:
-        return True
-    if existing_logical_switch.__contains__('switching_profile_ids') and logical_switch_with_ids.__contains__('switching_profile_ids') and \
-        existing_logical_switch['switching_profile_ids'] != logical_switch_with_ids['switching_profile_ids']:
-        return True
-    if existing_logical_switch['admin_state'] != logical_switch_with_ids['admin_state']:
-        return True
-    if existing_logical_switch.__contains__('replication_mode') and logical_switch_with_ids.__contains__('replication_mode') and \
-        existing_logical_switch['replication_mode'] != logical_switch_with_ids['replication_mode']:
-        return True
-    if existing_logical_switch.__contains__('hybrid') and logical_switch_with_ids.__contains__('hybrid') and \
-        existing_logical_switch['hybrid'] != logical_switch_with_ids['hybrid']:
-        return True
-    return False
+    return logical_switch_needs_update(existing_logical_switch, logical_switch_with_ids)
 
 def main():
   argument_spec = vmware_argument_spec()
@@ -298,6 +252,7 @@ def main():
                         description=dict(required=False, type='str'),
                         span=dict(required=False, type='list'),
                         tags=dict(required=False, type='list'),
+                        realization_timeout=dict(required=False, type='int', default=300),
                         state=dict(required=True, choices=['present', 'absent']))
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
@@ -337,7 +292,7 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to add logical switch. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
+      wait_till_realized(module, manager_url, mgr_username, mgr_password, validate_certs, resp["id"])
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="Logical switch with display name %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -352,7 +307,7 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update logical switch with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
+      wait_till_realized(module, manager_url, mgr_username, mgr_password, validate_certs, resp["id"])
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="logical switch with lswitch id %s updated." % id)
 
   elif state == 'absent':
@@ -368,7 +323,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete logical switch with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="Logical switch with zone id %s deleted." % id)
 
 
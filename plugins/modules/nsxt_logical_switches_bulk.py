@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: nsxt_logical_switches_bulk
+short_description: Create, update or delete multiple Logical Switches
+description: Brings a list of logical switches to their desired state. The
+             creates, updates and deletes are submitted through the NSX Manager
+             Batch API, batch_size of them per request. The names of the
+             transport zones, IP pools, MAC pools and switching profiles are
+             resolved once for the whole list.
+
+version_added: "3.2"
+author: Rahul Raghuvanshi
+options:
+    hostname:
+        description: Deployed NSX manager hostname.
+        required: true
+        type: str
+    username:
+        description: The username to authenticate with the NSX manager.
+        required: true
+        type: str
+    password:
+        description: The password to authenticate with the NSX manager.
+        required: true
+        type: str
+    atomic:
+        description: If true, the requests of a batch are rolled back if one
+                     of them fails, and no further batch is submitted.
+        required: false
+        type: bool
+        default: false
+    batch_size:
+        description: Maximum number of requests submitted in one batch.
+        required: false
+        type: int
+        default: 50
+    logical_switches:
+        description: Logical switches to be managed. Each logical switch takes
+                     the options of nsxt_logical_switches, except lswitch_id.
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            display_name:
+                description: Display name
+                required: true
+                type: str
+            state:
+                choices:
+                - present
+                - absent
+                description: "State can be either 'present' or 'absent'.
+                            'present' is used to create or update resource.
+                            'absent' is used to delete resource."
+                required: true
+            admin_state:
+                description: Represents Desired state of the Logical Switch.
+                             Required when state is present.
+                required: false
+                type: str
+            transport_zone_name:
+                description: Transport Zone Name. Required when state is present.
+                required: false
+                type: str
+            ip_pool_name:
+                description: IP pool name
+                required: false
+                type: str
+            mac_pool_id:
+                description: Mac pool id that associated with a LogicalSwitch.
+                required: false
+                type: str
+            mac_pool_name:
+                description: Mac pool name that associated with a LogicalSwitch.
+                required: false
+                type: str
+            replication_mode:
+                description: Replication mode of the Logical Switch
+                required: false
+                type: str
+            switching_profiles:
+                description: List of Switching Profile Names and type
+                required: false
+                type: list
+            vlan:
+                description: VLAN of the logical network.
+                required: false
+                type: int
+            vlan_trunk_spec:
+                description: VLAN trunk specification of logical switch.
+                required: false
+                type: dict
+            vni:
+                description: VNI of the overlay network.
+                required: false
+                type: int
+'''
+
+EXAMPLES = '''
+- name: Create logical switches
+  nsxt_logical_switches_bulk:
+    hostname: "10.192.167.137"
+    username: "admin"
+    password: "Admin!23Admin"
+    validate_certs: False
+    logical_switches:
+    - display_name: "test_lswitch_1"
+      replication_mode: "SOURCE"
+      admin_state: "UP"
+      transport_zone_name: "TZ1"
+      state: "present"
+    - display_name: "test_lswitch_2"
+      replication_mode: "SOURCE"
+      admin_state: "UP"
+      transport_zone_name: "TZ1"
+      state: "present"
+'''
+
+RETURN = '''
+results:
+    description: One entry per logical switch with its display_name, id, the
+                 action taken (create, update, delete or none) and, for the
+                 submitted ones, the code of the request and the error if any.
+    returned: always
+    type: list
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_resource_from_display_name, get_bulk_operation, submit_bulk_operations, bulk_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.logical_switch_utils import update_params_with_id, logical_switch_needs_update
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import clean_and_get_params
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(bulk_argument_spec())
+  argument_spec.update(logical_switches=dict(required=True, type='list', elements='dict',
+                        options=dict(display_name=dict(required=True, type='str'),
+                        switch_type=dict(required=False, type='str'),
+                        replication_mode=dict(required=False, type='str'),
+                        extra_configs=dict(required=False, type='list'),
+                        uplink_teaming_policy_name=dict(required=False, type='str'),
+                        transport_zone_name=dict(required=False, type='str'),
+                        ip_pool_name=dict(required=False, type='str'),
+                        vlan=dict(required=False, type='int'),
+                        hybrid=dict(required=False, type='bool'),
+                        mac_pool_id=dict(required=False, type='str'),
+                        mac_pool_name=dict(required=False, type='str'),
+                        vni=dict(required=False, type='int'),
+                        vlan_trunk_spec=dict(required=False, type='dict',
+                        options=dict(vlan_ranges=dict(required=True, type='list'))),
+                        admin_state=dict(required=False, type='str'),
+                        address_bindings=dict(required=False, type='list'),
+                        switching_profiles=dict(required=False, type='list'),
+                        description=dict(required=False, type='str'),
+                        span=dict(required=False, type='list'),
+                        tags=dict(required=False, type='list'),
+                        state=dict(required=True, choices=['present', 'absent'])),
+                        required_if=[['state', 'present', ['transport_zone_name', 'admin_state']]]))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+  mgr_hostname = module.params['hostname']
+  mgr_username = module.params['username']
+  mgr_password = module.params['password']
+  validate_certs = module.params['validate_certs']
+  manager_url = 'https://{}/api/v1'.format(mgr_hostname)
+  communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+
+  operations = []
+  for logical_switch in module.params['logical_switches']:
+    state = logical_switch['state']
+    logical_switch_params = clean_and_get_params(logical_switch.copy())
+    display_name = logical_switch_params['display_name']
+    existing_logical_switch = get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                             '/logical-switches', display_name)
+    updated = False
+    if state == 'present':
+      update_params_with_id(module, manager_url, mgr_username, mgr_password, validate_certs, logical_switch_params)
+      updated = existing_logical_switch is not None and logical_switch_needs_update(existing_logical_switch, logical_switch_params)
+    operations.append(get_bulk_operation('/logical-switches', display_name, state, logical_switch_params,
+                                         existing_logical_switch, updated))
+
+  submit_bulk_operations(module, communicator, operations, 'logical switch')
+
+
+if __name__ == '__main__':
+    main()
@@ -109,6 +109,7 @@ RETURN = '''# '''
 import json, time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request, get_vc_ip_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_id_from_display_name
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vcenter_utils import get_resource_id_from_name
 from ansible.module_utils._text import to_native
 
@@ -143,19 +144,6 @@ def check_node_exist(existing_nodes_data, module):
                 return True, result['deployment_config']['hostname']
     return False, None
 
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    if exit_if_not_found:
-        module.fail_json(msg='No id exist with display name %s' % display_name)
-
 def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, node_params ):
     for deployment_request in node_params['deployment_requests']:
         vc_name = deployment_request['deployment_config'].pop('vc_name', None)
@@ -171,7 +159,6 @@ def wait_till_create(vm_id, module, manager_url, mgr_username, mgr_password, val
           if any(resp['status'] in progress_status for progress_status in IN_PROGRESS_STATES):
               time.sleep(10)
           elif any(resp['status'] in progress_status for progress_status in SUCCESS_STATES):
-              time.sleep(5)
               return
           else:
               module.fail_json(msg= 'Error in controller-manager node deployment: %s'%(str(resp['status'])))
@@ -191,7 +178,6 @@ def wait_till_delete(vm_id, module, manager_url, mgr_username, mgr_password, val
           time.sleep(30)
           count = count + 1
     except Exception as err:
-      time.sleep(5)
       return
 
 def get_node_id_from_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name):
@@ -320,7 +306,6 @@ def main():
 
     for node in resp['results']:
       wait_till_create(node['vm_id'], module, manager_url, mgr_username, mgr_password, validate_certs)
-    time.sleep(5)
     module.exit_json(changed=True, body= str(resp), message="Controller-manager node deployed.")
 
   elif state == 'absent':
@@ -346,7 +331,6 @@ def main():
       module.fail_json(msg="Controller-manager node with id %s does not exist." % id)
 
     wait_till_delete(id, module, manager_url, mgr_username, mgr_password, validate_certs)
-    time.sleep(5)
     module.exit_json(changed=True, id=id, message="Controller-manager node with node id %s deleted." % id)
 
 if __name__ == '__main__':
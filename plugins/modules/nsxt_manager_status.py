@@ -54,11 +54,16 @@ EXAMPLES = '''
       wait_time: 50
 '''
 
-RETURN = '''# '''
-import json, time
-from datetime import datetime
+RETURN = '''
+waited:
+    description: Seconds waited for the NSX manager to be stable.
+    returned: success
+    type: int
+'''
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import wait_until
 from ansible.module_utils._text import to_native
 
 def main():
@@ -74,23 +79,16 @@ def main():
   manager_url = 'https://{}/api/v1'.format(mgr_hostname)
 
   changed = False
-  wait_time = 10 # wait till 30 min
-  while wait_time < (module.params['wait_time'] *60):
-      try:
-        current_time = datetime.now()
-        (rc, resp) = request(manager_url+ '/cluster-manager/status', headers=dict(Accept='application/json'),
-                        url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-        if "overall_status" in resp and resp["overall_status"] == "STABLE":
-            module.exit_json(changed=changed, msg= " NSX manager is UP")
-        else:
-            time_diff = datetime.now() - current_time
-            time.sleep(10)
-            wait_time = time_diff.seconds + wait_time + 10
-      except Exception as err:
-        time_diff = datetime.now() - current_time
-        time.sleep(10)
-        wait_time = time_diff.seconds + wait_time + 10
-  module.fail_json(changed=changed, msg= " Error accessing nsx manager. Timed out")
+  def is_stable():
+      (rc, resp) = request(manager_url+ '/cluster-manager/status', headers=dict(Accept='application/json'),
+                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
+      return "overall_status" in resp and resp["overall_status"] == "STABLE"
+  try:
+      # The manager may not answer while it boots
+      waited = wait_until(is_stable, time_out=module.params['wait_time'] * 60, tolerated_errors=None)
+  except Exception as err:
+      module.fail_json(changed=changed, msg= " Error accessing nsx manager. Timed out")
+  module.exit_json(changed=changed, msg= " NSX manager is UP", waited=int(waited))
 
 if __name__ == '__main__':
 	main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+DOCUMENTATION = '''
+---
+module: nsxt_policy_export
+short_description: Export the Policy intent
+description:
+    - Reads the Policy intent, or the selected part of it, with one
+      hierarchical read of /infra and writes it as a normalized JSON
+      snapshot.
+    - The children of every object are sorted on their resource_type and
+      path and the keys are sorted, so that two exports of the same intent
+      are identical and can be compared with diff.
+version_added: "3.2"
+author: Gautam Verma
+options:
+    hostname:
+        description: Deployed NSX manager hostname.
+        required: true
+        type: str
+    username:
+        description: The username to authenticate with the NSX manager.
+        type: str
+    password:
+        description:
+            - The password to authenticate with the NSX manager.
+            - Must be specified if username is specified
+        type: str
+    validate_certs:
+        description: Enable server certificate verification.
+        type: bool
+        default: False
+    ca_path:
+        description: Path to the CA bundle to be used to verify host's SSL
+                     certificate
+        type: str
+    nsx_cert_path:
+        description: Path to the certificate created for the Principal
+                     Identity using which the CRUD operations should be
+                     performed
+        type: str
+    nsx_key_path:
+        description:
+            - Path to the certificate key created for the Principal Identity
+              using which the CRUD operations should be performed
+            - Must be specified if nsx_cert_path is specified
+        type: str
+    request_headers:
+        description: HTTP request headers to be sent to the host while making
+                     any request
+        type: dict
+    types:
+        description:
+            - Resource types to be exported, e.g. Tier0, Segment, Domain or
+              Group, along with the objects they are under.
+            - All of them are exported if not specified.
+        type: list
+        elements: str
+    base_path:
+        description: Policy path of the subtree to be exported, e.g.
+                     /infra/tier-0s/t0. The whole tree is exported if not
+                     specified.
+        type: str
+    dest:
+        description:
+            - Path of the file the export is written to on the target host,
+              gzip compressed if its name ends with .gz.
+            - The export is returned as infra if not specified.
+            - The file is only replaced, and the task changed, if its content
+              differs. It is left as it is in check mode.
+        type: path
+    strip_metadata:
+        description: Whether the attributes NSX updates on every change, e.g.
+                     _revision or _last_modified_time, are left out.
+        type: bool
+        default: true
+    exclude_system_owned:
+        description: Whether the system owned objects, e.g. the default
+                     services, are left out.
+        type: bool
+        default: false
+'''
+
+EXAMPLES = '''
+- name: Export the gateways and segments
+  nsxt_policy_export:
+    hostname: "10.10.10.10"
+    username: "admin"
+    password: "password"
+    validate_certs: False
+    types:
+      - Tier0
+      - Tier1
+      - Segment
+    exclude_system_owned: True
+    dest: /tmp/policy-networking.json
+
+- name: Check the drift of a Tier-0 against the export
+  nsxt_policy_tier0:
+    hostname: "10.10.10.10"
+    username: "admin"
+    password: "password"
+    validate_certs: False
+    drift_snapshot: /tmp/policy-networking.json
+    display_name: test-tier0
+    state: present
+    ha_mode: "ACTIVE_STANDBY"
+  register: tier0_drift
+'''
+
+RETURN = '''
+infra:
+    description: The normalized Infra, if dest is not specified.
+    returned: when dest is not specified
+    type: dict
+object_counts:
+    description: Dict from the resource_type of the exported objects to their
+                 number.
+    returned: always
+    type: dict
+dest:
+    description: Path of the file the export was written to.
+    returned: when dest is specified
+    type: str
+size:
+    description: Size of the file in bytes.
+    returned: when dest is specified
+    type: int
+sha256:
+    description: SHA-256 checksum of the file.
+    returned: when dest is specified
+    type: str
+'''
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.policy_communicator import PolicyCommunicator
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.policy_export_utils import (
+    get_infra_url, normalize_hierarchy, count_objects, write_export)
+from ansible.module_utils._text import to_native
+
+
+def get_export_spec():
+    export_spec = PolicyCommunicator.get_vmware_argument_spec()
+    export_spec.update(dict(
+        types=dict(type='list', elements='str'),
+        base_path=dict(type='str'),
+        dest=dict(type='path'),
+        strip_metadata=dict(type='bool', default=True),
+        exclude_system_owned=dict(type='bool', default=False)))
+    return export_spec
+
+
+def main():
+    module = AnsibleModule(argument_spec=get_export_spec(),
+                           supports_check_mode=True)
+
+    try:
+        policy_communicator = PolicyCommunicator.get_instance(
+            module.params['hostname'], module.params['username'],
+            module.params['password'], module.params['nsx_cert_path'],
+            module.params['nsx_key_path'], module.params['request_headers'],
+            module.params['ca_path'], module.params['validate_certs'])
+        _, infra = policy_communicator.request(get_infra_url(
+            module.params['types'], module.params['base_path']))
+    except Exception as err:
+        module.fail_json(msg="Failed to read the Policy intent. Error: "
+                             "{}".format(to_native(err)))
+
+    infra = normalize_hierarchy(
+        infra, strip_metadata=module.params['strip_metadata'],
+        exclude_system_owned=module.params['exclude_system_owned'])
+    object_counts = count_objects(infra)
+    if not module.params['dest']:
+        module.exit_json(changed=False, infra=infra,
+                         object_counts=object_counts)
+    try:
+        summary = write_export(module.params['dest'], infra,
+                               check_mode=module.check_mode)
+    except Exception as err:
+        module.fail_json(msg="Failed to write the export to {}. Error: "
+                             "{}".format(module.params['dest'],
+                                         to_native(err)))
+    module.exit_json(object_counts=object_counts, **summary)
+
+
+if __name__ == '__main__':
+    main()
@@ -113,9 +113,10 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request, get_certificate_string
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name
 from ansible.module_utils._text import to_native
 
 def get_principal_identity_params(args=None):
@@ -149,36 +150,12 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
                                             '/trust-management/certificates', principal_id_params.pop('certificate_name', None))
     return principal_id_params
 
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name):
-  try:
-    (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-  except Exception as err:
-    module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-  for result in resp['results']:
-    if result.__contains__('display_name') and result['display_name'] == display_name:
-      return result['id']
-  module.fail_json(msg='No id exists with display name %s' % display_name)
-
-def get_principal_ids(module, manager_url, mgr_username, mgr_password, validate_certs):
-  try:
-    (rc, resp) = request(manager_url+ '/trust-management/principal-identities', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-  except Exception as err:
-    module.fail_json(msg='Error accessing principal identities. Error [%s]' % (to_native(err)))
-  return resp
-
 def get_principal_id_with_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
   '''
   result: returns the principal id of the display name provided
   '''
-  principal_ids = get_principal_ids(module, manager_url, mgr_username, mgr_password, validate_certs)
-  if principal_ids and len(principal_ids['results'])>0:
-    for principal_id in principal_ids['results']:
-      if principal_id.__contains__('display_name') and principal_id['display_name'] == display_name:
-        return principal_id
-  return None
+  return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                        '/trust-management/principal-identities', display_name)
 
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, display_name, principal_id_params):
   '''
@@ -264,7 +241,6 @@ def main():
                               url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
         except Exception as err:
           module.fail_json(msg="Failed to update principal identity. Error[%s]. Request body [%s]." % (request_data, to_native(err)))
-        time.sleep(5)
         module.exit_json(changed=True, result=resp, message="Principal identity updated.")
     # add the principal identity
     if principal_id_with_display_name:
@@ -276,7 +252,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to add principal identity. Error[%s]. Request body [%s]." % (request_data, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, result=resp, message="Principal identity created.")
 
   elif state == 'absent':
@@ -290,7 +265,6 @@ def main():
     except Exception as err:
       module.fail_json(msg="Failed to delete principal identity with display name \'%s\'. Error[%s]." % (display_name, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=principal_id, message="Principal identity with display name \'%s\' and principal id \'%s\' deleted." %(display_name, principal_id))
 
 
@@ -94,9 +94,10 @@ EXAMPLES = '''
 RETURN = '''# '''
 
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
 from ansible.module_utils._text import to_native
 
 def get_advertise_params(args=None):
@@ -108,20 +109,9 @@ def get_advertise_params(args=None):
             args.pop(key, None)
     return args
 
-def get_logical_routers(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/logical-routers', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing logical routers. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_lr_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    logical_routers = get_logical_routers(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for logical_router in logical_routers['results']:
-        if logical_router.__contains__('display_name') and logical_router['display_name'] == display_name:
-            return logical_router
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/logical-routers', display_name)
 
 def get_revision(module, manager_url, mgr_username, mgr_password, validate_certs, logical_router_id):
   try:
@@ -174,7 +164,6 @@ def main():
   except Exception as err:
       module.fail_json(msg="Failed to toggle config. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-  time.sleep(5)
   module.exit_json(changed=True, id=resp["id"], body= str(resp), message="Router advertisement set for display name %s." % module.params['display_name'])
 
 
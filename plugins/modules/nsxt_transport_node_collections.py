@@ -100,6 +100,8 @@ RETURN = '''# '''
 import json, time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import is_equal
 from ansible.module_utils._text import to_native
 import ssl
 import socket
@@ -114,33 +116,9 @@ def get_transport_node_collections_params(args=None):
             args.pop(key, None)
     return args
 
-def get_transport_node_collections(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/transport-node-collections', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing transport-node-collections. Error [%s]' % (to_native(err)))
-    return resp
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    if exit_if_not_found:
-        module.fail_json(msg='No id exist with display name %s' % display_name)
-
 def get_transport_node_collection_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    transport_node_collections = get_transport_node_collections(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for transport_node_collection in transport_node_collections['results']:
-        if transport_node_collection.__contains__('display_name') and transport_node_collection['display_name'] == display_name:
-            return transport_node_collection
-    return None
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/transport-node-collections', display_name)
 
 def wait_till_delete(id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
@@ -149,7 +127,6 @@ def wait_till_delete(id, module, manager_url, mgr_username, mgr_password, valida
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
           time.sleep(10)
     except Exception as err:
-      time.sleep(5)
       return
 
 def get_transport_node_profile_id (module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_profile_name):
@@ -160,17 +137,13 @@ def get_transport_node_profile_id (module, manager_url, mgr_username, mgr_passwo
       module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (transport_node_profile_name, to_native(err)))
 
 def get_compute_collection_id (module, manager_url, mgr_username, mgr_password, validate_certs, manager_name, cluster_name):
-    try:
-      (rc, resp) = request(manager_url+ '/fabric/compute-collections', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-      compute_manager_id = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                                        "/fabric/compute-managers", manager_name)
-    except Exception as err:
-      module.fail_json(msg='Error accessing compute collection id for manager %s, cluster %s. Error [%s]' % (manager_name, cluster_name, to_native(err)))
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == cluster_name and \
-            result['origin_id'] == compute_manager_id:
-            return result['external_id']
+    compute_manager_id = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                   "/fabric/compute-managers", manager_name)
+    compute_collection = get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                                        '/fabric/compute-collections', cluster_name,
+                                                        filters=dict(origin_id=compute_manager_id), filter_display_name=True)
+    if compute_collection is not None:
+        return compute_collection['external_id']
     module.fail_json(msg='No compute collection id exist with cluster name %s for compute manager %s' % (cluster_name, manager_name))
 
 def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_collection_params ):
@@ -294,16 +267,7 @@ def main():
 
 
 def compareTags(existing_tnc, new_tnc):
-    return ordered(existing_tnc['tags']) == ordered(new_tnc['tags'])
-
-
-def ordered(obj):
-    if isinstance(obj, dict):
-        return sorted((k, ordered(v)) for k, v in obj.items())
-    if isinstance(obj, list):
-        return sorted(ordered(x) for x in obj)
-    else:
-        return obj
+    return is_equal(existing_tnc['tags'], new_tnc['tags'])
 
 
 if __name__ == '__main__':
@@ -114,9 +114,11 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name, get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import contains, is_equal
 from ansible.module_utils._text import to_native
 
 
@@ -134,47 +136,13 @@ def get_transport_node_profile_params(args=None):
             args.pop(key, None)
     return args
 
-def get_transport_node_profiles(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/transport-node-profiles', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing transport node profiles. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_host_switch_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['uuid']
-    if exit_if_not_found:
-        module.fail_json(msg='No id exist with display name %s' % display_name)
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    if exit_if_not_found:
-        module.fail_json(msg='No id exist with display name %s' % display_name)
+    return get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint,
+                                    display_name, exit_if_not_found, id_attribute='uuid')
 
 def get_tnp_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    transport_node_profiles = get_transport_node_profiles(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for transport_node_profile in transport_node_profiles['results']:
-        if transport_node_profile.__contains__('display_name') and transport_node_profile['display_name'] == display_name:
-            return transport_node_profile
-    return None
-
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/transport-node-profiles', display_name)
 
 def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_profile_params ):
     for host_switch in transport_node_profile_params['host_switch_spec']['host_switches']:
@@ -190,7 +158,8 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
         for host_switch_profile in host_switch_profiles:
             profile_obj = {}
             profile_obj['value'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                                    "/host-switch-profiles?include_system_owned=true", host_switch_profile['name'])
+                                                    "/host-switch-profiles?include_system_owned=true", host_switch_profile['name'],
+                                                    attributes=dict(resource_type=host_switch_profile['type']))
             profile_obj['key'] = host_switch_profile['type']
             host_switch_profile_ids.append(profile_obj)
         host_switch['host_switch_profile_ids'] = host_switch_profile_ids
@@ -224,30 +193,16 @@ def update_params_with_id (module, manager_url, mgr_username, mgr_password, vali
     return transport_node_profile_params
 
 
-def id_exist_in_list_dict_obj(key, list_obj1, list_obj2):
-    all_id_presents = False
-    if len(list_obj1) != len(list_obj2):
-        return all_id_presents
-    for dict_obj1 in list_obj1:
-        if dict_obj1.__contains__(key):
-            for dict_obj2 in list_obj2:
-                if dict_obj2.__contains__(key) and dict_obj1[key] == dict_obj2[key]:
-                    all_id_presents = True
-                    continue
-            if not all_id_presents:
-                return False
-    return True
-
-
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_profile_with_ids):
     existing_transport_node_profile = get_tnp_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_profile_with_ids['display_name'])
     if existing_transport_node_profile is None:
         return False
-    if existing_transport_node_profile.__contains__('transport_zone_endpoints') and transport_node_profile_with_ids.__contains__('transport_zone_endpoints'):
-        return not id_exist_in_list_dict_obj('transport_zone_id', existing_transport_node_profile['transport_zone_endpoints'], transport_node_profile_with_ids['transport_zone_endpoints'])
+    if existing_transport_node_profile.__contains__('transport_zone_endpoints') and transport_node_profile_with_ids.__contains__('transport_zone_endpoints') and \
+        not contains(existing_transport_node_profile, {'transport_zone_endpoints': transport_node_profile_with_ids['transport_zone_endpoints']}):
+        return True
     if existing_transport_node_profile.__contains__('host_switch_spec') and existing_transport_node_profile['host_switch_spec'].__contains__('host_switches') and \
         transport_node_profile_with_ids.__contains__('host_switch_spec') and transport_node_profile_with_ids['host_switch_spec'].__contains__('host_switches') and \
-        existing_transport_node_profile['host_switch_spec']['host_switches'] != transport_node_profile_with_ids['host_switch_spec']['host_switches']:
+        not contains(existing_transport_node_profile['host_switch_spec'], {'host_switches': transport_node_profile_with_ids['host_switch_spec']['host_switches']}):
         return True
     if existing_transport_node_profile.__contains__('tags') and not transport_node_profile_with_ids.__contains__('tags'):
         return True
@@ -308,7 +263,6 @@ def main():
       except Exception as err:
            module.fail_json(msg="Failed to add transport node profile. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="transport node profile with display name %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -323,7 +277,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update transport node profile with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="transport node profile with node id %s updated." % id)
 
   elif state == 'absent':
@@ -339,22 +292,11 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete transport node profile with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="transport node profile with node id %s deleted." % id)
 
 
 def compareTags(existing_tnp, new_tnp):
-    return ordered(existing_tnp['tags']) == ordered(new_tnp['tags'])
-
-
-def ordered(obj):
-    if isinstance(obj, dict):
-        return sorted((k, ordered(v)) for k, v in obj.items())
-    if isinstance(obj, list):
-        return sorted(ordered(x) for x in obj)
-    else:
-        return obj
-
+    return is_equal(existing_tnp['tags'], new_tnp['tags'])
 
 
 if __name__ == '__main__':
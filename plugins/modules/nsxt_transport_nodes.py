@@ -663,87 +663,13 @@ RETURN = '''# '''
 
 import json, time
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request, get_vc_ip_from_display_name
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vcenter_utils import get_resource_id_from_name, get_data_network_id_from_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_id_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.transport_node_utils import transport_node_argument_spec, \
+    get_transport_node_params, get_tn_from_display_name, get_dn_from_display_name, update_params_with_id, \
+    transport_node_needs_update, inject_vcenter_info, inject_host_thumbprint, \
+    FAILED_STATES, IN_PROGRESS_STATES, SUCCESS_STATES
 from ansible.module_utils._text import to_native
-import socket
-import hashlib
-import ssl
-import ipaddress
-
-FAILED_STATES = ["failed"]
-IN_PROGRESS_STATES = ["pending", "in_progress"]
-SUCCESS_STATES = ["partial_success", "success", "NODE_READY"]
-FABRIC_VIRTUAL_SWITCH_TYPE = ["VDS"]
-
-def get_transport_node_params(args=None):
-    args_to_remove = ['state', 'username', 'password', 'port', 'hostname', 'validate_certs']
-    for key in args_to_remove:
-        args.pop(key, None)
-    for key, value in args.copy().items():
-        if value == None:
-            args.pop(key, None)
-    return args
-
-def get_transport_nodes(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/transport-nodes', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing transport nodes. Error [%s]' % (to_native(err)))
-    return resp
-
-
-def get_discovered_nodes(module, manager_url, mgr_username, mgr_password, validate_certs):
-  try:
-    (rc, resp) = request(manager_url + '/fabric/discovered-nodes', headers=dict(Accept='application/json'),
-                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs,
-                         ignore_errors=True)
-  except Exception as err:
-    module.fail_json(msg='Error accessing discovered nodes. Error [%s]' % (to_native(err)))
-  return resp
-
-def get_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint, display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url+ endpoint, headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-        if result.__contains__('display_name') and result['display_name'] == display_name:
-            return result['id']
-    if exit_if_not_found:
-        module.fail_json(msg='No id exist with display name %s' % display_name)
-
-def get_tn_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    transport_nodes = get_transport_nodes(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for transport_node in transport_nodes['results']:
-        if transport_node.__contains__('display_name') and transport_node['display_name'] == display_name:
-            return transport_node
-    return None
-
-def get_dn_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-  transport_nodes = get_discovered_nodes(module, manager_url, mgr_username, mgr_password, validate_certs)
-  for transport_node in transport_nodes['results']:
-    if transport_node.__contains__('display_name') and transport_node['display_name'] == display_name:
-      return transport_node
-  return None
-
-def get_host_switch_id_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, endpoint,
-                                           display_name, exit_if_not_found=True):
-    try:
-      (rc, resp) = request(manager_url + endpoint, headers=dict(Accept='application/json'),
-                           url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs,
-                           ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing id for display name %s. Error [%s]' % (display_name, to_native(err)))
-
-    for result in resp['results']:
-      if result.__contains__('display_name') and result['display_name'] == display_name:
-        return result['uuid']
-    if exit_if_not_found:
-      module.fail_json(msg='No id exist with display name %s' % display_name)
 
 def wait_till_create(node_id, module, manager_url, mgr_username, mgr_password, validate_certs):
     try:
@@ -760,7 +686,6 @@ def wait_till_create(node_id, module, manager_url, mgr_username, mgr_password, v
                   module.fail_json(msg= 'Error creating transport node: creation state %s, node_deployment_state %s, Failure message: %s'%(str(resp['state']), str(resp['node_deployment_state']['state']), str(resp['failure_message'])))
           elif any(resp['state'] in progress_status for progress_status in SUCCESS_STATES) and\
           any(resp['node_deployment_state']['state'] in progress_status for progress_status in SUCCESS_STATES):
-              time.sleep(5)
               return
           elif any(resp['state'] in progress_status for progress_status in FAILED_STATES) or\
           any(resp['node_deployment_state']['state'] in progress_status for progress_status in FAILED_STATES):
@@ -778,301 +703,18 @@ def wait_till_delete(vm_id, module, manager_url, mgr_username, mgr_password, val
                         url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
           time.sleep(10)
     except Exception as err:
-      time.sleep(5)
       return
 
-def cmp_dict(dict1, dict2): # dict1 contain dict2
-    #print dict2
-    for k2, v2 in dict2.items():
-        found = False
-        if k2 not in dict1:
-            continue
-        if type(v2) != list and dict1[k2] != dict2[k2]:
-            return False
-            
-        for obj2 in v2:
-            for obj1 in dict1[k2]:
-                if all(item in obj1.items() for item in obj2.items()):
-                           found = True
-        if not found:
-            return False
-    return True
-
-def update_params_with_id (module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_params ):
-    if transport_node_params.__contains__('host_switch_spec'):
-        for host_switch in transport_node_params['host_switch_spec']['host_switches']:
-            if host_switch.__contains__('host_switch_type') and host_switch[
-              'host_switch_type'] in FABRIC_VIRTUAL_SWITCH_TYPE:
-                if host_switch.__contains__('host_switch_name'):
-                  host_switch['host_switch_id'] = get_host_switch_id_from_display_name(module, manager_url, mgr_username,
-                                                                                   mgr_password, validate_certs,
-                                                                                   '/fabric/virtual-switches',
-                                                                                   host_switch['host_switch_name'])
-                else:
-                  module.fail_json(
-                    msg='Failing as host_switch_name is not provided for host switch of type: %s' % host_switch[
-                      'host_switch_type'])
-            host_switch_profiles = host_switch.pop('host_switch_profiles', None)
-
-            host_switch_profile_ids = []
-            if host_switch_profiles is not None:
-                for host_switch_profile in host_switch_profiles:
-                    profile_obj = {}
-                    profile_obj['value'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                                        "/host-switch-profiles?include_system_owned=true", host_switch_profile['name'])
-                    profile_obj['key'] = host_switch_profile['type']
-                    host_switch_profile_ids.append(profile_obj)
-            host_switch['host_switch_profile_ids'] = host_switch_profile_ids
-            ip_pool_id = None
-            if host_switch.__contains__('ip_assignment_spec') and host_switch['ip_assignment_spec']['resource_type'] == 'StaticIpPoolSpec':
-                ip_pool_name = host_switch['ip_assignment_spec'].pop('ip_pool_name', None)
-                host_switch['ip_assignment_spec']['ip_pool_id'] = get_id_from_display_name (module, manager_url,
-                                                                                            mgr_username, mgr_password, validate_certs,
-                                                                                            "/pools/ip-pools", ip_pool_name)
-            if host_switch.__contains__('transport_zone_endpoints'):
-                for transport_zone_endpoint in host_switch['transport_zone_endpoints']:
-                    transport_zone_name = transport_zone_endpoint.pop('transport_zone_name', None)
-                    transport_zone_endpoint['transport_zone_id'] = get_id_from_display_name (module, manager_url,
-                                                                                             mgr_username, mgr_password, validate_certs,
-                                                                                             "/transport-zones", transport_zone_name)
-            if host_switch.__contains__('vmk_install_migration'):
-                for network in host_switch['vmk_install_migration']:
-                    if network.__contains__('destination_network'):
-                        network['destination_network'] = get_id_from_display_name (module, manager_url, mgr_username,
-                                                                                   mgr_password, validate_certs,
-                                                                                   "/logical-switches", network['destination_network'])
-
-    if transport_node_params.__contains__('transport_zone_endpoints'):
-        for transport_zone_endpoint in transport_node_params['transport_zone_endpoints']:
-            transport_zone_name = transport_zone_endpoint.pop('transport_zone_name', None)
-            transport_zone_endpoint['transport_zone_id'] = get_id_from_display_name (module, manager_url,
-                                                                                    mgr_username, mgr_password, validate_certs,
-                                                                                    "/transport-zones", transport_zone_name)
-    if transport_node_params.__contains__('node_deployment_info') and transport_node_params['node_deployment_info'].__contains__('resource_type') and transport_node_params['node_deployment_info']['resource_type'] == 'EdgeNode':
-        vc_name = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('vc_name', None)
-        transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['vc_id'] = get_id_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                    "/fabric/compute-managers", vc_name)
-
-    transport_node_params['display_name'] = transport_node_params.pop('display_name', None)
-    return transport_node_params
-
-def id_exist_in_list_dict_obj(key, list_obj1, list_obj2):
-    all_id_presents = False
-    if len(list_obj1) != len(list_obj2):
-        return all_id_presents
-    for dict_obj1 in list_obj1:
-        if dict_obj1.__contains__(key):
-            for dict_obj2 in list_obj2:
-                if dict_obj2.__contains__(key) and dict_obj1[key] == dict_obj2[key]:
-                    all_id_presents = True
-                    continue
-            if not all_id_presents:
-                return False
-    return True
-
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_with_ids):
     existing_transport_node = get_tn_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_with_ids['display_name'])
     
     if existing_transport_node is None:
         return False
-    if not existing_transport_node.__contains__('description') and transport_node_with_ids.__contains__('description'):
-        return True
-    if existing_transport_node.__contains__('description') and transport_node_with_ids.__contains__('description') and existing_transport_node['description'] != transport_node_with_ids['description']:
-        return True
-    if existing_transport_node.__contains__('description') and not transport_node_with_ids.__contains__('description'):
-        return True
-    if existing_transport_node.__contains__('tags') and not transport_node_with_ids.__contains__('tags'):
-        return True
-    if not existing_transport_node.__contains__('tags') and transport_node_with_ids.__contains__('tags'):
-        return True
-    if existing_transport_node.__contains__('tags') and transport_node_with_ids.__contains__('tags') and (not compareTags(existing_transport_node, transport_node_with_ids)):
-        return True
-
-    if transport_node_with_ids.__contains__('host_switch_spec') and transport_node_with_ids['host_switch_spec'].__contains__('host_switches'):
-        existing_host_switches = existing_transport_node['host_switch_spec']['host_switches']
-        sorted_existing_host_switches = sorted(existing_host_switches, key = lambda i: i['host_switch_name'])
-        sorted_new_host_switches = sorted(transport_node_with_ids['host_switch_spec']['host_switches'], key = lambda i: i['host_switch_name'])
-        if len(sorted_existing_host_switches) != len(sorted_new_host_switches):
-           return True
-        for i in range(len(sorted_existing_host_switches)):
-           diff_obj = {k: sorted_existing_host_switches[i][k] for k in sorted_existing_host_switches[i] if k in sorted_new_host_switches[i] and sorted_existing_host_switches[i][k] != sorted_new_host_switches[i][k]}
-           if not cmp_dict(diff_obj, sorted_new_host_switches[i]):
-              return True
-    return False
-
-def get_api_cert_thumbprint(ip_address, module):
-    ip = ipaddress.ip_address(ip_address)
-    if isinstance(ip, ipaddress.IPv4Address):
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    elif isinstance(ip, ipaddress.IPv6Address):
-        sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
-    sock.settimeout(1)
-    wrappedSocket = ssl.wrap_socket(sock)
-    try:
-        wrappedSocket.connect((ip_address, 443))
-    except Exception as err:
-        module.fail_json(msg='Failed to get node ID from ESXi host with IP {}. Error: {}'.format(ip_address, err))
-    else:
-        der_cert_bin = wrappedSocket.getpeercert(True)
-        thumb_sha256 = hashlib.sha256(der_cert_bin).hexdigest()
-        return thumb_sha256
-    finally:
-        wrappedSocket.close()
-
-
-def inject_vcenter_info(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_params):
-  '''
-  params:
-  - transport_node_params: These are the transport node parameters passed from playbook file
-  result:
-  - takes the vecenter parameters accepted by playbook and converts it into the form accepted
-    by transport node api using pyvmomi functions.
-  '''
-  vm_deployment_config = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']
-  if vm_deployment_config.__contains__('ignore_ssl_verification'):
-      ignore_ssl_verification = vm_deployment_config['ignore_ssl_verification']
-  else:
-      ignore_ssl_verification = True
-  if vm_deployment_config.__contains__('vc_username') and vm_deployment_config.__contains__('vc_password'):
-    vc_name = vm_deployment_config['vc_name']
-    vc_ip = get_vc_ip_from_display_name (module, manager_url, mgr_username, mgr_password, validate_certs,
-                                         "/fabric/compute-managers", vc_name)
-    
-        
-    vc_username = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('vc_username', None)
-        
-    vc_password = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('vc_password', None)
-
-    if vm_deployment_config.__contains__('host'):
-      host = vm_deployment_config.pop('host', None)
-      host_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
-                                    'host', host, ignore_ssl_verification)
-      transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['host_id'] = str(host_id)
-
-    storage = vm_deployment_config.pop('storage')
-    storage_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
-                                           'storage', storage, ignore_ssl_verification)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['storage_id'] = str(storage_id)
-
-    cluster = vm_deployment_config.pop('compute')
-    cluster_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
-                                           'cluster', cluster, ignore_ssl_verification)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['compute_id'] = str(cluster_id)
-
-    management_network = vm_deployment_config.pop('management_network')
-    management_network_id = get_resource_id_from_name(module, vc_ip, vc_username, vc_password,
-                                               'network', management_network, ignore_ssl_verification)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['management_network_id'] = str(management_network_id)
-
-    data_networks = vm_deployment_config.pop('data_networks')
-    data_network_ids = get_data_network_id_from_name(module, vc_ip, vc_username, vc_password,
-                                                data_networks, ignore_ssl_verification)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['data_network_ids'] = data_network_ids
-        
-    if vm_deployment_config.__contains__('host'):
-      transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('host', None)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('cluster', None)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('storage', None)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('management_network', None)
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('data_networks', None)
-  else:
-    if vm_deployment_config.__contains__('host'):
-      host_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('host', None)
-      transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['host_id'] = host_id
-        
-    cluster_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('compute', None)
-    storage_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('storage', None)
-    management_network_id = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('management_network', None)
-    data_network_ids = transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config'].pop('data_networks', None)
-        
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['compute_id'] = cluster_id
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['storage_id'] = storage_id
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['management_network_id'] = management_network_id
-    transport_node_params['node_deployment_info']['deployment_config']['vm_deployment_config']['data_network_ids'] = data_network_ids
-    transport_node_params['node_deployment_info']['vm_deployment_config'].pop('ignore_ssl_verification', None)
-
+    return transport_node_needs_update(existing_transport_node, transport_node_with_ids)
 
 def main():
   argument_spec = vmware_argument_spec()
-  argument_spec.update(display_name=dict(required=True, type='str'),
-                       ignore_ssl_verification=dict(required=False, type='boolean'),
-                       description=dict(required=False, type='str'),
-                       host_switch_spec=dict(required=False, type='dict',
-                       host_switches=dict(required=True, type='list'),
-                       resource_type=dict(required=True, type='str')),
-                       node_deployment_info=dict(required=False, type='dict',
-                       discovered_node_id=dict(required=False, type='str'),
-                       deployment_config=dict(required=False, type='dict',
-                       node_user_settings=dict(required=True, type='dict',
-                       cli_username=dict(required=False, type='str'),
-                       audit_username=dict(required=False, type='str'),
-                       root_password=dict(required=False, type='str', no_log=True),
-                       cli_password=dict(required=False, type='str', no_log=True),
-                       audit_password=dict(required=False, type='str', no_log=True)),
-                       vm_deployment_config=dict(required=True, type='dict',
-                       data_networks=dict(required=True, type='list'),
-                       management_network=dict(required=True, type='str'),
-                       vc_username=dict(required=False, type='str'),
-                       vc_password=dict(required=False, type='str', no_log=True),
-                       placement_type=dict(required=True, type='str'),
-                       compute=dict(required=True, type='str'),
-                       vc_name=dict(required=True, type='str'),
-                       ipv4_assignment_enabled=dict(required=False, type='boolean'),
-                       ipv6_assignment_type=dict(required=False, type='str'),
-                       storage=dict(required=True, type='str'),
-                       default_gateway_addresses=dict(required=False, type='list'),
-                       management_port_subnets=dict(required=False, type='list'),
-                       host=dict(required=False, type='str'),
-                       reservation_info=dict(required=False, type='dict',
-                       cpu_reservation=dict(required=False, type='dict',
-                       reservation_in_mhz=dict(required=False, type='int'),
-                       reservation_in_shares=dict(required=False, type='str')),
-                       memory_reservation=dict(required=False, type='dict',
-                       reservation_percentage=dict(required=False, type='int'))),
-                       resource_allocation=dict(required=False, type='dict',
-                       cpu_count=dict(required=False, type='int'),
-                       memory_allocation_in_mb=dict(required=False, type='int'))),
-                       form_factor=dict(required=False, type='str')),
-                       discovered_ip_addresses=dict(required=False, type='list'),
-                       ip_addresses=dict(required=False, type='list'),
-                       node_settings=dict(required=False, type='dict',
-                       advanced_configuration=dict(required=False, type='str'),
-                       allow_ssh_root_login=dict(required=False, type='boolean'),
-                       dns_servers=dict(required=False, type='str'),
-                       enable_ssh=dict(required=False, type='boolean'),
-                       hostname=dict(required=True, type='str'),
-                       ntp_servers=dict(required=False, type='list'),
-                       search_domains=dict(required=False, type='list'),
-                       syslog_servers=dict(required=False, type='list')),
-                       fqdn=dict(required=False, type='str'),
-                       os_version=dict(required=False, type='str'),
-                       managed_by_server=dict(required=False, type='str'),
-                       host_credential=dict(required=False, type='dict',
-                       username=dict(required=False, type='str'),
-                       password=dict(required=False, type='str', no_log=True),
-                       thumbprint=dict(required=False, type='str')),
-                       allocation_list=dict(required=False, type='list'),
-                       os_type=dict(required=True, type='str'),
-                       external_id=dict(required=False, type='str'),
-                       resource_type=dict(required=True, type='str'),
-                       deployment_type=dict(required=False, type='str')),
-                       maintenance_mode=dict(required=False, type='str'),
-                       remote_tunnel_endpoint=dict(required=False, type='dict',
-                       host_switch_name=dict(required=True, type='str'),
-                       named_teaming_policy=dict(required=False, type='str'),
-                       rtep_vlan=dict(required=True, type='dict',
-                       VlanID=dict(required=False, type='int')),
-                       ip_assignment_spec=dict(required=True, type='dict',
-                       resource_type=dict(required=True, type='str'),
-                       ip_pool_id=dict(required=False, type='str'),
-                       ip_list=dict(required=False, type='list'),
-                       ip_mac_list=dict(required=False, type='list'),
-                       default_gateway=dict(required=False, type='dict',
-                       IPAddress=dict(required=False, type='str')),
-                       subnet_mask=dict(required=False, type='dict',
-                       IPAddress=dict(required=False, type='str')))),
-                       tags=dict(required=False, type='list'),
-                       state=dict(required=True, choices=['present', 'absent']))
+  argument_spec.update(transport_node_argument_spec())
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
   transport_node_params = get_transport_node_params(module.params.copy())
@@ -1109,15 +751,7 @@ def main():
       if module.check_mode:
         module.exit_json(changed=True, debug_out=str(json.dumps(logical_switch_params)), id='12345')
 
-      if body["node_deployment_info"].__contains__('host_credential'):
-        if body["node_deployment_info"]["host_credential"].__contains__("thumbprint"):
-          thumbprint = body["node_deployment_info"]["host_credential"]["thumbprint"]
-        else:
-          if not body["node_deployment_info"].__contains__("ip_addresses"):
-            module.fail_json(msg="ESXi ip adresses are not provided")
-          esxi_ip_address = body["node_deployment_info"]["ip_addresses"][0]
-          thumbprint = get_api_cert_thumbprint(esxi_ip_address, module)
-          body["node_deployment_info"]["host_credential"]["thumbprint"] = thumbprint
+      inject_host_thumbprint(module, body)
       request_data = json.dumps(body)
       try:
           if not transport_node_id:
@@ -1135,7 +769,6 @@ def main():
            module.fail_json(msg="Failed to add transport node. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
       wait_till_create(resp['node_id'], module, manager_url, mgr_username, mgr_password, validate_certs)
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["node_id"], body= str(resp), message="Transport node with display name %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -1154,7 +787,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update transport node with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["node_id"], body= str(resp), message="Transport node with node id %s updated." % id)
 
   elif state == 'absent':
@@ -1171,22 +803,8 @@ def main():
         module.fail_json(msg="Failed to delete transport node with id %s. Error[%s]." % (id, to_native(err)))
 
     wait_till_delete(id, module, manager_url, mgr_username, mgr_password, validate_certs)
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="Transport node with node id %s deleted." % id)
 
 
-def compareTags(existing_transport_node, new_transport_nodes):
-    return ordered(existing_transport_node['tags']) == ordered(new_transport_nodes['tags'])
-
-
-def ordered(obj):
-    if isinstance(obj, dict):
-        return sorted((k, ordered(v)) for k, v in obj.items())
-    if isinstance(obj, list):
-        return sorted(ordered(x) for x in obj)
-    else:
-        return obj
-
-
 if __name__ == '__main__':
     main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+DOCUMENTATION = '''
+---
+module: nsxt_transport_nodes_bulk
+short_description: 'Create, update or delete multiple Transport Nodes'
+description: "Brings a list of transport nodes to their desired state. The
+              references of all the nodes are resolved once, the requests are
+              submitted concurrently and the created and deleted nodes are
+              then awaited together, polling the state of all the transport
+              nodes in one request."
+version_added: '3.2'
+author: 'Rahul Raghuvanshi'
+options:
+    hostname:
+        description: 'Deployed NSX manager hostname.'
+        required: true
+        type: str
+    username:
+        description: 'The username to authenticate with the NSX manager.'
+        required: true
+        type: str
+    password:
+        description: 'The password to authenticate with the NSX manager.'
+        required: true
+        type: str
+    concurrency:
+        description: 'Maximum number of requests submitted at the same time,
+                      at least 1.'
+        required: false
+        type: int
+        default: 8
+    timeout:
+        description: "Seconds to wait for the created transport nodes to be
+                      ready and for the deleted ones to be removed."
+        required: false
+        type: int
+        default: 3600
+    transport_nodes:
+        description: 'Transport nodes to be managed. The options of each
+                      transport node are the ones of nsxt_transport_nodes,
+                      display_name and state included.'
+        required: true
+        type: list
+        elements: dict
+'''
+
+EXAMPLES = '''
+- name: Create transport nodes
+  nsxt_transport_nodes_bulk:
+    hostname: "10.192.167.137"
+    username: "admin"
+    password: "Admin!23Admin"
+    validate_certs: False
+    concurrency: 16
+    transport_nodes:
+    - display_name: TN-host-1
+      host_switch_spec:
+        resource_type: StandardHostSwitchSpec
+        host_switches:
+        - host_switch_profiles:
+          - name: uplinkProfile1
+            type: UplinkHostSwitchProfile
+          host_switch_name: hostswitch1
+          pnics:
+          - device_name: vmnic1
+            uplink_name: "uplink-1"
+          ip_assignment_spec:
+            resource_type: StaticIpPoolSpec
+            ip_pool_name: "IPPool-IPV4-1"
+          transport_zone_endpoints:
+          - transport_zone_name: "TZ1"
+      node_deployment_info:
+        resource_type: "HostNode"
+        display_name: "Host_1"
+        ip_addresses: ["10.149.55.21"]
+        os_type: "ESXI"
+        os_version: "6.5.0"
+        host_credential:
+          username: "root"
+          password: "ca$hc0w"
+      state: present
+    - display_name: TN-host-2
+      state: absent
+'''
+
+RETURN = '''
+results:
+    description: One entry per transport node with its display_name, id, the
+                 action taken (create, update, delete or none) and, for the
+                 submitted ones, its final status (success, failed or
+                 timed_out), the seconds waited for it and the error if any.
+    returned: always
+    type: list
+'''
+
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator, \
+    get_all_resources
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.transport_node_utils import transport_node_argument_spec, \
+    get_transport_node_params, get_tn_from_display_name, get_dn_from_display_name, update_params_with_id, \
+    transport_node_needs_update, inject_vcenter_info, inject_host_thumbprint, get_transport_node_status, \
+    get_transport_node_states
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import wait_for_all, \
+    get_certificate_thumbprints, IN_PROGRESS, SUCCESS, FAILED
+from ansible.module_utils._text import to_native
+
+def get_operation(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node):
+    '''
+    params:
+    - transport_node: Transport node as specified in the playbook.
+    result:
+    The operation that brings the transport node to the desired state, with
+    the references of its body resolved to ids.
+    '''
+    state = transport_node['state']
+    transport_node_params = get_transport_node_params(transport_node.copy())
+    display_name = transport_node_params['display_name']
+    operation = dict(display_name=display_name, action='none', uri=None, method=None, body=None)
+    existing_transport_node = get_tn_from_display_name(module, manager_url, mgr_username, mgr_password,
+                                                       validate_certs, display_name)
+    if existing_transport_node is not None:
+        operation['id'] = existing_transport_node['id']
+    if state == 'absent':
+        if existing_transport_node is not None:
+            operation.update(action='delete', method='DELETE',
+                             uri='/transport-nodes/%s' % existing_transport_node['id'])
+        return operation
+
+    if transport_node_params.__contains__('node_deployment_info') and \
+            transport_node_params['node_deployment_info']['resource_type'] == 'EdgeNode':
+        inject_vcenter_info(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node_params)
+    body = update_params_with_id(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                 transport_node_params)
+    if existing_transport_node is None:
+        discovered_node = get_dn_from_display_name(module, manager_url, mgr_username, mgr_password,
+                                                   validate_certs, display_name)
+        if discovered_node:
+            uri = '/fabric/discovered-nodes/%s?action=create_transport_node' % discovered_node['external_id']
+        else:
+            uri = '/transport-nodes'
+        operation.update(action='create', method='POST', uri=uri, body=body)
+    elif transport_node_needs_update(existing_transport_node, body):
+        body['_revision'] = existing_transport_node['_revision']
+        body['node_id'] = existing_transport_node['id']
+        operation.update(action='update', method='PUT',
+                         uri='/transport-nodes/%s' % existing_transport_node['id'], body=body)
+    return operation
+
+def submit_operations(communicator, operations, concurrency):
+    '''
+    result:
+    Submits the operations, concurrency of them at a time, and returns one
+    (response, error) tuple per operation.
+    '''
+    def submit(operation):
+        try:
+            (rc, resp) = communicator.request(operation['uri'], data=operation['body'],
+                                              method=operation['method'])
+            return resp, None
+        except Exception as err:
+            return None, to_native(err)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        return list(executor.map(submit, operations))
+    finally:
+        executor.shutdown()
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(transport_nodes=dict(required=True, type='list', elements='dict',
+                                            options=transport_node_argument_spec()),
+                       concurrency=dict(required=False, type='int', default=8),
+                       timeout=dict(required=False, type='int', default=3600))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+  mgr_hostname = module.params['hostname']
+  mgr_username = module.params['username']
+  mgr_password = module.params['password']
+  validate_certs = module.params['validate_certs']
+  manager_url = 'https://{}/api/v1'.format(mgr_hostname)
+  communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+
+  if module.params['concurrency'] < 1:
+    module.fail_json(msg="concurrency must be at least 1, got %d." % module.params['concurrency'])
+
+  display_names = [transport_node['display_name'] for transport_node in module.params['transport_nodes']]
+  for display_name in display_names:
+    if display_names.count(display_name) > 1:
+      module.fail_json(msg="Transport node with display name %s is specified more than once." % display_name)
+
+  # Both collections are listed once, the lookups of every node are then
+  # served from them.
+  get_all_resources(module, manager_url, mgr_username, mgr_password, validate_certs, '/transport-nodes')
+  get_all_resources(module, manager_url, mgr_username, mgr_password, validate_certs, '/fabric/discovered-nodes')
+  operations = [get_operation(module, manager_url, mgr_username, mgr_password, validate_certs, transport_node)
+                for transport_node in module.params['transport_nodes']]
+
+  results = []
+  for operation in operations:
+    result = dict(display_name=operation['display_name'], action=operation['action'])
+    if operation.get('id'):
+      result['id'] = operation['id']
+    results.append(result)
+  pending = [(operation, result) for operation, result in zip(operations, results)
+             if operation['action'] != 'none']
+  if not pending:
+    module.exit_json(changed=False, results=results,
+                     message="All the transport nodes are already in the desired state.")
+  if module.check_mode:
+    module.exit_json(changed=True, results=results,
+                     debug_out=str(json.dumps([dict(uri=operation['uri'], method=operation['method'],
+                                                    body=operation['body'])
+                                               for operation, result in pending])))
+
+  # The certificates of all the hosts are fetched concurrently, the
+  # thumbprints are then injected from the cache.
+  esxi_ip_addresses = []
+  for operation, result in pending:
+    node_deployment_info = (operation['body'] or {}).get('node_deployment_info', {})
+    if operation['action'] == 'create' and node_deployment_info.__contains__('host_credential') and \
+        not node_deployment_info['host_credential'].__contains__('thumbprint') and \
+        node_deployment_info.__contains__('ip_addresses'):
+      esxi_ip_addresses.append(node_deployment_info['ip_addresses'][0])
+  thumbprints, errors = get_certificate_thumbprints(esxi_ip_addresses, max_workers=module.params['concurrency'])
+  if errors:
+    module.fail_json(msg="Failed to get the certificate thumbprint of the ESXi hosts. Errors: %s" %
+                         ', '.join('%s: %s' % (ip_address, error) for ip_address, error in sorted(errors.items())))
+  for operation, result in pending:
+    if operation['action'] == 'create':
+      inject_host_thumbprint(module, operation['body'])
+  responses = submit_operations(communicator, [operation for operation, result in pending],
+                                module.params['concurrency'])
+
+  # id -> (action, result) of the nodes whose creation or deletion is awaited
+  awaited = dict()
+  changed = False
+  for (operation, result), (resp, error) in zip(pending, responses):
+    if error is not None:
+      result.update(status=FAILED, error=error)
+      continue
+    changed = True
+    if operation['action'] == 'create':
+      result['id'] = resp['node_id']
+    if operation['action'] == 'update':
+      result['status'] = SUCCESS
+    else:
+      awaited[result['id']] = (operation['action'], result)
+
+  def get_statuses(ids):
+    transport_node_states = get_transport_node_states(communicator)
+    statuses = dict()
+    for id in ids:
+      action, result = awaited[id]
+      if action == 'delete':
+        statuses[id] = SUCCESS if id not in transport_node_states else IN_PROGRESS
+      elif id in transport_node_states:
+        statuses[id] = get_transport_node_status(transport_node_states[id])
+        if statuses[id] == FAILED:
+          result['error'] = transport_node_states[id].get('failure_message')
+      else:
+        statuses[id] = IN_PROGRESS
+    return statuses
+
+  try:
+    statuses, waited = wait_for_all(get_statuses, list(awaited), time_out=module.params['timeout'])
+  except Exception as err:
+    module.fail_json(changed=changed, results=results,
+                     msg="Error accessing the state of the transport nodes. Error [%s]" % to_native(err))
+  for id, (action, result) in awaited.items():
+    result.update(status=statuses[id], elapsed=round(waited[id], 1))
+
+  failed = [result['display_name'] for operation, result in pending if result['status'] != SUCCESS]
+  if failed:
+    module.fail_json(changed=changed, results=results,
+                     msg="Failed to apply the transport nodes with display names %s." % ', '.join(failed))
+  module.exit_json(changed=True, results=results,
+                   message="%d transport node operations applied." % len(pending))
+
+
+if __name__ == '__main__':
+    main()
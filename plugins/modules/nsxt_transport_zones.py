@@ -126,7 +126,7 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.nsxt_resource_urls import TRANSPORT_ZONE_URL
@@ -252,7 +252,6 @@ def main():
       except Exception as err:
         module.fail_json(
           msg="Failed to add transport zone. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body=str(resp),
                        message="Transport zone with display name %s created. " % (module.params['display_name']))
     else:
@@ -271,7 +270,6 @@ def main():
         module.fail_json(msg="Failed to update transport zone with id %s. Request body [%s]. Error[%s]." % (
           id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body=str(resp),
                        message="Transport zone with zone id %s updated." % id)
 
@@ -288,7 +286,6 @@ def main():
     except Exception as err:
       module.fail_json(msg="Failed to delete transport zone with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="Transport zone with zone id %s deleted." % id)
 
 
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2019 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+DOCUMENTATION = '''
+---
+module: nsxt_upgrade_groups_planner
+short_description: 'Plans the upgrade unit groups for parallel upgrades'
+description: "Reads the vSphere clusters of the host transport nodes and the
+              edge clusters, then creates or updates upgrade unit groups so
+              that as many units as the constraints allow are upgraded at
+              the same time, and enables the parallel upgrade of the groups
+              in the upgrade plan of the component.
+
+              The hosts of a vSphere cluster are dealt into
+              max_hosts_in_maintenance serial groups, or put in one parallel
+              group if it has no more hosts. The edges of an edge cluster are
+              dealt likewise, so that edges_kept_up of them stay up; an edge
+              cluster with no more edges is skipped with a warning and its
+              edges are left in their groups. The hosts and edges in no
+              cluster are put in one parallel group.
+              Groups are created through the same API as nsxt_upgrade_groups,
+              which moves their units from their previous groups."
+version_added: '3.2'
+author: 'Kommireddy Akhilesh'
+options:
+    hostname:
+        description: 'Deployed NSX manager hostname.'
+        required: true
+        type: str
+    username:
+        description: 'The username to authenticate with the NSX manager.'
+        required: true
+        type: str
+    password:
+        description: 'The password to authenticate with the NSX manager.'
+        required: true
+        type: str
+    component_types:
+        description: 'Component types whose upgrade unit groups are planned.'
+        required: false
+        type: list
+        elements: str
+        choices:
+            - host
+            - edge
+        default: ['host', 'edge']
+    max_hosts_in_maintenance:
+        description: 'Maximum number of hosts of a vSphere cluster upgraded,
+                      hence in maintenance mode, at the same time.'
+        required: false
+        type: int
+        default: 1
+    edges_kept_up:
+        description: 'Number of edges of an edge cluster that stay up while
+                      the other ones are upgraded, at least 0.'
+        required: false
+        type: int
+        default: 1
+    group_name_prefix:
+        description: "Prefix of the display name of the planned groups,
+                      which is followed by the name of the cluster and the
+                      number of the group in the cluster."
+        required: false
+        type: str
+        default: ''
+    remove_stale_groups:
+        description: "Whether the groups whose display name starts with
+                      group_name_prefix but that are no longer planned, e.g.
+                      of a removed cluster, are deleted. They are only
+                      reported otherwise. Requires a group_name_prefix."
+        required: false
+        type: bool
+        default: false
+'''
+
+EXAMPLES = '''
+- name: Plans the host and edge upgrade groups
+  nsxt_upgrade_groups_planner:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      max_hosts_in_maintenance: 2
+      edges_kept_up: 1
+      group_name_prefix: 'planned-'
+'''
+
+RETURN = '''
+plan:
+    description: "Planned upgrade unit groups with their display_name, type,
+                  parallel flag, upgrade_units and whether they were created,
+                  updated or left unchanged."
+    returned: always
+    type: list
+skipped_clusters:
+    description: "Per component type, the clusters none of whose units can
+                  be upgraded while keeping the required ones up, hence left
+                  out of the plan."
+    returned: always
+    type: dict
+stale_groups:
+    description: "Groups whose display name starts with group_name_prefix
+                  but that are no longer planned, with their id, display_name,
+                  type and whether they were deleted. Only listed when
+                  group_name_prefix is set."
+    returned: always
+    type: list
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_manager_communicator
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_upgrade_orchestrator_node
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.upgrade_utils import plan_upgrade_groups
+from ansible.module_utils._text import to_native
+
+# Cluster of the hosts and edges that aren't in any
+STANDALONE_CLUSTER = 'standalone'
+
+def get_host_clusters(communicator):
+  '''
+  Returns a dict from the id of every host transport node to the display name
+  of its vSphere cluster.
+  '''
+  compute_collections = dict((compute_collection['external_id'], compute_collection['display_name'])
+                             for compute_collection in communicator.get_all_results('/fabric/compute-collections'))
+  discovered_nodes = dict((discovered_node['external_id'], discovered_node.get('parent_compute_collection'))
+                          for discovered_node in communicator.get_all_results('/fabric/discovered-nodes'))
+  host_clusters = dict()
+  for transport_node in communicator.get_all_results('/transport-nodes'):
+    node_deployment_info = transport_node.get('node_deployment_info', {})
+    if node_deployment_info.get('resource_type') != 'HostNode':
+      continue
+    compute_collection = discovered_nodes.get(node_deployment_info.get('discovered_node_id'))
+    if compute_collection in compute_collections:
+      for node_id in (transport_node['id'], transport_node.get('node_id')):
+        host_clusters[node_id] = compute_collections[compute_collection]
+  return host_clusters
+
+def get_edge_clusters(communicator):
+  '''
+  Returns a dict from the id of every edge transport node in an edge cluster
+  to the display name of its edge cluster.
+  '''
+  edge_clusters = dict()
+  for edge_cluster in communicator.get_all_results('/edge-clusters'):
+    for member in edge_cluster.get('members', []):
+      edge_clusters[member['transport_node_id']] = edge_cluster['display_name']
+  return edge_clusters
+
+def get_units_by_cluster(communicator, component_type, clusters):
+  units_by_cluster = dict()
+  for unit in communicator.get_all_results('/upgrade/upgrade-units?component_type=%s' % component_type):
+    cluster = clusters.get(unit['id'], STANDALONE_CLUSTER)
+    units_by_cluster.setdefault(cluster, []).append(unit)
+  return units_by_cluster
+
+def plan_component(module, communicator, component_type):
+  '''
+  Returns the planned groups of the component and the clusters skipped.
+  '''
+  if component_type == 'HOST':
+    units_by_cluster = get_units_by_cluster(communicator, component_type, get_host_clusters(communicator))
+    max_units_down = dict((cluster, module.params['max_hosts_in_maintenance'])
+                          for cluster in units_by_cluster if cluster != STANDALONE_CLUSTER)
+  else:
+    units_by_cluster = get_units_by_cluster(communicator, component_type, get_edge_clusters(communicator))
+    max_units_down = dict((cluster, len(units) - module.params['edges_kept_up'])
+                          for cluster, units in units_by_cluster.items() if cluster != STANDALONE_CLUSTER)
+  return plan_upgrade_groups(component_type, units_by_cluster, max_units_down,
+                             module.params['group_name_prefix'])
+
+def get_stale_groups(module, groups, existing_groups):
+  '''
+  Returns the existing groups named with group_name_prefix that aren't
+  planned anymore.
+  '''
+  prefix = module.params['group_name_prefix']
+  if not prefix:
+    return []
+  planned_names = set(group['display_name'] for group in groups)
+  return [existing_groups[display_name] for display_name in sorted(existing_groups)
+          if display_name.startswith(prefix) and display_name not in planned_names]
+
+def get_group_action(group, existing_group):
+  if existing_group is None:
+    return 'create'
+  existing_unit_ids = set(unit['id'] for unit in existing_group.get('upgrade_units', []))
+  if existing_group.get('parallel') != group['parallel'] or \
+     existing_group.get('enabled') is False or \
+     existing_unit_ids != set(unit['id'] for unit in group['upgrade_units']):
+    return 'update'
+  return None
+
+def enable_parallel_groups(communicator, component_type):
+  '''
+  Makes the upgrade plan of the component upgrade its groups in parallel.
+  Returns True if the plan was changed.
+  '''
+  (rc, settings) = communicator.request('/upgrade/plan/%s/settings' % component_type)
+  if settings.get('parallel'):
+    return False
+  settings['parallel'] = True
+  communicator.request('/upgrade/plan/%s/settings' % component_type, data=settings, method='PUT')
+  return True
+
+def main():
+  argument_spec = vmware_argument_spec()
+  argument_spec.update(component_types=dict(type='list', elements='str', required=False,
+                                            choices=['host', 'edge'], default=['host', 'edge']),
+                       max_hosts_in_maintenance=dict(type='int', required=False, default=1),
+                       edges_kept_up=dict(type='int', required=False, default=1),
+                       group_name_prefix=dict(type='str', required=False, default=''),
+                       remove_stale_groups=dict(type='bool', required=False, default=False))
+
+  module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+  mgr_hostname = module.params['hostname']
+  mgr_username = module.params['username']
+  mgr_password = module.params['password']
+  validate_certs = module.params['validate_certs']
+
+  if module.params['max_hosts_in_maintenance'] < 1:
+    module.fail_json(msg='max_hosts_in_maintenance must be at least 1')
+  if module.params['edges_kept_up'] < 0:
+    module.fail_json(msg='edges_kept_up must be at least 0')
+  if module.params['remove_stale_groups'] and not module.params['group_name_prefix']:
+    module.fail_json(msg='remove_stale_groups requires a group_name_prefix')
+
+  headers = dict(Accept="application/json")
+  headers['Content-Type'] = 'application/json'
+
+  mgr_hostname = get_upgrade_orchestrator_node(module, mgr_hostname, mgr_username, 
+                                            mgr_password, headers, validate_certs)
+
+  manager_url = 'https://{}/api/v1'.format(mgr_hostname)
+  communicator = get_manager_communicator(manager_url, mgr_username, mgr_password, validate_certs)
+
+  plan = []
+  skipped_clusters = dict()
+  stale_groups = []
+  changed = False
+  for component_type in [component_type.upper() for component_type in module.params['component_types']]:
+    try:
+      groups, skipped = plan_component(module, communicator, component_type)
+      existing_groups = dict((group['display_name'], group) for group in communicator.get_all_results(
+                             '/upgrade/upgrade-unit-groups?component_type=%s' % component_type))
+    except Exception as err:
+      module.fail_json(msg='Failed to plan the %s upgrade unit groups. Error[%s].' %
+                           (component_type, to_native(err)))
+    if skipped:
+      skipped_clusters[component_type] = skipped
+      module.warn('The %s units of the clusters %s are left in their groups, as none of them can be'
+                  ' upgraded while keeping the required ones up.' % (component_type, ', '.join(skipped)))
+    for group in groups:
+      existing_group = existing_groups.get(group['display_name'])
+      action = get_group_action(group, existing_group)
+      plan.append(dict(group, action=action))
+      if action is None:
+        continue
+      changed = True
+      if module.check_mode:
+        continue
+      try:
+        if action == 'create':
+          communicator.request('/upgrade/upgrade-unit-groups', data=group, method='POST')
+        else:
+          existing_group.update(group)
+          communicator.request('/upgrade/upgrade-unit-groups/%s' % existing_group['id'],
+                               data=existing_group, method='PUT')
+      except Exception as err:
+        module.fail_json(msg='Failed to %s the upgrade unit group %s. Error[%s].' %
+                             (action, group['display_name'], to_native(err)), plan=plan)
+    for stale_group in get_stale_groups(module, groups, existing_groups):
+      deleted = module.params['remove_stale_groups']
+      stale_groups.append(dict(id=stale_group['id'], display_name=stale_group['display_name'],
+                               type=component_type, deleted=deleted))
+      if not deleted:
+        continue
+      changed = True
+      if module.check_mode:
+        continue
+      try:
+        communicator.request('/upgrade/upgrade-unit-groups/%s' % stale_group['id'], method='DELETE')
+      except Exception as err:
+        module.fail_json(msg='Failed to delete the upgrade unit group %s. Error[%s].' %
+                             (stale_group['display_name'], to_native(err)), plan=plan)
+    # The limits only hold once the groups run in parallel
+    if len(groups) > 1 and not module.check_mode:
+      try:
+        changed = enable_parallel_groups(communicator, component_type) or changed
+      except Exception as err:
+        module.fail_json(msg='Failed to enable the parallel upgrade of the %s groups. Error[%s].' %
+                             (component_type, to_native(err)), plan=plan)
+
+  module.exit_json(changed=changed, plan=plan, skipped_clusters=skipped_clusters, stale_groups=stale_groups)
+
+
+if __name__ == '__main__':
+    main()
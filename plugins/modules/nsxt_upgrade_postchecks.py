@@ -69,7 +69,7 @@ import json, time
 from csv import reader
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_attribute_from_endpoint, clean_and_get_params, get_upgrade_orchestrator_node
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_attribute_from_endpoint, clean_and_get_params, get_upgrade_orchestrator_node, wait_until
 from ansible.module_utils._text import to_native
 
 def wait_for_post_upgrade_checks_to_execute(module, manager_url, endpoint, mgr_username,
@@ -84,29 +84,25 @@ def wait_for_post_upgrade_checks_to_execute(module, manager_url, endpoint, mgr_u
     Function will wait till the attribute value derived from going deep to attribute list
     becomes equal to desired_attribute_value.
    '''
-  operation_time = 0
-  while True:
+  def are_checks_completed():
     try:
       (rc, resp) = request(manager_url + endpoint, headers=dict(Accept='application/json'),
                            url_username=mgr_username, url_password=mgr_password, 
                            validate_certs=validate_certs, ignore_errors=True)
     except Exception as err:
        module.fail_json(msg="Failed while polling for post upgrade checks to complete. Error[%s]." % to_native(err))
-    if resp.__contains__('results'):
-      flag = True
-      results = resp['results']
-      for result in results:
-        if result['post_upgrade_status']['status'] != 'COMPLETED' and \
-           result['type'] == component_type.upper() and \
-           result['upgrade_unit_count'] > 0 and \
-           result['status'] != 'NOT_STARTED':
-          flag = False
-      if flag:
-        return None
-    time.sleep(15)
-    operation_time = operation_time + 15
-    if operation_time > time_out:
-      raise Exception('Operation timed out.')
+    if not resp.__contains__('results'):
+      return False
+    flag = True
+    results = resp['results']
+    for result in results:
+      if result['post_upgrade_status']['status'] != 'COMPLETED' and \
+         result['type'] == component_type.upper() and \
+         result['upgrade_unit_count'] > 0 and \
+         result['status'] != 'NOT_STARTED':
+        flag = False
+    return flag
+  wait_until(are_checks_completed, time_out=time_out, interval=5, max_interval=15)
 
 def main():
   argument_spec = vmware_argument_spec()
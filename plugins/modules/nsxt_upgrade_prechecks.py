@@ -74,7 +74,7 @@ import json, time
 from csv import reader
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_attribute_from_endpoint, clean_and_get_params, get_upgrade_orchestrator_node
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_attribute_from_endpoint, clean_and_get_params, get_upgrade_orchestrator_node, wait_until
 from ansible.module_utils._text import to_native
 
 def wait_for_pre_upgrade_checks_to_execute(module, manager_url, endpoint, mgr_username,
@@ -88,29 +88,23 @@ def wait_for_pre_upgrade_checks_to_execute(module, manager_url, endpoint, mgr_us
     Function will wait till the attribute value derived from going deep to attribute list
     becomes equal to desired_attribute_value.
    '''
-  operation_time = 0
-  while True:
-    try:
-      (rc, resp) = request(manager_url + endpoint, headers=dict(Accept='application/json'),
-                           url_username=mgr_username, url_password=mgr_password, 
-                           validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-       pass
-    if resp.__contains__('component_status'):
-      flag = True
-      component_statuses = resp['component_status']
-      for component_status in component_statuses:
-        if component_status['pre_upgrade_status']['status'] == 'ABORTED':
-          module.exit_json(changed= False, message='Pre upgrade checks started to run,'
-                                                   ' but aborted before they could finish.')
-        if component_status['pre_upgrade_status']['status'] != 'COMPLETED':
-          flag = False
-      if flag:
-        return None
-    time.sleep(15)
-    operation_time = operation_time + 15
-    if operation_time > time_out:
-      raise Exception('Operation timed out.')
+  def are_checks_completed():
+    (rc, resp) = request(manager_url + endpoint, headers=dict(Accept='application/json'),
+                         url_username=mgr_username, url_password=mgr_password, 
+                         validate_certs=validate_certs, ignore_errors=True)
+    if not resp.__contains__('component_status'):
+      return False
+    flag = True
+    component_statuses = resp['component_status']
+    for component_status in component_statuses:
+      if component_status['pre_upgrade_status']['status'] == 'ABORTED':
+        module.exit_json(changed= False, message='Pre upgrade checks started to run,'
+                                                 ' but aborted before they could finish.')
+      if component_status['pre_upgrade_status']['status'] != 'COMPLETED':
+        flag = False
+    return flag
+  wait_until(are_checks_completed, time_out=time_out, interval=5, max_interval=15,
+             tolerated_errors=None)
 
 def main():
   argument_spec = vmware_argument_spec()
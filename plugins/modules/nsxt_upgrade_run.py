@@ -43,6 +43,30 @@ options:
         description: 'Mode of upgrade'
         required: true
         type: bool
+    checkpoint_file:
+        description: "Path of a local file where the progress of the upgrade is
+                      saved: the actions taken, the current component and the
+                      last seen statuses of the components and of the upgrade
+                      unit groups. When the module is run again after an
+                      interruption, the upgrade started by the earlier run is
+                      awaited instead of failing as being in progress, and the
+                      plan isn't started or continued again while the upgrade
+                      is in progress. Only an upgrade saved as in progress,
+                      pausing or paused is resumed; the checkpoint is saved as
+                      completed once the system is upgraded."
+        required: false
+        type: str
+    progress_log:
+        description: "Path of a local file to which the progress of the
+                      upgrade is appended, as one JSON line per change of a
+                      component or of an upgrade unit group."
+        required: false
+        type: str
+    timeout:
+        description: "Seconds after which the module stops waiting for the
+                      upgrade of a component. No limit if not set."
+        required: false
+        type: int
 '''
 
 EXAMPLES = '''
@@ -53,21 +77,63 @@ EXAMPLES = '''
       password: "Admin!23Admin"
       validate_certs: False
       paused_upgrade: True
+
+# The upgrade takes hours, so that it can run in the background while other
+# hosts are handled. It is resumed from the checkpoint if it gets interrupted.
+- name: Runs the upgrade without pauses
+  nsxt_upgrade_run:
+      hostname: "10.192.167.137"
+      username: "admin"
+      password: "Admin!23Admin"
+      validate_certs: False
+      paused_upgrade: False
+      checkpoint_file: "/var/tmp/nsxt-upgrade-10.192.167.137.json"
+  async: 43200
+  poll: 0
+  register: upgrade_job
+
+- name: Waits for the upgrade
+  async_status:
+      jid: "{{ upgrade_job.ansible_job_id }}"
+  register: upgrade_result
+  until: upgrade_result.finished
+  retries: 720
+  delay: 60
 '''
 
-RETURN = '''# '''
+RETURN = '''
+checkpoint:
+    description: "In paused mode, the checkpoint saved to checkpoint_file,
+                  with the actions taken and the last seen statuses."
+    returned: when checkpoint_file is set
+    type: dict
+progress:
+    description: "Progress of the upgrade units tracked during the run. For
+                  every component, its status, its number of units, of
+                  upgraded and of failed ones, the mean_unit_duration in
+                  seconds, the throughput in units per hour and the eta in
+                  seconds, None while unknown. The eta of the whole upgrade
+                  is the sum of the ones of the components left."
+    returned: success
+    type: dict
+'''
 
 import json, time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_attribute_from_endpoint, clean_and_get_params, get_upgrade_orchestrator_node
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import get_attribute_from_endpoint, clean_and_get_params, get_upgrade_orchestrator_node, wait_until, append_json_line
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.upgrade_utils import new_checkpoint, load_checkpoint, \
+    save_checkpoint, can_resume, record_completion, record_action, record_statuses, get_unit_group_statuses, UpgradeProgress, \
+    update_upgrade_progress
 from ansible.module_utils._text import to_native
 
-def get_upgrade_status(module, manager_url, mgr_username, mgr_password, validate_certs):
+def get_upgrade_status(module, manager_url, mgr_username, mgr_password, validate_certs,
+                       resume=False, checkpoint=None):
   '''
   Get the current status of upgrade at the start.
   Doesn't upgrade if any component is in progress 
-  or system is already upgraded.
+  or system is already upgraded, unless resume is set, i.e. the upgrade
+  in progress was started by an earlier run.
   '''
   no_of_checks = 0
   while True:
@@ -78,9 +144,12 @@ def get_upgrade_status(module, manager_url, mgr_username, mgr_password, validate
                      False)
     no_of_checks = no_of_checks + 1
     if upgrade_status == 'IN_PROGRESS' or upgrade_status == 'PAUSING':
+      if resume:
+        return upgrade_status
       if no_of_checks > 2:
         module.fail_json(msg='Upgrade is in state: %s, can\'t continue' % upgrade_status)
     elif upgrade_status == 'SUCCESS':
+      save_completed_checkpoint(module, checkpoint)
       module.exit_json(changed=False, message='Upgrade state is SUCCESS. No need to'
                     ' continue.')
     else:
@@ -94,11 +163,14 @@ def call_get_sync(managerUrl, endpoint, mgrUsername, mgrPassword, validateCerts)
 
 
 def decide_next_step(module, manager_url, mgr_username, mgr_password,
-                     validate_certs, can_continue, is_failed):
+                     validate_certs, can_continue, is_failed, progress=None,
+                     checkpoint=None):
   '''
   params:
   - can_continue: if upgrade can be continued 
   - is_failed: Is there any component Failure
+  - progress: UpgradeProgress whose summary is returned once upgraded
+  - checkpoint: checkpoint saved as completed once upgraded
   return:
   - Decides the next operation to be done based on 
     can_continue and is_failed values 
@@ -111,7 +183,6 @@ def decide_next_step(module, manager_url, mgr_username, mgr_password,
     raise Exception('Upgrade failed. Please run upgrade status summary'
                     ' to see the reason of upgrade failure.')
   else:
-    time.sleep(15)
     try:
       upgrade_status = get_attribute_from_endpoint(module, manager_url, '/upgrade/summary',
                         mgr_username, mgr_password, validate_certs, 'upgrade_status',
@@ -119,7 +190,9 @@ def decide_next_step(module, manager_url, mgr_username, mgr_password,
     except Exception as err:
       return
     if upgrade_status == 'SUCCESS':
-      module.exit_json(changed=True, message='System has been upgraded successfully!!!')
+      save_completed_checkpoint(module, checkpoint)
+      module.exit_json(changed=True, message='System has been upgraded successfully!!!',
+                       progress=progress.get_summary(time.time()) if progress is not None else None)
     elif upgrade_status == 'IN_PROGRESS' or upgrade_status == 'PAUSING' or upgrade_status == 'PAUSED':
       return
     else:
@@ -127,21 +200,26 @@ def decide_next_step(module, manager_url, mgr_username, mgr_password,
         ' is %s. Please run upgrade status summary to see the reason.' % upgrade_status)
 
 
-def check_continuity(module, manager_url, mgr_username, mgr_password, validate_certs):
+def check_continuity(module, manager_url, mgr_username, mgr_password, validate_certs,
+                     component_status_list=None):
   '''
+  params:
+  - component_status_list: component_status of the upgrade status summary,
+    fetched if None.
   Returns:
   Based on the output of upgrade status summary API, gets the
   checks and returns if upgrade can be continued and
   if there is any component fail in the upgrade
   '''
-  try:
-    component_status_list = get_attribute_from_endpoint(module, manager_url, 
-                          '/upgrade/status-summary', mgr_username, mgr_password,
-                          validate_certs, 'component_status', False)
-  except Exception as err:
-    can_continue = True
-    is_failed = True
-    return can_continue, is_failed
+  if component_status_list is None:
+    try:
+      component_status_list = get_attribute_from_endpoint(module, manager_url, 
+                            '/upgrade/status-summary', mgr_username, mgr_password,
+                            validate_certs, 'component_status', False)
+    except Exception as err:
+      can_continue = True
+      is_failed = True
+      return can_continue, is_failed
   try:
     can_continue = True
     for component_status in component_status_list:
@@ -186,9 +264,119 @@ def check_continuity(module, manager_url, mgr_username, mgr_password, validate_c
     is_failed = True
     return can_continue, is_failed
 
+def save_upgrade_checkpoint(module, checkpoint):
+  if checkpoint is None:
+    return
+  try:
+    save_checkpoint(module.params['checkpoint_file'], checkpoint)
+  except Exception as err:
+    module.fail_json(msg='Failed to save the upgrade checkpoint to %s. Error[%s].' %
+                         (module.params['checkpoint_file'], to_native(err)))
+
+def save_completed_checkpoint(module, checkpoint):
+  if checkpoint is None:
+    return
+  record_completion(checkpoint)
+  save_upgrade_checkpoint(module, checkpoint)
+
+def get_status_summary(manager_url, mgr_username, mgr_password, validate_certs):
+  try:
+    (rc, resp) = request(manager_url + '/upgrade/status-summary', headers=dict(Accept='application/json'),
+                         url_username=mgr_username, url_password=mgr_password,
+                         validate_certs=validate_certs, ignore_errors=True)
+  except Exception:
+    return None
+  if not isinstance(resp, dict) or not resp.__contains__('component_status'):
+    return None
+  return resp
+
+def track_progress(module, manager_url, mgr_username, mgr_password, validate_certs,
+                   progress, status_summary):
+  try:
+    if update_upgrade_progress(progress, status_summary, manager_url, mgr_username,
+                               mgr_password, validate_certs) and module.params['progress_log']:
+      record = progress.get_summary(time.time())
+      record['time'] = time.time()
+      append_json_line(module.params['progress_log'], record)
+  except Exception:
+    # The upgrade goes on without its progress being tracked
+    pass
+
+def wait_for_next_step(module, manager_url, mgr_username, mgr_password, validate_certs,
+                       checkpoint, progress):
+  '''
+  Waits till the next component can be continued, tracking the progress of
+  the upgrade units and recording the statuses of the components and of the
+  upgrade unit groups in checkpoint on the way.
+  '''
+  def can_proceed():
+    status_summary = get_status_summary(manager_url, mgr_username, mgr_password, validate_certs)
+    component_status_list = None
+    if status_summary is not None:
+      component_status_list = status_summary['component_status']
+      track_progress(module, manager_url, mgr_username, mgr_password, validate_certs,
+                     progress, status_summary)
+      if checkpoint is not None:
+        checkpoint['progress'] = progress.state
+        try:
+          unit_group_statuses = get_unit_group_statuses(manager_url, mgr_username,
+                                                        mgr_password, validate_certs)
+        except Exception:
+          unit_group_statuses = None
+        record_statuses(checkpoint, status_summary, unit_group_statuses)
+        save_upgrade_checkpoint(module, checkpoint)
+    can_continue, is_failed = check_continuity(module, manager_url, mgr_username,
+                                               mgr_password, validate_certs,
+                                               component_status_list)
+    decide_next_step(module, manager_url, mgr_username, mgr_password, 
+                     validate_certs, can_continue, is_failed, progress, checkpoint)
+    return can_continue and not is_failed
+  try:
+    wait_until(can_proceed, time_out=module.params['timeout'] or float('inf'),
+               interval=10, max_interval=60)
+  except Exception as err:
+    module.fail_json(msg='Upgrade failed. Error: [%s]' % to_native(err))
+
+def run_upgrade_step(module, manager_url, mgr_username, mgr_password, validate_certs,
+                     headers, checkpoint, progress, resume=False):
+  '''
+  Starts or continues the upgrade plan and waits till the next component can
+  be continued. If resume is set, i.e. the checkpoint of an interrupted run
+  was loaded, the plan isn't started or continued again while the upgrade is
+  in progress.
+  '''
+  upgrade_status = get_upgrade_status(module, manager_url, mgr_username,
+                                      mgr_password, validate_certs, resume, checkpoint)
+  if upgrade_status != 'IN_PROGRESS' and upgrade_status != 'PAUSING':
+    action = 'start' if upgrade_status == 'NOT_STARTED' else 'continue'
+    try:
+      (rc, resp) = request(manager_url+ '/upgrade/plan?action=%s' % action, 
+                     data='', headers=headers, method='POST', 
+                     url_username=mgr_username, url_password=mgr_password, 
+                     validate_certs=validate_certs, ignore_errors=True)
+    except Exception as err:
+      module.fail_json(msg="Failed while upgrading. Error[%s]." % to_native(err))
+    if checkpoint is not None:
+      if action == 'start':
+        # The checkpoint of an earlier upgrade is of no use anymore
+        checkpoint.clear()
+        checkpoint.update(new_checkpoint(module.params['hostname'], module.params['paused_upgrade']))
+        progress.reset()
+      status_summary = get_status_summary(manager_url, mgr_username, mgr_password, validate_certs)
+      if status_summary is not None:
+        record_statuses(checkpoint, status_summary)
+      record_action(checkpoint, action)
+      save_upgrade_checkpoint(module, checkpoint)
+    time.sleep(10)
+  wait_for_next_step(module, manager_url, mgr_username, mgr_password, validate_certs,
+                     checkpoint, progress)
+
 def main():
   argument_spec = vmware_argument_spec()
-  argument_spec.update(paused_upgrade=dict(type='bool', required=True))
+  argument_spec.update(paused_upgrade=dict(type='bool', required=True),
+                       checkpoint_file=dict(type='str', required=False),
+                       progress_log=dict(type='str', required=False),
+                       timeout=dict(type='int', required=False))
 
   module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
   mgr_hostname = module.params['hostname']
@@ -211,76 +399,32 @@ def main():
     else:
       module.exit_json(changed=False, debug_out='NSX-T will upgrade without pauses.')
 
+  checkpoint = None
+  resume = False
+  if module.params['checkpoint_file']:
+    checkpoint = load_checkpoint(module.params['checkpoint_file'], module.params['hostname'])
+    if checkpoint is None:
+      checkpoint = new_checkpoint(module.params['hostname'], paused_upgrade)
+    # Only an upgrade left in progress or paused is resumed
+    resume = can_resume(checkpoint)
+  progress = UpgradeProgress(checkpoint.get('progress') if checkpoint is not None else None)
+
   # If paused_upgrade is not true i.e auto mode
   if not paused_upgrade:
+    # Exits once the whole system is upgraded
     while True:
-      upgrade_status = get_upgrade_status(module, manager_url, mgr_username,
-                                          mgr_password, validate_certs)
-      if upgrade_status == 'NOT_STARTED':
-        try:
-          (rc, resp) = request(manager_url+ '/upgrade/plan?action=start', 
-                         data='', headers=headers, method='POST', 
-                         url_username=mgr_username, url_password=mgr_password, 
-                         validate_certs=validate_certs, ignore_errors=True)
-        except Exception as err:
-          module.fail_json(msg="Failed while upgrading. Error[%s]." % to_native(err))
-      else:
-        try:
-          (rc, resp) = request(manager_url+ '/upgrade/plan?action=continue', 
-                         data='', headers=headers, method='POST', 
-                         url_username=mgr_username, url_password=mgr_password, 
-                         validate_certs=validate_certs, ignore_errors=True)
-        except Exception as err:
-          module.fail_json(msg="Failed while upgrading. Error[%s]." % to_native(err))
-
-      time.sleep(10)
-      while True:
-        try:
-          can_continue, is_failed = check_continuity(module, manager_url, mgr_username,
-                                                     mgr_password, validate_certs)
-          decide_next_step(module, manager_url, mgr_username, mgr_password, 
-                           validate_certs, can_continue, is_failed)
-          if can_continue and not is_failed:
-            break
-          time.sleep(10)
-        except Exception as err:
-          module.fail_json(msg='Upgrade failed. Error: [%s]' % to_native(err))
+      run_upgrade_step(module, manager_url, mgr_username, mgr_password, validate_certs,
+                       headers, checkpoint, progress, resume)
+      resume = False
   else:
     # Paused upgrade i.e manual mode
-    upgrade_status = get_upgrade_status(module, manager_url, mgr_username,
-                                          mgr_password, validate_certs)
-    if upgrade_status == 'NOT_STARTED':
-      try:
-        (rc, resp) = request(manager_url+ '/upgrade/plan?action=start', 
-                     data='', headers=headers, method='POST', 
-                     url_username=mgr_username, url_password=mgr_password, 
-                     validate_certs=validate_certs, ignore_errors=True)
-      except Exception as err:
-        module.fail_json(msg="Failed while upgrading. Error[%s]." % to_native(err))
-    else:
-      try:
-        (rc, resp) = request(manager_url+ '/upgrade/plan?action=continue', 
-                     data='', headers=headers, method='POST', 
-                     url_username=mgr_username, url_password=mgr_password, 
-                     validate_certs=validate_certs, ignore_errors=True)
-      except Exception as err:
-        module.fail_json(msg="Failed while upgrading. Error[%s]." % to_native(err))
-    time.sleep(10)
-    while True:
-      try:
-        can_continue, is_failed = check_continuity(module, manager_url, mgr_username,
-                                                   mgr_password, validate_certs)
-        decide_next_step(module, manager_url, mgr_username, mgr_password, 
-                         validate_certs, can_continue, is_failed)
-        if can_continue and not is_failed:
-          break
-        time.sleep(10)
-      except Exception as err:
-        module.fail_json(msg='Upgrade failed. Error: [%s]' % to_native(err))
+    run_upgrade_step(module, manager_url, mgr_username, mgr_password, validate_certs,
+                     headers, checkpoint, progress, resume)
     module.exit_json(changed=True, message='A component has been upgraded successfully.'
                                            ' Whole system is not. Please run the module'
                                            ' again till the time whole system is'
-                                           ' not upgraded.')
+                                           ' not upgraded.', checkpoint=checkpoint,
+                     progress=progress.get_summary(time.time()))
 
 if __name__ == '__main__':
     main()
@@ -48,6 +48,45 @@ options:
         description: 'URL of MUB file'
         required: false
         type: str
+    sha256:
+        description: "Expected SHA-256 of the mub file. The module fails if
+                      the SHA-256 of the file differs."
+        required: false
+        type: str
+    serve_file:
+        description: "If true, the mub file is served over HTTP from the host
+                      running the module and the manager fetches it by URL,
+                      instead of the file being uploaded. The server honours
+                      range requests, so the manager can resume an interrupted
+                      transfer."
+        required: false
+        type: bool
+        default: false
+    serve_address:
+        description: "Address of the host running the module as reached by the
+                      manager, used in the URL of the served file. Defaults to
+                      the address of the host on the route to the manager."
+        required: false
+        type: str
+    serve_port:
+        description: "Port on which the mub file is served. A free port is
+                      picked if 0."
+        required: false
+        type: int
+        default: 0
+    upload_retries:
+        description: "Number of times the upload of the mub file is retried
+                      when it gets interrupted. Every attempt sends the whole
+                      file."
+        required: false
+        type: int
+        default: 3
+    upload_retry_delay:
+        description: "Seconds waited before the first retry of the upload. The
+                      delay doubles with every retry, up to 300 seconds."
+        required: false
+        type: int
+        default: 30
 '''
 
 EXAMPLES = '''
@@ -60,21 +99,43 @@ EXAMPLES = '''
       url: "https://file-server.com/file.mub"
 '''
 
-RETURN = '''# '''
+RETURN = '''
+upload:
+    description: "For an uploaded mub file, its size in bytes, its SHA-256, the
+                  seconds spent uploading it, the resulting bytes_per_second
+                  and the bytes_sent, elapsed and error of the interrupted
+                  attempts. For a served mub file, its size in bytes, its url,
+                  the bytes_served, the number of requests and of
+                  resumed_requests, the seconds spent serving it and the
+                  resulting bytes_per_second."
+    returned: when file is used
+    type: dict
+elapsed:
+    description: "Seconds between the start of the upload and the bundle being
+                  ready on the manager."
+    returned: success
+    type: float
+'''
 import atexit
-import mmap
-import os
 
 import json
 import time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
-from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import wait_for_operation_to_execute
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import wait_for_operation_to_execute, \
+    get_file_sha256
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.upload_utils import MultipartFileStream, \
+    BundleFileServer, get_local_address
+from ansible.module_utils.six.moves import http_client
 from ansible.module_utils._text import to_native
 
+# Upper bound of the doubling delay between the attempts of an upload
+MAX_UPLOAD_RETRY_DELAY = 300
+
 
 def get_upload_mub_params(args=None):
-    args_to_remove = ['username', 'password', 'port', 'hostname', 'validate_certs', 'timeout']
+    args_to_remove = ['username', 'password', 'port', 'hostname', 'validate_certs', 'timeout', 'sha256',
+                      'serve_file', 'serve_address', 'serve_port', 'upload_retries', 'upload_retry_delay']
     for key in args_to_remove:
         args.pop(key, None)
     for key, value in args.copy().items():
@@ -93,22 +154,66 @@ def get_mgr_ip_upgrade_enabled(module, mgr_url, mgr_username, mgr_password,
                         'upgrade is enabled. Error: {}'.format(err))
     return resp['service_properties']['enabled_on'];
 
-def wait_till_upload_done(module, bundle_id, mgr_url, mgr_username, mgr_password, 
-                          headers, validate_certs):
+def upload_file(module, mgr_url, mgr_username, mgr_password, validate_certs, headers):
+    '''
+    Uploads the mub file, retrying with a doubling delay when the transfer is
+    interrupted. The manager can't resume an upload, so every attempt sends
+    the whole file. The progress of the failed attempts is returned with the
+    statistics of the upload.
+    '''
+    file_path = module.params['file']
+    attempts = []
+    delay = module.params['upload_retry_delay']
+    while True:
+        try:
+            upload_stream = MultipartFileStream(file_path)
+        except Exception as e:
+            module.fail_json(msg='failed to open mub file %s Error: %s' %
+                             (file_path, to_native(e)))
+        upload_headers = dict(headers)
+        upload_headers.update(upload_stream.get_headers())
+        try:
+            # The bundle is read from disk while it is sent
+            (rc, resp) = request(mgr_url + '/upgrade/bundles?action=upload', data=upload_stream,
+                                 headers=upload_headers, method='POST', url_username=mgr_username,
+                                 url_password=mgr_password, validate_certs=validate_certs,
+                                 ignore_errors=True)
+            error = None if rc < 500 else 'response code: {} response: {}'.format(rc, resp)
+        except (IOError, OSError, http_client.HTTPException) as err:
+            error = to_native(err)
+        finally:
+            upload_stream.close()
+        upload = upload_stream.get_statistics()
+        if error is None:
+            upload['attempts'] = attempts
+            return rc, resp, upload
+        attempts.append(dict(bytes_sent=upload_stream.bytes_sent, elapsed=upload['elapsed'], error=error))
+        if len(attempts) > module.params['upload_retries']:
+            module.fail_json(msg='Failed to upload the mub file %s in %d attempts. Error: %s' %
+                             (file_path, len(attempts), error), upload=dict(attempts=attempts))
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_UPLOAD_RETRY_DELAY)
+
+def check_sha256(module, sha256, **kwargs):
+    if module.params['sha256'] and module.params['sha256'].lower() != sha256:
+        module.fail_json(msg='The SHA-256 of the mub file %s is %s, %s was expected.' %
+                         (module.params['file'], sha256, module.params['sha256']), **kwargs)
+
+def serve_file(module, ip_address):
+    '''
+    Starts serving the mub file over HTTP on this host, at an address
+    reachable from the manager at ip_address.
+    '''
+    file_path = module.params['file']
     try:
-       while True:
-         (rc, resp) = request(mgr_url + '/upgrade/bundles/%s/upload-status'% bundle_id,
-                             headers=headers, url_username=mgr_username, 
-                             url_password=mgr_password, validate_certs=validate_certs, 
-                             ignore_errors=True)
-         if resp['status'] == 'FAILED':
-             module.fail_json(msg='Failed to upload upgrade bunlde. Error: %s' % 
-                              resp['detailed_status'])
-         if resp['status'] == 'SUCCESS':
-             time.sleep(5)
-             return
-    except Exception as err:
-          module.fail_json(changed=True, msg="Error: %s" % err)
+        address = module.params['serve_address'] or get_local_address(ip_address)
+        bundle_server = BundleFileServer(file_path, address, module.params['serve_port'])
+    except Exception as e:
+        module.fail_json(msg='failed to serve mub file %s Error: %s' %
+                         (file_path, to_native(e)))
+    bundle_server.start()
+    atexit.register(bundle_server.stop)
+    return bundle_server
 
 def upload_mub(module, mgr_url, mgr_username, mgr_password, validate_certs, request_data, 
                headers, ip_address, timeout=10800):
@@ -117,42 +222,25 @@ def upload_mub(module, mgr_url, mgr_username, mgr_password, validate_certs, requ
     #headers = {}
     if module.params['file'] is not None:
         mub_type = 'file'
-        endpoint = endpoint +'?action=upload'
-    if mub_type == 'file':
-        file_path = module.params['file']
-        try:
-            file_data = open(file_path, 'rb')
-            atexit.register(file_data.close)
-        except Exception as e:
-            module.fail_json(msg='failed to open mub file %s Error: %s' %
-                             (file_path, to_native(e)))
-
-        if os.stat(file_path).st_size == 0:
-            request_data = ''
-        else:
-            request_data = mmap.mmap(file_data.fileno(), 0, access=mmap.ACCESS_READ)
-            atexit.register(request_data.close)
-
-
-        from urllib3 import encode_multipart_formdata
-        from urllib3.fields import RequestField
-
-        with open(file_path, 'rb') as src_file:
-             rf = RequestField('file', src_file.read(), os.path.basename(src_file.name))
-             rf.make_multipart()
-             body, content_type = encode_multipart_formdata([rf])
-  
-        headers['Content-Type'] = content_type
-        headers['Content-length'] = len(body)
-
-    if mub_type == 'url':
-      body = request_data
+    start_time = time.time()
+    upload = None
+    bundle_server = None
 
     try:
-        (rc, resp) = request(mgr_url + endpoint, data=body, headers=headers, 
-                             method='POST', url_username=mgr_username, 
-                             url_password=mgr_password, validate_certs=validate_certs, 
-                             ignore_errors=True)
+        if mub_type == 'file' and not module.params['serve_file']:
+            (rc, resp, upload) = upload_file(module, mgr_url, mgr_username, mgr_password,
+                                             validate_certs, headers)
+            check_sha256(module, upload['sha256'], upload=upload)
+        else:
+            if mub_type == 'file':
+                check_sha256(module, get_file_sha256(module.params['file']))
+                # The manager fetches the bundle from this host by URL
+                bundle_server = serve_file(module, ip_address)
+                request_data = json.dumps(dict(url=bundle_server.url))
+            (rc, resp) = request(mgr_url + endpoint, data=request_data, headers=headers, 
+                                 method='POST', url_username=mgr_username, 
+                                 url_password=mgr_password, validate_certs=validate_certs, 
+                                 ignore_errors=True)
         if rc == 200:
             bundle_id = 'latest'#resp['bundle_id']
             headers = dict(Accept="application/json")
@@ -161,10 +249,14 @@ def upload_mub(module, mgr_url, mgr_username, mgr_password, validate_certs, requ
                 wait_for_operation_to_execute(mgr_url, 
                     '/upgrade/bundles/%s/upload-status'% bundle_id, 
                     mgr_username, mgr_password, validate_certs, 
-                    ['status'], ['SUCCESS'], ['FAILED'])
+                    ['status'], ['SUCCESS'], ['FAILED'], timeout)
             except Exception as err:
                 module.fail_json(msg='Error while uploading upgrade bundle. Error [%s]' % to_native(err))
-            module.exit_json(changed=True, ip_address=ip_address, response=resp, 
+            if bundle_server is not None:
+                bundle_server.stop()
+                upload = bundle_server.get_statistics()
+            module.exit_json(changed=True, ip_address=ip_address, response=resp, upload=upload,
+            elapsed=round(time.time() - start_time, 1),
             message='The upgrade bundle %s got uploaded successfully.' % module.params[mub_type])
         else:
             module.fail_json(msg='Failed to run upload mub. response code: {}'
@@ -177,6 +269,12 @@ def main():
     argument_spec = vmware_argument_spec()
     argument_spec.update(url=dict(type='str'),
                          file=dict(type='str'),
+                         sha256=dict(type='str', required=False),
+                         serve_file=dict(type='bool', required=False, default=False),
+                         serve_address=dict(type='str', required=False),
+                         serve_port=dict(type='int', required=False, default=0),
+                         upload_retries=dict(type='int', required=False, default=3),
+                         upload_retry_delay=dict(type='int', required=False, default=30),
                          timeout=dict(type='int', required=False))
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True, 
                            required_one_of=[('url', 'file')])
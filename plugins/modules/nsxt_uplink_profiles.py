@@ -157,9 +157,11 @@ EXAMPLES = '''
 RETURN = '''# '''
 
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import get_resource_from_display_name
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import contains
 from ansible.module_utils._text import to_native
 
 def get_profile_params(args=None):
@@ -171,50 +173,9 @@ def get_profile_params(args=None):
             args.pop(key, None)
     return args
 
-def get_host_switch_profiles(module, manager_url, mgr_username, mgr_password, validate_certs):
-    try:
-      (rc, resp) = request(manager_url+ '/host-switch-profiles', headers=dict(Accept='application/json'),
-                      url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs, ignore_errors=True)
-    except Exception as err:
-      module.fail_json(msg='Error accessing host profiles. Error [%s]' % (to_native(err)))
-    return resp
-
 def get_uplink_profile_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, display_name):
-    host_switch_profiles = get_host_switch_profiles(module, manager_url, mgr_username, mgr_password, validate_certs)
-    for host_switch_profile in host_switch_profiles['results']:
-        if host_switch_profile.__contains__('display_name') and host_switch_profile['display_name'] == display_name:
-            return host_switch_profile
-    return None
-
-def id_exist_in_list_dict_obj(key, list_obj1, list_obj2):
-    all_id_presents = False
-    if len(list_obj1) != len(list_obj2):
-        return all_id_presents
-    for dict_obj1 in list_obj1:
-        if dict_obj1.__contains__(key):
-            for dict_obj2 in list_obj2:
-                if dict_obj2.__contains__(key) and dict_obj1[key] == dict_obj2[key]:
-                    all_id_presents = True
-                    continue
-            if not all_id_presents:
-                return False
-    return True
-def cmp_dict(dict1, dict2): # dict1 contain dict2
-    #print dict2
-    for k2, v2 in dict2.items():
-        found = False
-        if k2 not in dict1:
-            continue
-        if type(v2) != list and dict1[k2] != dict2[k2]:
-            return False
-            
-        for obj2 in v2:
-            for obj1 in dict1[k2]:
-                if all(item in obj1.items() for item in obj2.items()):
-                           found = True
-        if not found:
-            return False
-    return True
+    return get_resource_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs,
+                                          '/host-switch-profiles', display_name)
 
 def check_for_update(module, manager_url, mgr_username, mgr_password, validate_certs, profile_params):
     existing_profile = get_uplink_profile_from_display_name(module, manager_url, mgr_username, mgr_password, validate_certs, profile_params['display_name'])
@@ -230,35 +191,12 @@ def check_for_update(module, manager_url, mgr_username, mgr_password, validate_c
         return True
     if not existing_profile.__contains__('lags') and profile_params.__contains__('lags'):
         return True
-    if profile_params.__contains__('lags') and profile_params['lags']:
-       existing_lags = existing_profile['lags']
-       new_lags = profile_params['lags']
-       sorted_existing_lags = sorted(existing_lags, key = lambda i: i['name'])
-       sorted_new_lags = sorted(new_lags, key = lambda i: i['name'])
-       if len(sorted_existing_lags) != len(sorted_new_lags):
-          return True
-       both_lags_same = True
-       for i in range(len(sorted_existing_lags)):
-           diff_obj = {k: sorted_existing_lags[i][k] for k in sorted_existing_lags[i] if k in sorted_new_lags[i] and sorted_existing_lags[i][k] != sorted_new_lags[i][k]}
-           del diff_obj['uplinks']
-           if not cmp_dict(diff_obj, sorted_new_lags[i]):
-              both_lags_same = False
-       if not both_lags_same:
-          return True
-    if profile_params.__contains__('named_teamings'):
-       existing_teamings = existing_profile['named_teamings']
-       new_teamings = profile_params['named_teamings']
-       sorted_existing_teamings = sorted(existing_teamings, key = lambda i: i['name'])
-       sorted_new_teamings = sorted(new_teamings, key = lambda i: i['name'])
-       if len(sorted_existing_teamings) != len(sorted_new_teamings):
-          return False
-       both_teamings_same = True
-       for i in range(len(sorted_existing_teamings)):
-           diff_obj = {k: sorted_existing_teamings[i][k] for k in sorted_existing_teamings[i] if k in sorted_new_teamings[i] and sorted_existing_teamings[i][k] != sorted_new_teamings[i][k]}
-           if not cmp_dict(diff_obj, sorted_new_teamings[i]):
-              both_teamings_same = False
-       if not both_teamings_same:
-          return True
+    if profile_params.__contains__('lags') and profile_params['lags'] and \
+        not contains(existing_profile, {'lags': profile_params['lags']}, ignored_keys=('uplinks',)):
+        return True
+    if profile_params.__contains__('named_teamings') and (not existing_profile.__contains__('named_teamings') or \
+        not contains(existing_profile, {'named_teamings': profile_params['named_teamings']})):
+        return True
     return False
   
 
@@ -319,7 +257,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to add host profile. Request body [%s]. Error[%s]." % (request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="host profile with display name %s created." % module.params['display_name'])
     else:
       if module.check_mode:
@@ -334,7 +271,6 @@ def main():
       except Exception as err:
           module.fail_json(msg="Failed to update host profile with id %s. Request body [%s]. Error[%s]." % (id, request_data, to_native(err)))
 
-      time.sleep(5)
       module.exit_json(changed=True, id=resp["id"], body= str(resp), message="host profile with id %s updated." % id)
 
   elif state == 'absent':
@@ -350,7 +286,6 @@ def main():
     except Exception as err:
         module.fail_json(msg="Failed to delete host profile with id %s. Error[%s]." % (id, to_native(err)))
 
-    time.sleep(5)
     module.exit_json(changed=True, object_name=id, message="host profile with id %s deleted." % id)
 
 
@@ -96,9 +96,10 @@ EXAMPLES = '''
 
 RETURN = '''# '''
 
-import json, time
+import json
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.vmware_nsxt import vmware_argument_spec, request
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils import wait_until, OPERATION_TIMED_OUT
 from ansible.module_utils._text import to_native
 import ssl
 import socket
@@ -133,54 +134,41 @@ def get_vidm_from_client_id(module, url, mgr_username, mgr_password, validate_ce
 
 
 def wait_till_create(module, url, mgr_username, mgr_password, validate_certs):
-    retry_counter = 0
+    status = dict()
+
+    def is_registered():
+        # When registration is in progress and status is not yet accessible then it can throw error.
+        #  {'error_code': 36514, 'error_message': 'Error when requesting to verify VMware Identity Manager user access client',
+        # So retry is needed in error case as well.
+        (rc, resp) = request(url + '/status', headers=dict(Accept='application/json'),
+                             url_username=mgr_username, url_password=mgr_password,
+                             validate_certs=validate_certs, ignore_errors=True)
+        status['runtime_state'] = str(resp['runtime_state'])
+        return resp['runtime_state'] == "ALL_OK"
     try:
-        while True:
-
-            try:
-                (rc, resp) = request(url + '/status', headers=dict(Accept='application/json'),
-                                     url_username=mgr_username, url_password=mgr_password,
-                                     validate_certs=validate_certs, ignore_errors=True)
-                if resp['runtime_state'] != "ALL_OK":
-                    if retry_counter < 6:
-                        time.sleep(5)
-                        retry_counter = retry_counter + 1
-                    else:
-                        module.fail_json(
-                            msg='Failed to register vIDM. runtime state is : %s' % (str(resp["runtime_state"])))
-                else:
-                    break;
-            except Exception as err:
-                # When registration is in progress and status is not yet accessible then it can throw error.
-                #  {'error_code': 36514, 'error_message': 'Error when requesting to verify VMware Identity Manager user access client',
-                # So retry is needed in error case as well.
-                if retry_counter < 6:
-                    retry_counter = retry_counter + 1
-                    time.sleep(5)
-                else:
-                    module.fail_json(msg='Failed to register vIDM. runtime state is : %s' % (to_native(err)))
+        wait_until(is_registered, time_out=30, interval=5, max_interval=5, tolerated_errors=6)
     except Exception as err:
-        module.fail_json(msg='Error accessing vIDM status. Error [%s]' % (to_native(err)))
+        if to_native(err) == OPERATION_TIMED_OUT:
+            module.fail_json(msg='Failed to register vIDM. runtime state is : %s' % status.get('runtime_state'))
+        module.fail_json(msg='Failed to register vIDM. runtime state is : %s' % (to_native(err)))
     return
 
 
 def wait_till_delete(module, url, mgr_username, mgr_password, validate_certs):
-    retry_counter = 0
+    status = dict()
+
+    def is_unregistered():
+        (rc, resp) = request(url + '/status', headers=dict(Accept='application/json'),
+                             url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs,
+                             ignore_errors=True)
+        status.update(resp)
+        return resp['runtime_state'] == "NOT_OK" and resp['vidm_enable'] is False
     try:
-        while True:
-            (rc, resp) = request(url + '/status', headers=dict(Accept='application/json'),
-                                 url_username=mgr_username, url_password=mgr_password, validate_certs=validate_certs,
-                                 ignore_errors=True)
-            if resp['runtime_state'] != "NOT_OK" or resp['vidm_enable'] is not False:
-                if retry_counter < 6:
-                    time.sleep(10)
-                    retry_counter = retry_counter + 1
-                else:
-                    module.fail_json(msg='Failed to unregister vIDM. runtime state is : %s registration flag is : %s'
-                                         % (str(resp["runtime_state"]), str(resp["vidm_enable"])))
-            else:
-                break;
+        wait_until(is_unregistered, time_out=60, interval=10, max_interval=10)
     except Exception as err:
+        if to_native(err) == OPERATION_TIMED_OUT:
+            module.fail_json(msg='Failed to unregister vIDM. runtime state is : %s registration flag is : %s'
+                                 % (str(status["runtime_state"]), str(status["vidm_enable"])))
         module.fail_json(msg='Error accessing vIDM status. Error [%s]' % (to_native(err)))
     return
 
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+import gzip
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.common_utils as common_utils
+
+
+class CommonUtilsTestCase(unittest.TestCase):
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    def test_wait_until_backs_off(self, mock_time):
+        mock_time.time.return_value = 0
+        condition = Mock(side_effect=[False, False, False, False, False, True])
+
+        common_utils.wait_until(condition, interval=1, max_interval=4)
+
+        self.assertEqual([args[0][0] for args in
+                          mock_time.sleep.call_args_list], [1, 2, 4, 4, 4])
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    def test_wait_until_times_out(self, mock_time):
+        mock_time.time.side_effect = [0, 0, 5, 9]
+
+        with self.assertRaises(Exception):
+            common_utils.wait_until(Mock(return_value=False), time_out=10,
+                                    interval=4)
+        self.assertEqual(mock_time.sleep.call_count, 1)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    def test_wait_until_tolerates_errors(self, mock_time):
+        mock_time.time.side_effect = range(100)
+        condition = Mock(side_effect=[Exception(503, None), False,
+                                      Exception(503, None), True])
+        on_progress = Mock()
+        stats = dict()
+
+        common_utils.wait_until(condition, tolerated_errors=1,
+                                on_progress=on_progress, stats=stats)
+
+        self.assertEqual(stats, {"polls": 4, "errors": 2, "waited": 4})
+        self.assertEqual(on_progress.call_args_list[-1][0], (3, 3))
+
+        condition = Mock(side_effect=[Exception(503, None),
+                                      Exception(503, None)])
+        with self.assertRaises(Exception):
+            common_utils.wait_until(condition, tolerated_errors=1)
+
+        condition = Mock(side_effect=common_utils.OperationFailed("failed"))
+        with self.assertRaises(common_utils.OperationFailed):
+            common_utils.wait_until(condition, tolerated_errors=None)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.request")
+    def test_wait_for_operation_to_execute(self, mock_request, mock_time):
+        mock_time.time.return_value = 0
+        mock_request.side_effect = [Exception("connection refused"),
+                                    (200, {"status": "IN_PROGRESS"}),
+                                    (200, {"status": "SUCCESS"})]
+        common_utils.wait_for_operation_to_execute(
+            "https://dummy/api/v1", "/upgrade/uc-upgrade-status", "dummy",
+            "dummy", False, ["status"], ["SUCCESS"], ["FAILED"])
+        self.assertEqual(mock_request.call_count, 3)
+
+        mock_request.side_effect = [(200, {"status": "FAILED"})]
+        with self.assertRaises(common_utils.OperationFailed):
+            common_utils.wait_for_operation_to_execute(
+                "https://dummy/api/v1", "/upgrade/uc-upgrade-status",
+                "dummy", "dummy", False, ["status"], ["SUCCESS"], ["FAILED"])
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.request")
+    def test_wait_for_realized_state(self, mock_request, mock_time):
+        mock_time.time.return_value = 0
+        mock_request.side_effect = [(200, {"state": "in_progress"}),
+                                    (200, {"state": "success"})]
+
+        common_utils.wait_for_realized_state(
+            "https://dummy/api/v1", "/logical-switches/1/state", "dummy",
+            "dummy", False)
+        self.assertEqual(mock_request.call_count, 2)
+
+        mock_request.side_effect = [(200, {"state": "failed"})]
+        with self.assertRaises(Exception):
+            common_utils.wait_for_realized_state(
+                "https://dummy/api/v1", "/logical-switches/1/state", "dummy",
+                "dummy", False)
+
+        mock_request.side_effect = [Exception(404, None)]
+        self.assertIsNone(common_utils.wait_for_realized_state(
+            "https://dummy/api/v1", "/logical-switches/1/state", "dummy",
+            "dummy", False))
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.request")
+    def test_wait_for_realized_state_ends_on_partial_states(self, mock_request,
+                                                            mock_time):
+        mock_time.time.return_value = 0
+        for state in ("partial_success", "unknown"):
+            mock_request.reset_mock()
+            mock_request.side_effect = [
+                (200, {"state": "in_progress"}),
+                (200, {"state": state, "details": ["host-1 disconnected"]})]
+
+            warning = common_utils.wait_for_realized_state(
+                "https://dummy/api/v1", "/logical-switches/1/state", "dummy",
+                "dummy", False)
+
+            self.assertEqual(mock_request.call_count, 2)
+            self.assertIn(state.upper(), warning)
+            self.assertIn("host-1 disconnected", warning)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    def test_wait_for_all_polls_pending_objects_together(self, mock_time):
+        mock_time.time.side_effect = range(100)
+        get_statuses = Mock(side_effect=[
+            {"tn1": common_utils.IN_PROGRESS, "tn2": common_utils.SUCCESS},
+            {"tn1": common_utils.FAILED}])
+
+        statuses, waited = common_utils.wait_for_all(
+            get_statuses, ["tn1", "tn2"])
+
+        self.assertEqual(statuses, {"tn1": common_utils.FAILED,
+                                    "tn2": common_utils.SUCCESS})
+        self.assertEqual(get_statuses.call_args_list[1][0][0], ["tn1"])
+        self.assertLess(waited["tn2"], waited["tn1"])
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.time")
+    def test_wait_for_all_times_out(self, mock_time):
+        mock_time.time.return_value = 0
+        get_statuses = Mock(return_value={"tn1": common_utils.SUCCESS})
+
+        statuses, waited = common_utils.wait_for_all(
+            get_statuses, ["tn1", "tn2"], time_out=0)
+
+        self.assertEqual(statuses, {"tn1": common_utils.SUCCESS,
+                                    "tn2": common_utils.TIMED_OUT})
+
+        get_statuses.side_effect = Exception(500, None)
+        with self.assertRaises(Exception):
+            common_utils.wait_for_all(get_statuses, ["tn1"])
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.get_certificate_thumbprint")
+    def test_get_certificate_thumbprints(self, mock_get_thumbprint):
+        def get_thumbprint(host, port, timeout):
+            if host == "10.0.0.3":
+                raise Exception("timed out")
+            return "thumbprint-" + host
+        mock_get_thumbprint.side_effect = get_thumbprint
+
+        thumbprints, errors = common_utils.get_certificate_thumbprints(
+            ["10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.3"])
+
+        self.assertEqual(thumbprints, {"10.0.0.1": "thumbprint-10.0.0.1",
+                                       "10.0.0.2": "thumbprint-10.0.0.2"})
+        self.assertEqual(errors, {"10.0.0.3": "timed out"})
+        self.assertEqual(mock_get_thumbprint.call_count, 3)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.ssl")
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.common_utils.socket")
+    def test_get_certificate_thumbprint_is_cached(self, mock_socket,
+                                                  mock_ssl):
+        wrapped_socket = mock_ssl.SSLContext.return_value.wrap_socket\
+            .return_value
+        wrapped_socket.getpeercert.return_value = b"certificate"
+
+        for _ in range(2):
+            thumbprint = common_utils.get_certificate_thumbprint(
+                "10.0.0.10", 443)
+
+        self.assertEqual(thumbprint, hashlib.sha256(b"certificate")
+                         .hexdigest())
+        self.assertEqual(mock_socket.create_connection.call_count, 1)
+
+    def test_write_file_replaces_changed_content_only(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "content.json.gz")
+
+        def write(text_file):
+            text_file.write(u"content")
+
+        summary = common_utils.write_file(path, write, compress=True,
+                                          check_mode=True)
+        self.assertTrue(summary["changed"])
+        self.assertEqual(os.listdir(directory), [])
+
+        summary = common_utils.write_file(path, write, compress=True)
+        with gzip.open(path, "rt") as written_file:
+            self.assertEqual(written_file.read(), "content")
+        self.assertTrue(summary["changed"])
+        self.assertEqual(summary["sha256"],
+                         common_utils.get_file_sha256(path))
+        self.assertEqual(summary["size"], os.path.getsize(path))
+
+        # The same content is compressed to the same bytes.
+        self.assertEqual(common_utils.write_file(path, write, compress=True),
+                         dict(summary, changed=False))
+        self.assertEqual(os.listdir(directory), ["content.json.gz"])
+
+    def test_write_file_keeps_mode_of_replaced_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "content.json")
+        umask = os.umask(0o022)
+        self.addCleanup(os.umask, umask)
+
+        common_utils.write_file(path, lambda text_file: text_file.write(u"1"))
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o644)
+
+        os.chmod(path, 0o640)
+        common_utils.write_file(path, lambda text_file: text_file.write(u"2"))
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
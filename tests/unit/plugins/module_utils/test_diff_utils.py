@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+import unittest
+
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.diff_utils import contains, is_equal
+
+
+class DiffUtilsTestCase(unittest.TestCase):
+    def test_is_equal_ignores_order_of_unordered_lists(self):
+        tags1 = [{"scope": "a", "tag": "1"}, {"scope": "b", "tag": "2"}]
+        tags2 = [{"tag": "2", "scope": "b"}, {"tag": "1", "scope": "a"}]
+
+        self.assertTrue(is_equal(tags1, tags2))
+        self.assertFalse(is_equal(tags1, tags2 + [{"scope": "a", "tag": "1"}]))
+        self.assertFalse(is_equal(tags1, [{"scope": "a", "tag": "1"}]))
+
+    def test_is_equal_keeps_order_of_ordered_lists(self):
+        self.assertFalse(is_equal(
+            {"active_list": [{"uplink_name": "u1"}, {"uplink_name": "u2"}]},
+            {"active_list": [{"uplink_name": "u2"}, {"uplink_name": "u1"}]}))
+
+    def test_contains_matches_identified_items(self):
+        existing = {"host_switches": [
+            {"host_switch_name": "hs2", "host_switch_id": "2",
+             "host_switch_profile_ids": [
+                 {"key": "UplinkHostSwitchProfile", "value": "u1"},
+                 {"key": "LldpHostSwitchProfile", "value": "l1"}]},
+            {"host_switch_name": "hs1", "host_switch_id": "1",
+             "pnics": [{"device_name": "vmnic1", "uplink_name": "u1"},
+                       {"device_name": "vmnic0", "uplink_name": "u0"}]}]}
+        desired = {"host_switches": [
+            {"host_switch_name": "hs1",
+             "pnics": [{"device_name": "vmnic0", "uplink_name": "u0"},
+                       {"device_name": "vmnic1", "uplink_name": "u1"}]},
+            {"host_switch_name": "hs2", "host_switch_profile_ids": [
+                {"key": "UplinkHostSwitchProfile", "value": "u1"}]}]}
+
+        self.assertTrue(contains(existing, desired))
+
+        desired["host_switches"][1]["host_switch_profile_ids"][0]["value"] = \
+            "u2"
+        self.assertFalse(contains(existing, desired))
+
+    def test_contains_detects_missing_and_extra_items(self):
+        existing = {"lags": [{"name": "lag1", "number_of_uplinks": 2,
+                              "uplinks": [{"uplink_name": "lag1-0"}]}]}
+
+        self.assertTrue(contains(
+            existing, {"lags": [{"name": "lag1", "number_of_uplinks": 2}]}))
+        self.assertTrue(contains(
+            existing, {"lags": [{"name": "lag1", "uplinks": []}]},
+            ignored_keys=("uplinks",)))
+        self.assertFalse(contains(
+            existing, {"lags": [{"name": "lag1", "number_of_uplinks": 4}]}))
+        self.assertFalse(contains(existing, {"lags": [
+            {"name": "lag1"}, {"name": "lag2"}]}))
+        self.assertFalse(contains(existing, {"lags": []}))
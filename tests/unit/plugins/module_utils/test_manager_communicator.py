@@ -0,0 +1,529 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator import ManagerCommunicator
+import ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.manager_communicator as manager_communicator
+
+
+class ManagerCommunicatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.manager_communicator = ManagerCommunicator.get_instance(
+            "https://dummy/api/v1", "dummy", "dummy", False)
+        self.manager_communicator.invalidate()
+
+    def test_get_instance_with_same_credentials(self):
+        mc1 = ManagerCommunicator.get_instance("dummy1", "dummy1", "dummy1")
+        mc2 = ManagerCommunicator.get_instance("dummy1", "dummy1", "dummy1")
+
+        self.assertEqual(mc1, mc2)
+
+    def test_get_instance_with_different_credentials(self):
+        mc1 = ManagerCommunicator.get_instance("dummy1", "dummy1", "dummy1")
+        mc2 = ManagerCommunicator.get_instance("dummy2", "dummy2", "dummy2")
+
+        self.assertNotEqual(mc1, mc2)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_pages_follows_cursor(self, mock_request):
+        mock_request.side_effect = [
+            (200, {"results": [{"id": "1"}], "cursor": "0042"}),
+            (200, {"results": [{"id": "2"}], "cursor": "00000"})
+        ]
+
+        pages = list(self.manager_communicator.get_pages(
+            "/logical-switches", page_size=1))
+
+        self.assertEqual(pages, [[{"id": "1"}], [{"id": "2"}]])
+        self.assertEqual(
+            mock_request.call_args_list[0][0][0],
+            "https://dummy/api/v1/logical-switches?page_size=1")
+        self.assertEqual(
+            mock_request.call_args_list[1][0][0],
+            "https://dummy/api/v1/logical-switches?page_size=1&cursor=0042")
+        self.assertFalse(mock_request.call_args_list[0][1]['paginate'])
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_from_display_name_lists_collection_once(self, mock_request):
+        mock_request.return_value = (200, {"results": [
+            {"id": "1", "display_name": "ls1"},
+            {"id": "2", "display_name": "ls2"},
+            {"id": "3", "display_name": "ls1"}]})
+
+        mc = self.manager_communicator
+        self.assertEqual(
+            mc.get_from_display_name("/logical-switches", "ls1")["id"], "1")
+        self.assertEqual(
+            mc.get_from_display_name("/logical-switches", "ls2")["id"], "2")
+        self.assertIsNone(
+            mc.get_from_display_name("/logical-switches", "ls3"))
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_from_display_name_with_filters(self, mock_request):
+        mock_request.return_value = (200, {"results": [
+            {"id": "1", "display_name": "uplink", "logical_router_id": "lr1"}]})
+
+        resource = self.manager_communicator.get_from_display_name(
+            "/logical-router-ports", "uplink",
+            filters=dict(logical_router_id="lr1"))
+
+        self.assertEqual(resource["id"], "1")
+        self.assertEqual(
+            mock_request.call_args[0][0],
+            "https://dummy/api/v1/logical-router-ports?logical_router_id=lr1")
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_from_display_name_with_display_name_filter(
+            self, mock_request):
+        mock_request.return_value = (200, {"results": [
+            {"id": "1", "display_name": "cl1", "origin_id": "cm1"}]})
+        mc = self.manager_communicator
+
+        self.assertEqual(mc.get_from_display_name(
+            "/fabric/compute-collections", "cl1",
+            filters=dict(origin_id="cm1"), filter_display_name=True)["id"],
+            "1")
+        self.assertEqual(
+            mock_request.call_args[0][0],
+            "https://dummy/api/v1/fabric/compute-collections"
+            "?origin_id=cm1&display_name=cl1")
+
+        # The already listed collection is used rather than filtering again
+        mc.get_all_results("/fabric/discovered-nodes")
+        mc.get_from_display_name("/fabric/discovered-nodes", "dn1",
+                                 filter_display_name=True)
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_from_display_name_falls_back_to_client_side_scan(
+            self, mock_request):
+        mock_request.side_effect = [
+            Exception(400, {"error_code": 400}),
+            (200, {"results": [
+                {"id": "1", "display_name": "p1",
+                 "resource_type": "LldpHostSwitchProfile"},
+                {"id": "2", "display_name": "p1",
+                 "resource_type": "UplinkHostSwitchProfile"}]})]
+
+        resource = self.manager_communicator.get_from_display_name(
+            "/host-switch-profiles", "p1",
+            filters=dict(resource_type="UplinkHostSwitchProfile"))
+
+        self.assertEqual(resource["id"], "2")
+        self.assertEqual(mock_request.call_args[0][0],
+                         "https://dummy/api/v1/host-switch-profiles")
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_client_side_scan_matches_query_only_filters(self, mock_request):
+        mock_request.side_effect = [
+            Exception(400, {"error_code": 400}),
+            (200, {"results": [
+                {"id": "1", "display_name": "n1",
+                 "node_deployment_info": {"resource_type": "HostNode"}},
+                {"id": "2", "display_name": "n1",
+                 "node_deployment_info": {"resource_type": "EdgeNode"}},
+                {"id": "3", "display_name": "n2"}]})]
+        mc = self.manager_communicator
+
+        self.assertEqual(mc.get_from_display_name(
+            "/transport-nodes", "n1",
+            filters=dict(node_types="EdgeNode"))["id"], "2")
+        # A result without the filtered attribute doesn't match.
+        self.assertIsNone(mc.get_from_display_name(
+            "/transport-nodes", "n2", filters=dict(node_types="EdgeNode")))
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_rejected_filters_are_not_requested_again(self, mock_request):
+        mock_request.side_effect = [
+            Exception(400, {"error_code": 400}),
+            (200, {"results": [{"id": "1", "display_name": "p1"},
+                               {"id": "2", "display_name": "p2"}]})]
+        mc = self.manager_communicator
+
+        for display_name in ["p1", "p2"]:
+            mc.get_from_display_name("/host-switch-profiles", display_name,
+                                     filters=dict(unsupported="x"))
+
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_from_display_name_with_attributes(self, mock_request):
+        mock_request.return_value = (200, {"results": [
+            {"id": "1", "display_name": "p1",
+             "resource_type": "LldpHostSwitchProfile"},
+            {"id": "2", "display_name": "p1",
+             "resource_type": "UplinkHostSwitchProfile"}]})
+        mc = self.manager_communicator
+
+        self.assertEqual(mc.get_from_display_name(
+            "/host-switch-profiles", "p1",
+            attributes=dict(resource_type="UplinkHostSwitchProfile"))["id"],
+            "2")
+        self.assertEqual(mc.get_from_display_name(
+            "/host-switch-profiles", "p1",
+            attributes=dict(resource_type="LldpHostSwitchProfile"))["id"],
+            "1")
+        self.assertIsNone(mc.get_from_display_name(
+            "/host-switch-profiles", "p1",
+            attributes=dict(resource_type="NiocProfile")))
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_write_invalidates_collection(self, mock_request):
+        mock_request.return_value = (200, {"results": []})
+
+        mc = self.manager_communicator
+        mc.get_all_results("/logical-switches")
+        mc.get_all_results("/transport-zones")
+        mc.request("/logical-switches/1", method='DELETE')
+        mc.get_all_results("/logical-switches")
+        mc.get_all_results("/transport-zones")
+
+        self.assertEqual(mock_request.call_count, 4)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_id_from_display_name(self, mock_request):
+        mock_request.return_value = (200, {"results": [
+            {"id": "1", "uuid": "u1", "display_name": "vds"}]})
+        module = Mock()
+
+        self.assertEqual(manager_communicator.get_id_from_display_name(
+            module, "https://dummy/api/v1", "dummy", "dummy", False,
+            "/fabric/virtual-switches", "vds", id_attribute='uuid'), "u1")
+        self.assertIsNone(manager_communicator.get_id_from_display_name(
+            module, "https://dummy/api/v1", "dummy", "dummy", False,
+            "/fabric/virtual-switches", "missing", exit_if_not_found=False))
+        self.assertEqual(module.fail_json.call_count, 0)
+
+        manager_communicator.get_id_from_display_name(
+            module, "https://dummy/api/v1", "dummy", "dummy", False,
+            "/fabric/virtual-switches", "missing")
+        self.assertEqual(module.fail_json.call_count, 1)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.vmware_nsxt.request")
+    def test_batch_chunks_and_maps_results(self, mock_request):
+        mock_request.side_effect = [
+            (200, {"results": [{"code": 201, "body": {"id": "1"}},
+                               {"code": 201, "body": {"id": "2"}}],
+                   "has_errors": False}),
+            (200, {"results": [{"code": 400, "body": {"error_code": 1}}],
+                   "has_errors": True})
+        ]
+        sub_requests = [
+            {"uri": "/logical-switches", "method": "POST", "body": {}}
+            for _ in range(3)]
+
+        results = self.manager_communicator.batch(sub_requests, chunk_size=2)
+
+        self.assertEqual([result['code'] for result in results],
+                         [201, 201, 400])
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args_list[0][0][0],
+                         "https://dummy/api/v1/batch")
+        batch = json.loads(mock_request.call_args_list[0][1]['data'])
+        self.assertEqual(batch['requests'][0]['uri'], "/v1/logical-switches")
+        self.assertEqual(len(batch['requests']), 2)
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.vmware_nsxt.request")
+    def test_atomic_batch_stops_after_rolled_back_chunk(self, mock_request):
+        mock_request.return_value = (200, {
+            "results": [{"code": 201, "body": {"id": "1"}},
+                        {"code": 400, "body": {"error_code": 1}}],
+            "has_errors": True, "rolled_back": True})
+        sub_requests = [
+            {"uri": "/logical-switches", "method": "POST", "body": {}}
+            for _ in range(3)]
+
+        results = self.manager_communicator.batch(
+            sub_requests, atomic=True, chunk_size=2)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(mock_request.call_args_list[0][0][0],
+                         "https://dummy/api/v1/batch?atomic=true")
+        self.assertEqual([result['code'] for result in results],
+                         [201, 400, None])
+        self.assertTrue(results[0]['rolled_back'])
+
+    def test_submit_bulk_operations(self):
+        operations = [
+            manager_communicator.get_bulk_operation(
+                "/ip-pools", "p1", "present", {"display_name": "p1"},
+                None, False),
+            manager_communicator.get_bulk_operation(
+                "/ip-pools", "p2", "present", {"display_name": "p2"},
+                {"id": "2", "_revision": 3}, False),
+            manager_communicator.get_bulk_operation(
+                "/ip-pools", "p3", "absent", {"display_name": "p3"},
+                {"id": "3", "_revision": 0}, False)]
+        module = Mock()
+        module.check_mode = False
+        module.params = {"atomic": False, "batch_size": 50}
+        communicator = Mock()
+        communicator.batch.return_value = [
+            {"code": 201, "body": {"id": "1"}, "rolled_back": False},
+            {"code": 400, "body": {"error_code": 1}, "rolled_back": False}]
+
+        manager_communicator.submit_bulk_operations(
+            module, communicator, operations, "IP pool")
+
+        sub_requests = communicator.batch.call_args[0][0]
+        self.assertEqual([(sub_request['method'], sub_request['uri'])
+                          for sub_request in sub_requests],
+                         [("POST", "/ip-pools"), ("DELETE", "/ip-pools/3")])
+        results = module.fail_json.call_args[1]['results']
+        self.assertEqual([result['action'] for result in results],
+                         ["create", "none", "delete"])
+        self.assertEqual(results[0]['id'], "1")
+        self.assertEqual(results[2]['code'], 400)
+        self.assertTrue(module.fail_json.call_args[1]['changed'])
+
+    @patch("ansible_collections.vmware.ansible_for_nsxt.plugins."
+           "module_utils.manager_communicator.request")
+    def test_get_facts_filters_and_projects(self, mock_request):
+        mock_request.side_effect = [
+            (200, {"results": [
+                {"id": "1", "attachment": {"attachment_type": "VIF"}},
+                {"id": "2", "attachment": {"attachment_type": "DHCP"}}],
+                "cursor": "0042"}),
+            (200, {"results": [
+                {"id": "3", "attachment": {"attachment_type": "VIF"}},
+                {"id": "4", "attachment": {"attachment_type": "VIF"}}],
+                "cursor": "0084"})
+        ]
+        params = {"filters": {"logical_switch_id": "ls1",
+                              "attachment.attachment_type": "VIF"},
+                  "fields": ["id"], "max_results": 2, "page_size": 2,
+                  "sort_by": "display_name", "sort_ascending": False}
+
+        facts = manager_communicator.get_facts(
+            self.manager_communicator, "/logical-ports", params,
+            server_filters=("logical_switch_id",))
+
+        self.assertEqual(facts, {"results": [{"id": "1"}, {"id": "3"}],
+                                 "result_count": 2, "changed": False})
+        self.assertEqual(
+            mock_request.call_args_list[0][0][0],
+            "https://dummy/api/v1/logical-ports?included_fields="
+            "attachment%2Cid&logical_switch_id=ls1&sort_ascending=false"
+            "&sort_by=display_name&page_size=2")
+        # No page is requested once max_results results are found.
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_split_filters_with_accepted_values(self):
+        server_filters = ("node_types", "node_ip", "transport_type")
+
+        query, client_filters = manager_communicator.split_filters(
+            {"node_types": ["EdgeNode", "HostNode"],
+             "transport_type": ["OVERLAY", "VLAN"],
+             "node_ip": "10.0.0.1"}, server_filters)
+
+        self.assertEqual(query, {"node_ip": "10.0.0.1"})
+        self.assertEqual(client_filters, {
+            "node_deployment_info.resource_type": ["EdgeNode", "HostNode"],
+            "transport_type": ["OVERLAY", "VLAN"]})
+        self.assertTrue(manager_communicator.matches_filters(
+            {"node_deployment_info": {"resource_type": "EdgeNode"},
+             "transport_type": "VLAN"}, client_filters))
+        self.assertRaises(Exception, manager_communicator.split_filters,
+                          {"node_ip": ["10.0.0.1", "10.0.0.2"]},
+                          server_filters)
+
+    def test_project_fields_keeps_nesting(self):
+        result = {"id": "1", "attachment": {"id": "a", "context": {}},
+                  "tags": []}
+
+        self.assertEqual(
+            manager_communicator.project_fields(
+                result, ["attachment.id", "display_name", "tags"]),
+            {"attachment": {"id": "a"}, "tags": []})
+
+    def test_matches_filters_with_accepted_values(self):
+        result = {"display_name": "p1", "pool_usage": {"total_ids": 5}}
+
+        self.assertTrue(manager_communicator.matches_filters(
+            result, {"display_name": ["p1", "p2"]}))
+        self.assertFalse(manager_communicator.matches_filters(
+            result, {"pool_usage.total_ids": 4}))
+
+    def test_get_facts_writes_dest(self):
+        communicator = Mock()
+        communicator.iter_results.return_value = iter(
+            [{"id": "1"}, {"id": "2"}])
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        dest = os.path.join(directory, "ports.jsonl.gz")
+
+        summary = manager_communicator.get_facts(
+            communicator, "/logical-ports", {"dest": dest})
+
+        with gzip.open(dest, "rt") as facts_file:
+            self.assertEqual([json.loads(line) for line in facts_file],
+                             [{"id": "1"}, {"id": "2"}])
+        with open(dest, "rb") as facts_file:
+            sha256 = hashlib.sha256(facts_file.read()).hexdigest()
+        self.assertEqual(summary, {"dest": dest, "result_count": 2,
+                                   "size": os.path.getsize(dest),
+                                   "sha256": sha256, "changed": True})
+        self.assertEqual(os.listdir(directory), ["ports.jsonl.gz"])
+
+        # The same results are written to the same bytes.
+        communicator.iter_results.return_value = iter(
+            [{"id": "1"}, {"id": "2"}])
+        summary = manager_communicator.get_facts(
+            communicator, "/logical-ports", {"dest": dest})
+
+        self.assertFalse(summary["changed"])
+        self.assertEqual(summary["sha256"], sha256)
+
+    def test_get_facts_check_mode_leaves_dest(self):
+        communicator = Mock()
+        communicator.iter_results.return_value = iter([{"id": "1"}])
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        dest = os.path.join(directory, "ports.jsonl")
+
+        summary = manager_communicator.get_facts(
+            communicator, "/logical-ports", {"dest": dest}, check_mode=True)
+
+        self.assertTrue(summary["changed"])
+        self.assertEqual(summary["result_count"], 1)
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_get_facts_concurrently(self):
+        communicator = Mock()
+        communicator.iter_results.side_effect = \
+            lambda endpoint, page_size: iter([{"id": endpoint}])
+        failing_communicator = Mock()
+        failing_communicator.iter_results.side_effect = Exception(
+            403, "Forbidden")
+        collections = [
+            {"name": "segments", "communicator": communicator,
+             "endpoint": "/infra/segments", "params": {}},
+            {"name": "ports", "communicator": communicator,
+             "endpoint": "/logical-ports", "params": {"max_results": 1}},
+            {"name": "certificates", "communicator": failing_communicator,
+             "endpoint": "/trust-management/certificates", "params": {}}]
+
+        facts = manager_communicator.get_facts_concurrently(
+            collections, max_workers=2)
+
+        self.assertEqual(facts["segments"]["results"],
+                         [{"id": "/infra/segments"}])
+        self.assertEqual(facts["ports"]["result_count"], 1)
+        self.assertEqual(facts["ports"]["endpoint"], "/logical-ports")
+        self.assertIn("elapsed", facts["ports"])
+        self.assertIn("Forbidden", facts["certificates"]["error"])
+
+    def test_get_incremental_facts(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        params = {"state_file": os.path.join(directory, "ports.json.gz"),
+                  "filters": {"logical_switch_id": "ls1"}}
+        collection = [{"id": "1", "_last_modified_time": 10},
+                      {"id": "2", "_last_modified_time": 20}]
+        communicator = Mock()
+        communicator.iter_results.side_effect = \
+            lambda endpoint, page_size: iter(collection)
+
+        facts = manager_communicator.get_facts(
+            communicator, "/logical-ports", params,
+            server_filters=("logical_switch_id",))
+
+        self.assertTrue(facts["full_listing"])
+        self.assertTrue(facts["changed"])
+        self.assertEqual(facts["result_count"], 2)
+        self.assertEqual(facts["high_water_mark"], 20)
+
+        # 1 is deleted, 2 is modified and 3 is created.
+        collection = [{"id": "3", "_last_modified_time": 40},
+                      {"id": "2", "_last_modified_time": 30}]
+        communicator.iter_results.reset_mock()
+
+        facts = manager_communicator.get_facts(
+            communicator, "/logical-ports", params,
+            server_filters=("logical_switch_id",))
+
+        self.assertFalse(facts["full_listing"])
+        self.assertEqual(facts["results"], collection[::-1])
+        self.assertEqual(facts["deleted_ids"], ["1"])
+        self.assertEqual(facts["result_count"], 2)
+        self.assertEqual(facts["high_water_mark"], 40)
+        self.assertEqual(
+            [call[0][0] for call in communicator.iter_results.call_args_list],
+            ["/logical-ports?logical_switch_id=ls1"
+             "&included_fields=id%2C_last_modified_time",
+             "/logical-ports?logical_switch_id=ls1"
+             "&sort_ascending=false&sort_by=_last_modified_time"])
+
+    def test_get_incremental_facts_check_mode_leaves_state_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        params = {"state_file": os.path.join(directory, "ports.json")}
+        communicator = Mock()
+        communicator.iter_results.side_effect = \
+            lambda endpoint, page_size: iter(
+                [{"id": "1", "_last_modified_time": 10}])
+
+        facts = manager_communicator.get_facts(
+            communicator, "/logical-ports", params, check_mode=True)
+
+        self.assertTrue(facts["changed"])
+        self.assertEqual(os.listdir(directory), [])
+
+        manager_communicator.get_facts(communicator, "/logical-ports", params)
+        facts = manager_communicator.get_facts(
+            communicator, "/logical-ports", params)
+
+        self.assertFalse(facts["changed"])
+        self.assertEqual(facts["results"], [])
+
+    def test_iter_facts_since_stops_at_older_results(self):
+        communicator = Mock()
+        communicator.iter_results.return_value = iter(
+            [{"id": "3", "_last_modified_time": 30},
+             {"id": "2", "_last_modified_time": 20},
+             {"id": "1", "_last_modified_time": 10}])
+
+        results = list(manager_communicator.iter_facts(
+            communicator, "/logical-ports", {"since": 20}))
+
+        self.assertEqual([result["id"] for result in results], ["3", "2"])
@@ -935,6 +935,74 @@ class NSXTBaseRealizableResourceTestCase(unittest.TestCase):
         test_create_new_resource()
         nsxt_base_resource.BASE_RESOURCES = init_base_resources
 
+    @patch('ansible_collections.vmware.ansible_for_nsxt.plugins.'
+           'module_utils.nsxt_base_resource.PolicyCommunicator')
+    def test_achieve_present_state_with_revision_conflict(
+            self, mock_policy_communicator):
+        nsxt_base_resource.BASE_RESOURCES = {"SimpleDummyNSXTResource"}
+        simple_dummy_resource = SimpleDummyNSXTResource()
+        simple_dummy_resource.id = "dummy"
+        simple_dummy_resource.policy_communicator = mock_policy_communicator
+        simple_dummy_resource.module = MockAnsible()
+
+        def reset_resource(retries):
+            mock_policy_communicator.reset_mock()
+            simple_dummy_resource.existing_resource = {
+                "dummy": "old", "_revision": 1}
+            simple_dummy_resource.existing_resource_revision = 1
+            simple_dummy_resource.resource_params = {
+                "revision_conflict_retries": retries}
+            simple_dummy_resource.nsx_resource_params = {"dummy": "dummy"}
+            simple_dummy_resource._requested_nsx_resource_params = {
+                "dummy": "dummy"}
+
+        def test_retry_succeeds():
+            reset_resource(retries=2)
+            mock_policy_communicator.request.side_effect = [
+                Exception(412, {"error_code": 604}),
+                (200, {"dummy": "other", "_revision": 2}),
+                (200, "OK"),
+                (200, {"dummy": "dummy", "_revision": 3})
+            ]
+            exec_logs = []
+            simple_dummy_resource._achieve_present_state(exec_logs)
+
+            self.assertEqual(mock_policy_communicator.request.call_count, 4)
+            patch_call = mock_policy_communicator.request.call_args_list[2]
+            self.assertEqual(patch_call[1]['data'],
+                             {"dummy": "dummy", "_revision": 2})
+            self.assertTrue(exec_logs[0]["changed"])
+
+        def test_concurrent_change_matches_desired_state():
+            reset_resource(retries=2)
+            mock_policy_communicator.request.side_effect = [
+                Exception(412, {"error_code": 604}),
+                (200, {"dummy": "dummy", "_revision": 2})
+            ]
+            exec_logs = []
+            simple_dummy_resource._achieve_present_state(exec_logs)
+
+            self.assertEqual(mock_policy_communicator.request.call_count, 2)
+            self.assertFalse(exec_logs[0]["changed"])
+
+        def test_retries_exhausted():
+            reset_resource(retries=1)
+            simple_dummy_resource.module.fail_json = Mock()
+            mock_policy_communicator.request.side_effect = [
+                Exception(412, {"error_code": 604}),
+                (200, {"dummy": "other", "_revision": 2}),
+                Exception(412, {"error_code": 604})
+            ]
+            exec_logs = []
+            simple_dummy_resource._achieve_present_state(exec_logs)
+
+            self.assertEqual(mock_policy_communicator.request.call_count, 3)
+            self.assertTrue(simple_dummy_resource.module.fail_json.called)
+
+        test_retry_succeeds()
+        test_concurrent_change_matches_desired_state()
+        test_retries_exhausted()
+
     @patch('ansible_collections.vmware.ansible_for_nsxt.plugins.'
            'module_utils.nsxt_base_resource.PolicyCommunicator')
     def test_achieve_absent_state(self, mock_policy_communicator):
@@ -1199,3 +1267,56 @@ class NSXTBaseRealizableResourceTestCase(unittest.TestCase):
         test_with_dict()
         test_with_list()
         test_with_dict_and_list()
+
+    def test_drift_mode(self):
+        init_base_resources = nsxt_base_resource.BASE_RESOURCES
+        nsxt_base_resource.BASE_RESOURCES = {"SimpleDummyNSXTResource"}
+        nsxt_base_resource._drift_snapshots["snapshot.json"] = (
+            {"dummy/1": {"id": "1", "path": "dummy/1", "dummy": "a"}},
+            {"dummy": [{"id": "1", "path": "dummy/1", "dummy": "a"}]})
+        simple_dummy_resource = SimpleDummyNSXTResource()
+        simple_dummy_resource.drift_snapshot = "snapshot.json"
+        simple_dummy_resource.policy_communicator = Mock()
+        simple_dummy_resource.module = MockAnsible(check_mode=True)
+
+        def test_reads_are_served_from_snapshot():
+            self.assertEqual(
+                simple_dummy_resource._send_request_to_API(suffix="/1"),
+                (200, {"id": "1", "path": "dummy/1", "dummy": "a"}))
+            self.assertEqual(
+                len(simple_dummy_resource._send_request_to_API()[1]), 1)
+            with self.assertRaises(Exception):
+                simple_dummy_resource._send_request_to_API(
+                    suffix="/2", accepted_error_codes=set([404]))
+            self.assertEqual(
+                simple_dummy_resource.policy_communicator.method_calls, [])
+
+        def test_reports_drift(state, existing_resource, params, drift):
+            simple_dummy_resource.id = "1"
+            simple_dummy_resource._state = state
+            simple_dummy_resource.existing_resource = existing_resource
+            simple_dummy_resource.nsx_resource_params = params
+            exec_logs = []
+
+            if state == "present":
+                simple_dummy_resource._achieve_present_state(exec_logs)
+            else:
+                simple_dummy_resource._achieve_absent_state(exec_logs)
+
+            self.assertEqual(exec_logs[0]["drift"], drift)
+            self.assertEqual(exec_logs[0]["changed"], drift != "in_sync")
+            return exec_logs[0]
+
+        test_reads_are_served_from_snapshot()
+        test_reports_drift("present", None, {"dummy": "a"}, "missing")
+        test_reports_drift("present", {"dummy": "a"}, {"dummy": "a"},
+                           "in_sync")
+        drift_log = test_reports_drift(
+            "present", {"dummy": "a", "other": 1}, {"dummy": "b", "other": 1},
+            "modified")
+        self.assertEqual(drift_log["differences"], ["dummy"])
+        test_reports_drift("absent", {"dummy": "a"}, {}, "unexpected")
+        test_reports_drift("absent", None, {}, "in_sync")
+
+        nsxt_base_resource._drift_snapshots.pop("snapshot.json")
+        nsxt_base_resource.BASE_RESOURCES = init_base_resources
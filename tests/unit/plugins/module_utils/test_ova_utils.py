@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import unittest
+
+import ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.ova_utils as ova_utils
+
+
+class OvaUtilsTestCase(unittest.TestCase):
+    def get_params(self, **params):
+        ova_params = dict(
+            (key, spec.get('default'))
+            for key, spec in ova_utils.ova_argument_spec().items())
+        ova_params.update(
+            ovftool_path="/usr/bin", datacenter="dc", datastore="ds",
+            portgroup="pg", cluster="cl", vmname="mgr1", hostname="mgr1",
+            ip_address="10.0.0.1", path_to_ova="/ova", ova_file="nsx.ova",
+            vcenter="vc", vcenter_user="user", vcenter_passwd="pwd",
+            role="nsx-manager")
+        ova_params.update(params)
+        return ova_params
+
+    def test_get_ovftool_command(self):
+        ovf_command = ova_utils.get_ovftool_command(
+            self.get_params(folder="folder"))
+
+        self.assertEqual(ovf_command[0], "/usr/bin/ovftool")
+        self.assertEqual(ovf_command[1:3], ova_utils.OVFTOOL_PROGRESS_OPTIONS)
+        self.assertIn("--name=mgr1", ovf_command)
+        self.assertIn("--network=pg", ovf_command)
+        self.assertEqual(ovf_command[-2], "/ova/nsx.ova")
+        self.assertEqual(ovf_command[-1], "vi://user:pwd@vc/folder/dc/host/cl/")
+
+    def test_run_ovftool_keeps_last_output_lines(self):
+        result = ova_utils.run_ovftool(
+            [sys.executable, "-c",
+             "import sys\nfor i in range(5): print(i)\nsys.exit(3)"],
+            output_lines=2)
+
+        self.assertEqual(result['rc'], 3)
+        self.assertEqual(result['output'], "3\n4")
+        self.assertFalse(result['timed_out'])
+
+    def test_run_ovftool_commands_with_timeout(self):
+        results = ova_utils.run_ovftool_commands(
+            [[sys.executable, "-c", "import time; time.sleep(30)"],
+             [sys.executable, "-c", "print('deployed')"],
+             ["/nonexistent/ovftool"]],
+            max_workers=3, timeout=1)
+
+        self.assertTrue(results[0]['timed_out'])
+        self.assertNotEqual(results[0]['rc'], 0)
+        self.assertEqual(results[1]['rc'], 0)
+        self.assertEqual(results[1]['output'], "deployed")
+        self.assertIsNone(results[2]['rc'])
+
+    def test_progress_times_phases(self):
+        progress = ova_utils.OvftoolProgress(start_time=0)
+        lines = [(1, "Opening OVA source: /ova/nsx.ova"),
+                 (5, "Opening VI target: vi://user@vc:443/dc/host/cl/"),
+                 (10, "Deploying to VI: vi://user@vc:443/dc/host/cl/"),
+                 (12, "+ PROGRESS"), (12, "+ 40"),
+                 (60, "Disk progress: 100%"),
+                 (61, "Transfer Completed"),
+                 (62, "Powering on VM: mgr1"),
+                 (80, "Task Completed"),
+                 (80, "Completed successfully")]
+        for now, line in lines:
+            progress.feed(line, now)
+
+        timings = progress.get_timings(source_size=5000, end_time=81)
+
+        self.assertEqual(timings['validation'], 10)
+        self.assertEqual(timings['disk_upload'], 50)
+        self.assertEqual(timings['power_on'], 18)
+        self.assertEqual(timings['total'], 81)
+        self.assertEqual(timings['progress'], 100)
+        self.assertEqual(timings['bytes_per_second'], 100)
+
+    def test_get_source_size(self):
+        descriptor = (
+            b'<Envelope xmlns="http://schemas.dmtf.org/ovf/envelope/1" '
+            b'xmlns:ovf="http://schemas.dmtf.org/ovf/envelope/1">'
+            b'<References><File ovf:href="disk1.vmdk" ovf:size="100"/>'
+            b'<File ovf:href="disk2.vmdk" ovf:size="250"/></References>'
+            b'</Envelope>')
+        directory = tempfile.mkdtemp()
+        ovf_path = os.path.join(directory, "nsx.ovf")
+        with open(ovf_path, "wb") as ovf:
+            ovf.write(descriptor)
+        ova_path = os.path.join(directory, "nsx.ova")
+        with tarfile.open(ova_path, "w") as ova:
+            member = tarfile.TarInfo("nsx.ovf")
+            member.size = len(descriptor)
+            ova.addfile(member, io.BytesIO(descriptor))
+
+        self.assertEqual(ova_utils.get_source_size(ovf_path), 350)
+        self.assertEqual(ova_utils.get_source_size(ova_path), 350)
+        self.assertIsNone(ova_utils.get_source_size("http://server/nsx.ova"))
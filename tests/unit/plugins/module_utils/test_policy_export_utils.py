@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.policy_export_utils as policy_export_utils
+
+
+def get_infra(*children):
+    return {"resource_type": "Infra", "_revision": 7,
+            "children": list(children)}
+
+
+def get_child(resource_type, path, **attributes):
+    policy_object = dict(resource_type=resource_type, path=path,
+                         id=path.rsplit("/", 1)[-1], _revision=1,
+                         _last_modified_time=100, **attributes)
+    return {"resource_type": "Child" + resource_type,
+            resource_type: policy_object}
+
+
+class PolicyExportUtilsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_infra_url(self):
+        self.assertEqual(policy_export_utils.get_infra_url(), "/infra")
+        self.assertEqual(
+            policy_export_utils.get_infra_url(["Tier0", "Segment"],
+                                              "/infra/tier-0s/t0"),
+            "/infra?base_path=%2Finfra%2Ftier-0s%2Ft0"
+            "&filter=Type-Tier0%7CSegment")
+
+    def test_normalize_hierarchy_sorts_and_strips(self):
+        infra = get_infra(
+            get_child("Tier1", "/infra/tier-1s/b"),
+            get_child("Segment", "/infra/segments/s",
+                      children=[get_child("SegmentPort",
+                                          "/infra/segments/s/ports/p")]),
+            get_child("Tier1", "/infra/tier-1s/a"),
+            get_child("Service", "/infra/services/HTTP",
+                      _system_owned=True))
+
+        normalized = policy_export_utils.normalize_hierarchy(
+            infra, exclude_system_owned=True)
+
+        self.assertNotIn("_revision", normalized)
+        self.assertEqual(
+            [policy_export_utils.get_child_object(child)["path"]
+             for child in normalized["children"]],
+            ["/infra/segments/s", "/infra/tier-1s/a", "/infra/tier-1s/b"])
+        self.assertEqual(policy_export_utils.count_objects(normalized),
+                         {"Segment": 1, "SegmentPort": 1, "Tier1": 2})
+        self.assertEqual(
+            policy_export_utils.normalize_hierarchy(dict(
+                infra, children=infra["children"][::-1]),
+                exclude_system_owned=True), normalized)
+
+    def test_index_by_path(self):
+        infra = get_infra(get_child(
+            "Segment", "/infra/segments/s",
+            children=[get_child("SegmentPort", "/infra/segments/s/ports/p")]))
+
+        index = policy_export_utils.index_by_path(infra)
+
+        self.assertEqual(sorted(index),
+                         ["/infra/segments/s", "/infra/segments/s/ports/p"])
+        self.assertNotIn("children", index["/infra/segments/s"])
+
+    def test_export_round_trip(self):
+        path = os.path.join(self.directory, "infra.json.gz")
+        infra = policy_export_utils.normalize_hierarchy(
+            get_infra(get_child("Tier0", "/infra/tier-0s/t0")))
+
+        summary = policy_export_utils.write_export(path, infra)
+
+        self.assertEqual(summary["dest"], path)
+        self.assertEqual(summary["size"], os.path.getsize(path))
+        self.assertEqual(policy_export_utils.load_export(path), infra)
+        self.assertEqual(os.listdir(self.directory), ["infra.json.gz"])
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.upgrade_utils as upgrade_utils
+
+
+def get_status_summary(*statuses):
+    return {
+        "overall_upgrade_status": "IN_PROGRESS",
+        "component_status": [
+            {"component_type": component_type, "status": status}
+            for component_type, status in zip(("HOST", "EDGE", "MP"),
+                                              statuses)]}
+
+
+class UpgradeUtilsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "checkpoint.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_checkpoint_round_trip(self):
+        self.assertIsNone(upgrade_utils.load_checkpoint(self.path, "mgr"))
+
+        checkpoint = upgrade_utils.new_checkpoint("mgr", False)
+        upgrade_utils.record_statuses(
+            checkpoint, get_status_summary("SUCCESS", "IN_PROGRESS",
+                                           "NOT_STARTED"),
+            {"group1": "SUCCESS"})
+        upgrade_utils.record_action(checkpoint, "continue")
+        upgrade_utils.save_checkpoint(self.path, checkpoint)
+
+        loaded = upgrade_utils.load_checkpoint(self.path, "mgr")
+        self.assertEqual(loaded, checkpoint)
+        self.assertEqual(loaded["component"], "EDGE")
+        self.assertEqual(loaded["actions"][0]["component"], "EDGE")
+        self.assertEqual(loaded["unit_group_statuses"], {"group1": "SUCCESS"})
+        self.assertIsNone(upgrade_utils.load_checkpoint(self.path, "other"))
+        self.assertEqual(os.listdir(self.directory), ["checkpoint.json"])
+
+        with open(self.path, "w") as checkpoint_file:
+            checkpoint_file.write("{")
+        self.assertIsNone(upgrade_utils.load_checkpoint(self.path, "mgr"))
+
+    def test_can_resume(self):
+        checkpoint = upgrade_utils.new_checkpoint("mgr", True)
+        upgrade_utils.record_statuses(
+            checkpoint, get_status_summary("SUCCESS", "IN_PROGRESS",
+                                           "NOT_STARTED"))
+        self.assertFalse(upgrade_utils.can_resume(checkpoint))
+
+        upgrade_utils.record_action(checkpoint, "continue")
+        self.assertTrue(upgrade_utils.can_resume(checkpoint))
+
+        upgrade_utils.record_completion(checkpoint)
+        self.assertFalse(upgrade_utils.can_resume(checkpoint))
+        self.assertIsNone(checkpoint["component"])
+
+    def test_get_current_component(self):
+        summary = get_status_summary("SUCCESS", "NOT_STARTED", "NOT_STARTED")
+        self.assertEqual(upgrade_utils.get_current_component(
+            summary["component_status"]), "EDGE")
+        summary = get_status_summary("SUCCESS", "NOT_STARTED", "PAUSED")
+        self.assertEqual(upgrade_utils.get_current_component(
+            summary["component_status"]), "MP")
+        summary = get_status_summary("SUCCESS", "SUCCESS", "SUCCESS")
+        self.assertIsNone(upgrade_utils.get_current_component(
+            summary["component_status"]))
+
+    def test_upgrade_progress(self):
+        progress = upgrade_utils.UpgradeProgress()
+
+        def get_group_info(group_id, status, percent_complete):
+            return {"group": {"id": group_id, "type": "HOST",
+                              "upgrade_unit_count": 2},
+                    "status": status, "percent_complete": percent_complete}
+
+        progress.update_components(
+            [{"component_type": "HOST", "status": "IN_PROGRESS"}], 0)
+        self.assertEqual(progress.get_changed_groups(
+            [get_group_info("g1", "IN_PROGRESS", 0),
+             get_group_info("g2", "NOT_STARTED", 0),
+             get_group_info("g3", "SUCCESS", 100)], 0), ["g1"])
+        progress.update_units("g1", [{"id": "u1", "status": "IN_PROGRESS"},
+                                     {"id": "u2", "status": "NOT_STARTED"}],
+                              0)
+
+        self.assertEqual(progress.get_changed_groups(
+            [get_group_info("g1", "IN_PROGRESS", 0),
+             get_group_info("g2", "NOT_STARTED", 0),
+             get_group_info("g3", "SUCCESS", 100)], 600), [])
+        self.assertEqual(progress.get_changed_groups(
+            [get_group_info("g1", "IN_PROGRESS", 50),
+             get_group_info("g2", "NOT_STARTED", 0),
+             get_group_info("g3", "SUCCESS", 100)], 1800), ["g1"])
+        progress.update_units("g1", [{"id": "u1", "status": "SUCCESS"},
+                                     {"id": "u2", "status": "IN_PROGRESS"}],
+                              1800)
+
+        summary = progress.get_summary(1800)
+        host = summary["components"]["HOST"]
+        self.assertEqual(host["units"], 6)
+        self.assertEqual(host["done"], 3)
+        self.assertEqual(host["mean_unit_duration"], 1800)
+        self.assertEqual(host["throughput"], 2.0)
+        self.assertEqual(host["eta"], 5400)
+        self.assertEqual(summary["eta"], 5400)
+
+        restored = upgrade_utils.UpgradeProgress(progress.state)
+        self.assertEqual(restored.get_summary(1800), summary)
+
+    def test_plan_upgrade_groups(self):
+        hosts = [{"id": "h%d" % index, "display_name": "host-%d" % index}
+                 for index in range(5)]
+
+        groups, skipped_clusters = upgrade_utils.plan_upgrade_groups(
+            "HOST", {"cluster-a": hosts, "cluster-b": hosts[:2]},
+            {"cluster-a": 2, "cluster-b": 2}, "planned-")
+
+        self.assertEqual([(group["display_name"], group["parallel"],
+                           [unit["id"] for unit in group["upgrade_units"]])
+                          for group in groups],
+                         [("planned-cluster-a-1", False, ["h0", "h2", "h4"]),
+                          ("planned-cluster-a-2", False, ["h1", "h3"]),
+                          ("planned-cluster-b-1", True, ["h0", "h1"])])
+        self.assertEqual(skipped_clusters, [])
+
+        # An edge cluster of one edge that must stay up is skipped.
+        groups, skipped_clusters = upgrade_utils.plan_upgrade_groups(
+            "EDGE", {"edge-cluster-a": hosts[:2], "edge-cluster-b": hosts[:1]},
+            {"edge-cluster-a": 1, "edge-cluster-b": 0})
+
+        self.assertEqual([group["display_name"] for group in groups],
+                         ["edge-cluster-a-1"])
+        self.assertEqual(skipped_clusters, ["edge-cluster-b"])
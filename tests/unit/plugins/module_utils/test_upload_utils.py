@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause OR GPL-3.0-only
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING,
+# BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import hashlib
+import os
+import socket
+import tempfile
+import unittest
+
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.request import Request, urlopen
+
+import ansible_collections.vmware.ansible_for_nsxt.plugins.module_utils.upload_utils as upload_utils
+
+
+class UploadUtilsTestCase(unittest.TestCase):
+    def setUp(self):
+        fd, self.file_path = tempfile.mkstemp(suffix='.mub')
+        self.content = os.urandom(10000)
+        with os.fdopen(fd, 'wb') as mub_file:
+            mub_file.write(self.content)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def test_multipart_file_stream_body(self):
+        stream = upload_utils.MultipartFileStream(self.file_path)
+        body = stream.read()
+        boundary = stream.content_type.split('boundary=')[1]
+
+        self.assertEqual(len(body), stream.content_length)
+        self.assertEqual(stream.get_headers()['Content-Length'],
+                         str(len(body)))
+        self.assertTrue(body.startswith(('--%s\r\n' % boundary).encode()))
+        self.assertIn(('filename="%s"' % os.path.basename(self.file_path))
+                      .encode(), body)
+        self.assertIn(b'\r\n\r\n' + self.content + b'\r\n', body)
+        self.assertTrue(body.endswith(('\r\n--%s--\r\n' % boundary).encode()))
+        self.assertEqual(stream.read(), b'')
+
+    def test_multipart_file_stream_chunked_reads(self):
+        stream = upload_utils.MultipartFileStream(self.file_path,
+                                                  chunk_size=1000)
+        self.assertIsNone(stream.sha256)
+
+        pieces = []
+        while True:
+            data = stream.read(333)
+            if not data:
+                break
+            self.assertLessEqual(len(data), 333)
+            pieces.append(data)
+
+        self.assertEqual(len(b''.join(pieces)), stream.content_length)
+        statistics = stream.get_statistics()
+        self.assertEqual(statistics['bytes'], len(self.content))
+        self.assertEqual(statistics['sha256'],
+                         hashlib.sha256(self.content).hexdigest())
+        self.assertIsNotNone(statistics['elapsed'])
+
+    def test_get_byte_range(self):
+        self.assertIsNone(upload_utils.get_byte_range(None, 100))
+        self.assertIsNone(upload_utils.get_byte_range('bytes=a-b', 100))
+        self.assertIsNone(upload_utils.get_byte_range('bytes=0-1,5-6', 100))
+        self.assertEqual(upload_utils.get_byte_range('bytes=10-', 100),
+                         (10, 99))
+        self.assertEqual(upload_utils.get_byte_range('bytes=10-19', 100),
+                         (10, 19))
+        self.assertEqual(upload_utils.get_byte_range('bytes=90-200', 100),
+                         (90, 99))
+        self.assertEqual(upload_utils.get_byte_range('bytes=-30', 100),
+                         (70, 99))
+        self.assertRaises(ValueError, upload_utils.get_byte_range,
+                          'bytes=100-', 100)
+
+    def test_bundle_file_server_resumes(self):
+        bundle_server = upload_utils.BundleFileServer(self.file_path,
+                                                      '127.0.0.1')
+        bundle_server.start()
+        try:
+            self.assertEqual(urlopen(bundle_server.url).read(), self.content)
+            response = urlopen(Request(bundle_server.url,
+                                       headers={'Range': 'bytes=4000-'}))
+            self.assertEqual(response.getcode(), 206)
+            self.assertEqual(response.headers['Content-Range'],
+                             'bytes 4000-9999/10000')
+            self.assertEqual(response.read(), self.content[4000:])
+            try:
+                urlopen(bundle_server.url + '.other')
+                self.fail('Only the bundle is served')
+            except HTTPError as err:
+                self.assertEqual(err.code, 404)
+        finally:
+            bundle_server.stop()
+
+        statistics = bundle_server.get_statistics()
+        self.assertEqual(statistics['requests'], 2)
+        self.assertEqual(statistics['resumed_requests'], 1)
+        self.assertEqual(statistics['bytes_served'], 16000)
+
+    @unittest.skipUnless(socket.has_ipv6, 'IPv6 is not available')
+    def test_bundle_file_server_binds_ipv6(self):
+        try:
+            bundle_server = upload_utils.BundleFileServer(self.file_path, '::1')
+        except socket.error:
+            self.skipTest('IPv6 loopback is not available')
+        self.assertEqual(bundle_server._server.address_family, socket.AF_INET6)
+        self.assertTrue(bundle_server.url.startswith('http://[::1]:'))
+        bundle_server.start()
+        try:
+            self.assertEqual(urlopen(bundle_server.url).read(), self.content)
+        finally:
+            bundle_server.stop()